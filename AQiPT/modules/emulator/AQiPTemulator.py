@@ -8,7 +8,9 @@
 
 #libs
 import numpy as np
+import scipy.sparse as sp
 import qutip as qt
+from qutip.cy.spconvert import dense1D_to_fastcsr_ket
 
 import matplotlib.pyplot as plt
 import matplotlib
@@ -20,6 +22,7 @@ from typing import Iterator, List
 import copy
 
 import datetime
+import logging
 
 # import warnings
 # warnings.filterwarnings('ignore')
@@ -30,6 +33,383 @@ from tqdm import tqdm
 HZ_2_MHZ = 1/1e6;
 HZ_2_KHZ = 1/1e3;
 
+logger = logging.getLogger(__name__)
+
+#####################################################################################################
+#solver strategy
+#####################################################################################################
+
+SOLVERS = {'auto': None, 'QuTiP-QME': 'mesolve', 'QuTiP-SE': 'sesolve', 'QuTiP-propagator': 'propagator', 'AQiPT-piecewise': 'piecewise'};
+
+PIECEWISE_MAX_DIM = 1024; #largest Hilbert space for 'auto' to use the piecewise engine (dense diagonalization)
+PIECEWISE_CHUNK = 2**14; #samples evaluated at once by the piecewise engine
+
+def activeCollapseOps(cops):
+    '''
+        Collapse operators that contribute to the dynamics
+
+        Return the list of collapse operators in cops (None, a single Qobj or a list) that are not identically
+        zero, e.g. the ones built from a dissipator with rate 0 are dropped. Time-dependent collapse operators
+        are always kept.
+    '''
+    if cops is None:
+        return [];
+    if isinstance(cops, qt.Qobj):
+        cops = [cops];
+
+    return [cop for cop in cops if not isinstance(cop, qt.Qobj) or cop.data.count_nonzero()>0];
+
+def conjugateCoefficient(coeff):
+    '''
+        Coefficient of the Hermitian conjugate term
+
+        Return the complex conjugate of a QuTiP coefficient: an array, a number, a string or a function f(t, args).
+        Coefficient objects with their own conjugate() method (e.g. closed-form pulses) return it.
+    '''
+    if isinstance(coeff, np.ndarray) or np.isscalar(coeff) and not isinstance(coeff, str):
+        return np.conjugate(coeff);
+    if isinstance(coeff, str):
+        return 'conj('+coeff+')';
+    if hasattr(coeff, 'conjugate'):
+        return coeff.conjugate();
+    return lambda t, args=None: np.conj(coeff(t, args));
+
+def isPiecewiseCoefficient(coeff):
+    '''
+        Return True for closed-form coefficients that are constant between their breakpoints (e.g. square pulses),
+        i.e., with sample(times), breakpoints() and a true is_piecewise_constant attribute.
+    '''
+    return getattr(coeff, 'is_piecewise_constant', False) and hasattr(coeff, 'sample') and hasattr(coeff, 'breakpoints');
+
+def _hamiltonianTerms(H):
+    #constant part (Qobj or None) and [operator, coefficient] time-dependent terms of a Qobj, QobjEvo or list
+    if isinstance(H, qt.Qobj):
+        _H0, _items = H, [];
+    elif isinstance(H, qt.QobjEvo):
+        _H0, _items = H.cte, [[element.qobj, element.coeff] for element in H.ops];
+    else:
+        _H0, _items = None, [];
+        for term in H:
+            if isinstance(term, qt.Qobj):
+                _H0 = term if _H0 is None else _H0 + term;
+            else:
+                _items.append(list(term));
+    return _H0, _items;
+
+def piecewiseSegments(H, times):
+    '''
+        Piecewise-constant structure of a Hamiltonian
+
+        Return the constant part (Qobj or None), the operators, the coefficients (array of shape (terms, grid)),
+        the grid indices where a constant segment starts (plus len(grid) at the end), the time grid and the
+        indices of times in the grid, for H given as a Qobj, a QobjEvo or a list of Qobj and [Qobj, coefficient].
+        Return None if a coefficient is neither an array sampled in times nor a closed-form coefficient with
+        sample(times) and breakpoints() methods.
+
+        The grid is times plus the breakpoints (pulse edges) of the closed-form coefficients, which take their
+        value at the middle of each grid interval, so closed-form square pulses (isPiecewiseCoefficient) are
+        exact. The value of an array sample is held until the next sample, which only approximates the pulse
+        (QuTiP interpolates the arrays instead), so arrays are only propagated this way on request.
+    '''
+    _H0, _items = _hamiltonianTerms(H);
+
+    _breakpoints = [times];
+    for _op, _coeff in _items:
+        if hasattr(_coeff, 'sample') and hasattr(_coeff, 'breakpoints'):
+            _breakpoints.append(np.asarray(_coeff.breakpoints(), dtype=float));
+        elif not isinstance(_coeff, np.ndarray) or _coeff.shape!=(len(times),):
+            return None;
+
+    _grid = np.unique(np.concatenate(_breakpoints));
+    _grid = _grid[(_grid>=times[0]) & (_grid<=times[-1])];
+    _output = np.searchsorted(_grid, times);
+
+    #value of every coefficient over [grid[k], grid[k+1]), the last column is never used
+    _hold = np.searchsorted(times, _grid, side='right') - 1;
+    _mid = np.append((_grid[:-1]+_grid[1:])/2, _grid[-1]);
+    _coeffs = np.array([_coeff.sample(_mid) if hasattr(_coeff, 'breakpoints') else _coeff[_hold] for _op, _coeff in _items]);
+    _coeffs = _coeffs.reshape(len(_items), len(_grid));
+    _ops = [_op for _op, _coeff in _items];
+
+    _edges = np.flatnonzero(np.any(_coeffs[:, 1:-1]!=_coeffs[:, :-2], axis=0)) + 1;
+    _bounds = np.concatenate([[0], _edges, [len(_grid)]]);
+
+    return _H0, _ops, _coeffs, _bounds, _grid, _output
+
+def solverStrategy(cops, psi0, solver='auto', H=None, times=None, piecewise=False):
+    '''
+        Select the solver engine
+
+        Return the engine ('piecewise', 'sesolve', 'mesolve' or 'propagator') and the reason of the choice for
+        the given collapse operators, initial state and Hamiltonian. With solver='auto' the cheapest correct
+        engine is used: the exact piecewise-constant propagation when every coefficient is a closed-form
+        piecewise-constant one (isPiecewiseCoefficient, e.g. square pulses), the Schrödinger equation for pure
+        states without dissipation, and the master equation otherwise. Sampled arrays are never propagated
+        piecewise by 'auto': piecewise=True tells that they are piecewise constant and holds every sample
+        until the next one (see piecewiseSegments).
+
+            QuTiP-QME : force the Quantum master equation solver by QuTiP
+            QuTiP-SE : force the Schrödinger equation solver by QuTiP (no dissipation)
+            QuTiP-propagator : unitary propagator U(t) by QuTiP (no dissipation)
+            AQiPT-piecewise : exact propagation of each constant segment of the Hamiltonian (no dissipation)
+    '''
+    if solver not in SOLVERS:
+        raise ValueError('Unknown solver \''+str(solver)+'\', use one of '+str(list(SOLVERS)));
+
+    _cops = activeCollapseOps(cops);
+    _pure = psi0.isket or (psi0.isoper and abs((psi0*psi0).tr()-1)<1e-12);
+
+    if solver=='auto':
+        if len(_cops)>0:
+            return 'mesolve', str(len(_cops))+' non-zero collapse operator(s)';
+        if not _pure:
+            return 'mesolve', 'mixed initial state';
+
+        if H is not None and psi0.shape[0]<=PIECEWISE_MAX_DIM:
+            _closedForm = all(isPiecewiseCoefficient(_coeff) for _op, _coeff in _hamiltonianTerms(H)[1]);
+            _segments = piecewiseSegments(H, times) if piecewise or _closedForm else None;
+            if _segments is not None:
+                return 'piecewise', 'piecewise-constant Hamiltonian, '+str(len(_segments[3])-1)+' segment(s)';
+        return 'sesolve', 'unitary dynamics of a pure initial state';
+
+    engine = SOLVERS[solver];
+    if engine!='mesolve' and len(_cops)>0:
+        raise ValueError(solver+' needs unitary dynamics, got '+str(len(_cops))+' non-zero collapse operator(s)');
+    if engine!='mesolve' and not _pure:
+        raise ValueError(solver+' needs a pure initial state');
+    if engine=='piecewise' and piecewiseSegments(H, times) is None:
+        raise ValueError(solver+' needs a Hamiltonian with coefficients sampled in times');
+
+    return engine, 'requested '+solver;
+
+def _pureKet(psi0):
+    #state vector of a pure density matrix (eigenvector of eigenvalue 1)
+    if psi0.isket:
+        return psi0;
+    _vals, _vecs = psi0.eigenstates();
+    _ket = _vecs[int(np.argmax(_vals))];
+    _ket.dims = [psi0.dims[0], [1]*len(psi0.dims[0])];
+    return _ket;
+
+def _piecewiseSolve(H, ket, density_matrix, times, mops, options):
+    #exact evolution of each constant segment: H = V diag(w) V^-1, psi(t) = V exp(-i w (t-t_a)) V^-1 psi(t_a)
+    _H0, _ops, _coeffs, _bounds, _grid, _output = piecewiseSegments(H, times);
+    _dim = ket.shape[0];
+
+    _H0 = np.zeros((_dim, _dim), dtype=complex) if _H0 is None else _H0.full();
+    _ops = [_op.full() for _op in _ops];
+    _mops = [_mop.full() for _mop in mops];
+
+    _eigen = {}; #cached diagonalization of every distinct segment Hamiltonian
+    def segmentEigen(values):
+        _key = values.tobytes();
+        if _key not in _eigen:
+            _Hseg = _H0 + sum(value*_op for value, _op in zip(values, _ops));
+            if np.allclose(_Hseg, _Hseg.conj().T):
+                _w, _V = np.linalg.eigh(_Hseg);
+                _Vinv = _V.conj().T;
+            else:
+                _w, _V = np.linalg.eig(_Hseg);
+                _Vinv = np.linalg.inv(_V);
+            _eigen[_key] = (_w, _V, _Vinv);
+        return _eigen[_key]
+
+    _n = len(times);
+    _psi = ket.full().ravel();
+    _expect = [np.empty(_n, dtype=complex) for _mop in _mops];
+    _states = np.empty((_n, _dim), dtype=complex) if options.store_states or len(mops)==0 else None;
+
+    #row of the output of every grid point, -1 for the breakpoints that are not in times
+    _row = np.full(len(_grid), -1);
+    _row[_output] = np.arange(_n);
+
+    def store(start, block):
+        _rows = _row[start:start+len(block)];
+        _keep = _rows>=0;
+        block, _rows = block[_keep], _rows[_keep];
+        for _e, _mop in zip(_expect, _mops):
+            _e[_rows] = np.sum(block.conj()*(block @ _mop.T), axis=1);
+        if _states is not None:
+            _states[_rows] = block;
+
+    store(0, _psi[None, :]);
+    for _a, _b in zip(_bounds[:-1], _bounds[1:]):
+        _w, _V, _Vinv = segmentEigen(_coeffs[:, _a]);
+        _c = _Vinv @ _psi;
+        _last = min(_b, len(_grid)-1);
+        for _start in range(_a+1, _last+1, PIECEWISE_CHUNK):
+            _stop = min(_start+PIECEWISE_CHUNK, _last+1);
+            _block = (np.exp(-1j*np.outer(_grid[_start:_stop]-_grid[_a], _w))*_c) @ _V.T;
+            store(_start, _block);
+            _psi = _block[-1];
+
+    simRes = qt.solver.Result();
+    simRes.solver = 'piecewise';
+    simRes.times = times;
+    simRes.expect = [np.real(_e) if mop.isherm else _e for _e, mop in zip(_expect, mops)];
+    simRes.num_expect = len(mops);
+    if _states is not None:
+        #same fast construction as the states of qt.sesolve
+        _kets = [qt.Qobj(dense1D_to_fastcsr_ket(state), dims=ket.dims, fast='mc') for state in _states];
+        simRes.states = [qt.ket2dm(state) for state in _kets] if density_matrix else _kets;
+    if options.store_final_state:
+        _final = qt.Qobj(_psi[:, None], dims=ket.dims);
+        simRes.final_state = qt.ket2dm(_final) if density_matrix else _final;
+
+    return simRes
+
+def solveDynamics(H, psi0, times, cops=None, mops=[], options=None, solver='auto', name='', piecewise=False):
+    '''
+        Solve the dynamics with the engine selected by solverStrategy()
+
+        Return the Result object of QuTiP and the list of propagators U(t) (None unless the 'QuTiP-propagator'
+        solver is used). The states of the result keep the type of psi0: a density matrix initial state
+        solved with the Schrödinger equation gives density matrices.
+    '''
+    engine, reason = solverStrategy(cops, psi0, solver, H, times, piecewise);
+    logger.info('%s: solving with %s (%s)', name, engine, reason);
+
+    if options is None:
+        options = qt.Options();
+
+    if engine=='mesolve':
+        #a requested master equation keeps every collapse operator, even the zero ones
+        _cops = activeCollapseOps(cops) if solver=='auto' else ([cops] if isinstance(cops, qt.Qobj) else cops or []);
+        return qt.mesolve(H, psi0, times, c_ops=_cops, e_ops=mops, options=options), None;
+
+    _ket = _pureKet(psi0);
+
+    if engine=='piecewise':
+        return _piecewiseSolve(H, _ket, psi0.isoper, times, mops, options), None;
+
+    if engine=='sesolve':
+        simRes = qt.sesolve(H, _ket, times, e_ops=mops, options=options);
+        if psi0.isoper:
+            simRes.states = [qt.ket2dm(state) for state in simRes.states];
+        return simRes, None;
+
+    #unitary propagator: evolve the identity and apply it to the initial state
+    _options = copy.copy(options);
+    _options.store_states = True;
+    _iden = qt.qeye(_ket.dims[0]);
+    propagators = qt.sesolve(H, _iden, times, e_ops=[], options=_options).states;
+
+    simRes = qt.solver.Result();
+    simRes.solver = 'propagator';
+    simRes.times = times;
+    _states = [U*_ket for U in propagators];
+    if psi0.isoper:
+        _states = [qt.ket2dm(state) for state in _states];
+    simRes.expect = [np.real(qt.expect(mop, _states)) if mop.isherm else qt.expect(mop, _states) for mop in mops];
+    simRes.num_expect = len(mops);
+    if options.store_states or len(mops)==0:
+        simRes.states = _states;
+    if options.store_final_state:
+        simRes.final_state = _states[-1];
+
+    return simRes, propagators;
+
+#####################################################################################################
+#Hamiltonian term folding
+#####################################################################################################
+
+def isRealCoefficient(coeff):
+    '''
+        Return True if the coefficient (array, number or coefficient object with an is_real attribute) is known
+        to be real-valued.
+    '''
+    if isinstance(coeff, np.ndarray):
+        return np.isrealobj(coeff) or not np.any(coeff.imag);
+    if np.isscalar(coeff) and not isinstance(coeff, str):
+        return np.imag(coeff)==0;
+    return getattr(coeff, 'is_real', False);
+
+_COEFFICIENT_PARTS = {'real': np.real, 'imag': np.imag, 'full': lambda value: value};
+
+def _doubleArray(coeff):
+    #array coefficients are interpolated by QuTiP in double precision, single precision pulses are upcast here (term by term)
+    return np.asarray(coeff, dtype=np.result_type(coeff, np.float64));
+
+class foldedCoefficient:
+    '''
+        Coefficient of a merged Hamiltonian channel
+
+        Sum of scale*part(f(t, args)) of callable coefficients f, where part is 'real', 'imag' or 'full'. It is a
+        QuTiP function coefficient, and it can be sampled by the piecewise engine (sample() and breakpoints())
+        when all of its coefficients can.
+    '''
+    def __init__(self, parts):
+        self.parts = parts;
+        self.is_real = all(part!='full' or isRealCoefficient(coeff) for scale, coeff, part in parts) and all(np.imag(scale)==0 for scale, coeff, part in parts);
+        if all(hasattr(coeff, 'sample') and hasattr(coeff, 'breakpoints') for scale, coeff, part in parts):
+            self.sample = self._sample;
+            self.breakpoints = self._breakpoints;
+        self.is_piecewise_constant = all(isPiecewiseCoefficient(coeff) for scale, coeff, part in parts);
+
+    def __call__(self, t, args=None):
+        #called at every solver step: plain attributes instead of the numpy functions
+        _value = 0;
+        for scale, coeff, part in self.parts:
+            _part = coeff(t, args);
+            _value += scale*(_part.real if part=='real' else _part.imag if part=='imag' else _part);
+        return _value;
+
+    def _sample(self, times):
+        return sum(scale*_COEFFICIENT_PARTS[part](coeff.sample(times)) for scale, coeff, part in self.parts);
+
+    def _breakpoints(self):
+        return np.unique(np.concatenate([np.asarray(coeff.breakpoints(), dtype=float) for scale, coeff, part in self.parts]));
+
+class hamiltonianChannels:
+    '''
+        Accumulator of the terms of a time-dependent Hamiltonian
+
+        Every term is an operator times scale*part(coefficient), with part 'real', 'imag' or 'full'. Terms added
+        with the same label (the same operator) are merged in a single channel: array coefficients are summed in
+        one array and callables in a foldedCoefficient(). Other coefficients (e.g. strings) are never merged.
+
+        A coupling op*f plus its Hermitian conjugate op.dag()*conj(f) is folded (addHermitianPair) into the
+        Hermitian operators X = op + op.dag() and Y = i(op - op.dag()) with the real channels Re(f) and Im(f),
+        and Y is skipped when f is real.
+    '''
+    def __init__(self):
+        self._channels = {};
+
+    def add(self, label, operator, scale, coeff, part='full'):
+        if isinstance(coeff, np.ndarray):
+            _kind = 'array';
+        elif callable(coeff):
+            _kind = 'function';
+        else:
+            _kind = ('other', len(self._channels)); #never merged
+        _channel = self._channels.setdefault((label, _kind), [operator, []]);
+        _channel[1].append((scale, coeff, part));
+
+    def addHermitianPair(self, label, op, scale, coeff):
+        if not (isinstance(coeff, np.ndarray) or callable(coeff)):
+            self.add(label, op, scale, coeff);
+            self.add(('dag', label), op.dag(), scale, conjugateCoefficient(coeff));
+            return;
+        self.add(('X', label), op + op.dag(), scale, coeff, 'real');
+        if not isRealCoefficient(coeff):
+            self.add(('Y', label), 1j*(op - op.dag()), scale, coeff, 'imag');
+
+    def terms(self):
+        '''
+            Return the list of [operator, coefficient] of the merged channels.
+        '''
+        _terms = [];
+        for (label, _kind), (_operator, _parts) in self._channels.items():
+            scale, coeff, part = _parts[0];
+            if len(_parts)==1 and (_kind=='array' or part=='full' or part=='real' and isRealCoefficient(coeff)):
+                #a single term keeps its coefficient (a view for arrays), the scale goes to the operator
+                _terms.append([scale*_operator, _doubleArray(_COEFFICIENT_PARTS[part](coeff)) if _kind=='array' else coeff]);
+            elif _kind=='array':
+                _terms.append([_operator, sum(scale*_COEFFICIENT_PARTS[part](_doubleArray(coeff)) for scale, coeff, part in _parts)]);
+            else:
+                _terms.append([_operator, foldedCoefficient(_parts)]);
+        return _terms;
+
 #####################################################################################################
 #atomicModel AQiPT class
 #####################################################################################################
@@ -322,17 +702,24 @@ class atomicModel:
         self.simOpts = simOpt;
         self.simRes = None;
         self.simRes_history = [];
+        self.propagators = None; #propagators U(t) of the 'QuTiP-propagator' solver
         
         self.__mode = 'free';
 
     
-    def playSim(self, mode='free', psi0='density-matrix'):
+    def playSim(self, mode='free', psi0='density-matrix', solver='auto', piecewise=False):
         '''
             Execute simulation
 
             Play the simulation of the dynamics of the atomicModel() object and store the results in the attribute simRes. Using the solver:
 
+                auto : cheapest correct solver of QuTiP, see solverStrategy()
                 QuTiP-QME : Quantum master equation solver by QuTiP
+                QuTiP-SE : Schrödinger equation solver by QuTiP
+                QuTiP-propagator : unitary propagator by QuTiP, stored in the attribute propagators
+                AQiPT-piecewise : exact propagation of each constant segment of the pulses
+
+            piecewise=True tells that the pulses are piecewise constant (e.g. square pulses), see solverStrategy().
 
             with two possible modes:
 
@@ -342,24 +729,18 @@ class atomicModel:
 
         if self.__mode=='free':
             if psi0=='state-vector':
-                self.simRes = qt.mesolve(self.Hamiltonian, self.initState, self.times, c_ops=self.cops, e_ops=self.mops, options=self.simOpts);
+                self.simRes, self.propagators = solveDynamics(self.Hamiltonian, self.initState, self.times, self.cops, self.mops, self.simOpts, solver, self._name, piecewise);
                 self.simRes_history.append({str(datetime.datetime.now()) : self.simRes});
                 print('Solving for \'free\' state-vector initial state.')
 
             elif psi0=='density-matrix':
-                self.simRes = qt.mesolve(self.Hamiltonian, qt.ket2dm(self.initState), self.times, c_ops=self.cops, e_ops=self.mops, options=self.simOpts);
+                self.simRes, self.propagators = solveDynamics(self.Hamiltonian, qt.ket2dm(self.initState), self.times, self.cops, self.mops, self.simOpts, solver, self._name, piecewise);
                 self.simRes_history.append({str(datetime.datetime.now()) : self.simRes});
                 print('Solving for \'free\' density-matrix initial state')
 
         elif self.__mode=='control':
-
-            if self.cops==None:
-                self.simRes = qt.mesolve(self.tHamiltonian, self.initState, self.times, e_ops=self.mops, options=self.simOpts);
-                self.simRes_history.append({str(datetime.datetime.now()) : self.simRes});
-
-            else:
-                self.simRes = qt.mesolve(self.tHamiltonian, self.initState, self.times, c_ops=self.cops, e_ops=self.mops, options=self.simOpts);
-                self.simRes_history.append({str(datetime.datetime.now()) : self.simRes});
+            self.simRes, self.propagators = solveDynamics(self.tHamiltonian, self.initState, self.times, self.cops, self.mops, self.simOpts, solver, self._name, piecewise);
+            self.simRes_history.append({str(datetime.datetime.now()) : self.simRes});
 
     def add_ZeemanSplitting(self, values_lst:list=None, atom=None, Bfield=None, state_lst=None, buildHamiltonian=False, buildTHamiltonian=False, printON=False):
     
@@ -419,24 +800,22 @@ class atomicModel:
         _HAQiPTpulses = [];
         
         if self.internalInteraction == None:
+            #couplings folded with their Hermitian conjugate and terms of the same operator merged
+            _channels = hamiltonianChannels();
             for element in range(len(self.dynParams['couplings'])):
-                
-                # _HStruct = 0.5*self.dynParams['couplings']['Coupling'+str(element)][1] * (self._ops[(self.dynParams['couplings']['Coupling'+str(element)][0])[0]*self.Nrlevels + (self.dynParams['couplings']['Coupling'+str(element)][0])[1]] + self._ops[(self.dynParams['couplings']['Coupling'+str(element)][0])[0]*self.Nrlevels + (self.dynParams['couplings']['Coupling'+str(element)][0])[1]].dag());
-                _HStruct = 0.5*self.dynParams['couplings']['Coupling'+str(element)][1] * (self._ops[(self.dynParams['couplings']['Coupling'+str(element)][0])[0]*self.Nrlevels + (self.dynParams['couplings']['Coupling'+str(element)][0])[1]] );
-                _HStruct_dag = 0.5*self.dynParams['couplings']['Coupling'+str(element)][1] *self._ops[(self.dynParams['couplings']['Coupling'+str(element)][0])[0]*self.Nrlevels + (self.dynParams['couplings']['Coupling'+str(element)][0])[1]].dag();
-                _HtDependency = self.dynParams['couplings']['Coupling'+str(element)][2];
-                _HtDependency_dag = np.conjugate(self.dynParams['couplings']['Coupling'+str(element)][2]);
-                _HAQiPTpulses.append(_HtDependency);
-                _HAQiPTpulses.append(_HtDependency_dag);
-                _HQobjEVO.append([_HStruct, _HtDependency]);
-                _HQobjEVO.append([_HStruct_dag, _HtDependency_dag]);
-                self._lstHamiltonian.append(_HStruct);
-                self._lstHamiltonian.append(_HStruct_dag);
+
+                _pair, _omega, _HtDependency = self.dynParams['couplings']['Coupling'+str(element)];
+                _idx = _pair[0]*self.Nrlevels + _pair[1];
+                _channels.addHermitianPair(_idx, self._ops[_idx], 0.5*_omega, _HtDependency);
             
             for element in range(len(self.dynParams['detunings'])):
                 
-                _HStruct = 0.5*self.dynParams['detunings']['Detuning'+str(element)][1]*(self._ops[(self.dynParams['detunings']['Detuning'+str(element)][0])[0]*self.Nrlevels + (self.dynParams['detunings']['Detuning'+str(element)][0])[1]] );
-                _HtDependency = self.dynParams['detunings']['Detuning'+str(element)][2];
+                _pair, _omega, _HtDependency = self.dynParams['detunings']['Detuning'+str(element)];
+                _idx = _pair[0]*self.Nrlevels + _pair[1];
+                _channels.add(('D', _idx), self._ops[_idx], 0.5*_omega, _HtDependency);
+
+            self._lstHamiltonian = [];
+            for _HStruct, _HtDependency in _channels.terms():
                 _HAQiPTpulses.append(_HtDependency);
                 _HQobjEVO.append([_HStruct, _HtDependency]);
                 self._lstHamiltonian.append(_HStruct);
@@ -901,6 +1280,26 @@ def eliminate_duplicates(lst):
             unique_list.append(item)
     return unique_list
 
+#strides of the levels of each atom in the (row-major) tensor product basis of dims
+def _basisStrides(dims):
+    _strides = np.ones(len(dims), dtype=np.int64);
+    for k in range(len(dims)-2, -1, -1):
+        _strides[k] = _strides[k+1]*dims[k+1];
+    return _strides
+
+#index in the tensor product basis of dims of the product state with the given levels, i.e., qt.tensor([qt.basis(d, l) for d, l in zip(dims, levels)])
+def basisIndex(levels, dims):
+    return int(np.dot(np.asarray(levels, dtype=np.int64), _basisStrides(dims)))
+
+#indices of the product states with the levels of the atoms in fixed and any level of the rest of atoms, in the order of itertools.product
+def spectatorIndices(levels, dims, fixed):
+    _strides = _basisStrides(dims);
+    _idx = np.array([sum(int(levels[k])*_strides[k] for k in fixed)], dtype=np.int64);
+    for k in range(len(dims)):
+        if k not in fixed:
+            _idx = (_idx[:,None] + np.arange(dims[k], dtype=np.int64)*_strides[k]).ravel();
+    return _idx
+
 class atomicQRegister:
     
     """
@@ -1137,6 +1536,7 @@ class atomicQRegister:
         self._homogeneous = homogeneous;
         self.simOpts = None; #qt.Options(nsteps=500, rtol=1e-7, max_step=10e-1);
         self.simRes = None;
+        self.propagators = None; #propagators U(t) of the 'QuTiP-propagator' solver
         self.__mode = 'free';
 
         
@@ -1261,25 +1661,26 @@ class atomicQRegister:
         # Show the plot
         fig.show()
 
-    def playSim(self, mode='free', solver='QuTiP-QME'):
+    def playSim(self, mode='free', solver='auto', piecewise=False):
         '''
             Play the simulation of the dynamics of the atomicQRegister() object and store the results in the attribute simRes. Using the solver:
             
+                auto : cheapest correct solver of QuTiP, see solverStrategy()
                 QuTiP-QME : Quantum master equation solver by QuTiP
+                QuTiP-SE : Schrödinger equation solver by QuTiP
+                QuTiP-propagator : unitary propagator by QuTiP, stored in the attribute propagators
+                AQiPT-piecewise : exact propagation of each constant segment of the pulses
+
+            piecewise=True tells that the pulses are piecewise constant (e.g. square pulses), see solverStrategy().
             
         '''
         
-        if solver=='QuTiP-QME':
+        if solver in SOLVERS:
             if mode=='free':
-                self.simRes = qt.mesolve(self.nHamiltonian, qt.ket2dm(self.initnState), self.times, c_ops=self.ncops, e_ops=self.nmops, options=self.simOpts)
+                self.simRes, self.propagators = solveDynamics(self.nHamiltonian, qt.ket2dm(self.initnState), self.times, self.ncops, self.nmops, self.simOpts, solver, self._name, piecewise);
 
             elif mode=='control':
-                # self.simRes = qt.mesolve(self.tnHamiltonian, qt.ket2dm(self.initnState), self.times, c_ops=self.ncops, e_ops=self.nmops, options=self.simOpts)
-
-                if self.ncops==None:
-                    self.simRes = qt.mesolve(self.tnHamiltonian, self.initnState, self.times, e_ops=self.nmops, options=self.simOpts);
-                else:
-                    self.simRes = qt.mesolve(self.tnHamiltonian, self.initnState, self.times, c_ops=self.ncops, e_ops=self.nmops, options=self.simOpts);
+                self.simRes, self.propagators = solveDynamics(self.tnHamiltonian, self.initnState, self.times, self.ncops, self.nmops, self.simOpts, solver, self._name, piecewise);
         if solver=='QuantumOptics-QME':
             pass
 
@@ -1296,6 +1697,10 @@ class atomicQRegister:
         '''
             Build the basis (states and operators) for the interactions basis in the connectivity map, that represent the 
             interactions between Rydberg states. 
+
+            States are lists with the level of each atom and operators are given by their indices in the product basis: the 
+            index of |psi><psi| for the vdW and self-interaction terms, and the (rows, columns) indices of |psi><psi_swap| 
+            for the dipole-dipole terms (summed over the levels of the remaining atoms for more than 2 registers).
         '''
 
         _pairInteraction_idx = [];
@@ -1312,43 +1717,38 @@ class atomicQRegister:
             #build basis accordingly with the available interactions
             for k in range(len(self._HSlist)): #qbit index over the first rydberg             
 
-                _PSI = _psi; #[qt.basis(atMod.Nrlevels, 0) for atMod in self._AMs]; #wavefunction structure of the multi-atomicModel
+                _PSI = _psi; #levels of the multi-atomicModel
 
                 if ri in self._HSlist[k]: #check if ri is in list of k-th qbit interacting state levels
 
-                    _ri_ket = qt.basis(self.lstNrlevels[k], self._AMslevels[k].index(ri-sum(self.lstNrlevels[:k])));
                     _ri_ket_idx = k;
-                    _PSI[k] = _ri_ket;
+                    _PSI[k] = self._AMslevels[k].index(ri-sum(self.lstNrlevels[:k]));
 
                     _idx_ij.append(_ri_ket_idx);
 
                     for m in range(k,len(self._HSlist)): #qbit index over the second rydberg
 
-                        _PSI_m = copy.deepcopy(_PSI); #wavefunction structure of the multi-atomicModel for m-th qubit state
+                        _PSI_m = list(_PSI); #levels of the multi-atomicModel for m-th qubit state
 
                         if k==m: #same bits of the register
 
                             if rj in self._HSlist[m]: #check if rj is in list of m-th qbit interacting state levels
 
-                                _rj_ket = qt.basis(self.lstNrlevels[m], self._AMslevels[m].index(rj-sum(self.lstNrlevels[:m])));
                                 _rj_ket_idx = m;
-                                _PSI_m[m] = _rj_ket;
+                                _PSI_m[m] = self._AMslevels[m].index(rj-sum(self.lstNrlevels[:m]));
 
                                 _interaction_sts.append(_PSI_m);
 
                                 _idx_ij.append(_rj_ket_idx);
                             
-                                _VIJ = qt.tensor(_PSI_m)*(qt.tensor(_PSI_m).dag());
-                                _VIJ.dims = [[self.Nrlevels],[self.Nrlevels]];
-                                _interaction_ops[2].append(_VIJ);
+                                _interaction_ops[2].append(basisIndex(_PSI_m, self.lstNrlevels));
                         
                         else: #different bits of the register
 
                             if rj in self._HSlist[m]: #check if rj is in list of m-th interacting state levels
 
-                                _rj_ket = qt.basis(self.lstNrlevels[m], self._AMslevels[m].index(rj-sum(self.lstNrlevels[:m])));
                                 _rj_ket_idx = m;
-                                _PSI_m[m] = _rj_ket;
+                                _PSI_m[m] = self._AMslevels[m].index(rj-sum(self.lstNrlevels[:m]));
 
                                 _interaction_sts.append(_PSI_m);
 
@@ -1360,42 +1760,21 @@ class atomicQRegister:
 
                                 if li==lj: #if li=lj check V_{vdW} 
 
-                                    _VIJ = qt.tensor(_PSI_m)*(qt.tensor(_PSI_m).dag());
-                                    _VIJ.dims = [[self.Nrlevels],[self.Nrlevels]];
-                                    _interaction_ops[0].append(_VIJ);
+                                    _interaction_ops[0].append(basisIndex(_PSI_m, self.lstNrlevels));
 
                                 else: #or V_{d-d} otherwise
 
+                                    #the swapped state is indexed with the swapped dimensions, as qt.tensor() of the swapped kets
+                                    _PSI_m_dag = _swapElements(list(_PSI_m), _ri_ket_idx, _rj_ket_idx);
+                                    _dims_dag = _swapElements(list(self.lstNrlevels), _ri_ket_idx, _rj_ket_idx);
+
                                     if self.NrQReg==2:
-                                        _PSI_m_dag = copy.deepcopy(_PSI_m)
-                                        _VIJ = qt.tensor(_PSI_m)*(qt.tensor(_swapElements(_PSI_m_dag, _ri_ket_idx, _rj_ket_idx)).dag());
-                                        _VIJ.dims = [[self.Nrlevels],[self.Nrlevels]];
-                                        _interaction_ops[1].append(_VIJ);
+                                        _VIJ = (np.array([basisIndex(_PSI_m, self.lstNrlevels)]), np.array([basisIndex(_PSI_m_dag, _dims_dag)]));
                                     else:
-                                        _combinations4C3 = eliminate_duplicates(generate_combinations(_PSI_m, _ri_ket_idx, _rj_ket_idx, self._AMslevels_ket));
-                                        self._combinationsC3 = _combinations4C3.copy();
-                                        _VIJ=0;
-                                        for combi in _combinations4C3:
-                                            _PPSI_m =copy.deepcopy(combi);
-                                            _PPSI_m_dag = _swapElements(copy.deepcopy(_PPSI_m), _rj_ket_idx, _ri_ket_idx);
-                                            _vij = qt.tensor(_PPSI_m)*(qt.tensor(_PPSI_m_dag).dag());
-                                            _vij.dims = [[self.Nrlevels],[self.Nrlevels]];
-                                            _VIJ+=_vij;
+                                        _rows = spectatorIndices(_PSI_m, self.lstNrlevels, (_ri_ket_idx, _rj_ket_idx));
+                                        self._combinationsC3 = _rows;
+                                        _VIJ = (_rows, spectatorIndices(_PSI_m_dag, _dims_dag, (_ri_ket_idx, _rj_ket_idx)));
                                     _interaction_ops[1].append(_VIJ);
-
-
-                                    # _VIJ=0;
-                                    # for l in range(len(self._HSlist)):
-
-                                    #     if l!=m and l!=k:
-                                    #         for rk in self._AMs[l]._basis:
-                                    #             _PPSI_m =copy.deepcopy(_PSI_m);
-                                    #             _PPSI_m[l]=rk;
-                                    #             _PPSI_m_dag = _swapElements(copy.deepcopy(_PPSI_m), _rj_ket_idx, _ri_ket_idx);
-                                    #             _VIJ += qt.tensor(_PPSI_m)*(qt.tensor(_PPSI_m_dag).dag());
-
-                                    # _VIJ.dims = [[self.Nrlevels],[self.Nrlevels]];
-                                    # _interaction_ops[1].append(_VIJ);
                                 
                                 self._pairInteraction_lval.append([li, lj]);
                                 _pairInteraction_idx.append(_idx_ij);
@@ -1447,26 +1826,31 @@ class atomicQRegister:
         '''
         self.__mode = 'control';
         
-        _bufHQobjEvo = []; #list of storing all the t-dependent Hamiltonian of the register
         _bufnHAQiPTpulses = [AM.Hpulses for AM in self._AMs]; #list of pulses for the atomicModel()
         _bufnHStruct = [AM._lstHamiltonian for AM in self._AMs]; #list of the Hamiltonian's structure of the system
         
-        _i=0;    
+        _idenLst = [iden(self._AMs[i].Nrlevels) for i in range(len(self._AMs))];
+        _channels = hamiltonianChannels(); #terms of the same embedded operator are merged
+        _embedded = {}; #tensor embedding of every distinct operator of each atomicModel(), built once
+
         for register in range(self.NrQReg):
             
             for H,oft in zip(_bufnHStruct[register],_bufnHAQiPTpulses[register]):
 
-                #list of partial partition for storing as QobjEVO 
-                nH = [iden(self._AMs[i].Nrlevels) for i in range(len(self._AMs))];
-                nH[_i] = H;
-                nH = qt.tensor(nH);
-                nH.dims= [[self.Nrlevels],[self.Nrlevels]];
+                _key = (register, id(H));
+                if _key not in _embedded:
+                    #list of partial partition for storing as QobjEVO 
+                    nH = list(_idenLst);
+                    nH[register] = H;
+                    nH = qt.tensor(nH);
+                    nH.dims= [[self.Nrlevels],[self.Nrlevels]];
+                    _embedded[_key] = nH;
 
-                _bufHQobjEvo+= [[nH, oft]]; #buffer list with struct and pulses of the Hamiltonian
+                _channels.add(_key, _embedded[_key], 1, oft);
                 
                 self._lsttHamiltonian+=[H]; #storing all atomicModel's Hamiltonian
-            _i+=1;              
 
+        _bufHQobjEvo = _channels.terms(); #buffer list with struct and pulses of the Hamiltonian
 
         self.tnHamiltonian = _bufHQobjEvo;
         self.Hpulses = _bufnHAQiPTpulses;
@@ -1528,37 +1912,43 @@ class atomicQRegister:
             _GScombinations = [p for p in itertools.product(*self._groundstatesAM)]; #generate all combinations of GS in NrQReg elements from the sublists
             # _GScombinations = [c for c in _GScombinations if len(set([id(sublist) for sublist in c])) == self.NrQReg]; #filter out combinations with duplicate elements from the same sublist
 
-            _PSI_LST = [[qt.basis(atMod.Nrlevels, gs) for atMod, gs in zip(self._AMs, _GScombinations[comb_idx])] for comb_idx in range(len(_GScombinations))]; #iterate over all possible combinations of GS
+            _PSI_LST = [list(_GScombinations[comb_idx]) for comb_idx in range(len(_GScombinations))]; #levels of all possible combinations of GS
              
             for psi_idx in range(len(_PSI_LST)):
                 self._buildInteractingBasis(_psi = _PSI_LST[psi_idx]);
 
-                _Vtot=None;
+                _rows = []; _cols = []; _vals = []; #entries of the interaction operator in the product basis
 
                 #for C6 interactions
                 for idx_basis in range(len(self._intbasis[0][0])):
                     self._getC6Strength(c6_val=c6, idx=idx_basis%self.NrQReg);
-                    if isinstance(_Vtot, qt.Qobj):
-                        _Vtot += self.nC6Interaction*self._intbasis[0][0][idx_basis];
-                    else:
-                        _Vtot = self.nC6Interaction*self._intbasis[0][0][idx_basis];
+                    _rows.append([self._intbasis[0][0][idx_basis]]);
+                    _cols.append([self._intbasis[0][0][idx_basis]]);
+                    _vals.append([self.nC6Interaction]);
                 try:
-                    _intbasis4C3 = [];
-                    for ii in self._intbasis[0][1]:
-                        append_to_list_if_not_exists(_intbasis4C3, ii+ ii.dag());
-
+                    _intbasis4C3 = {}; #entries of |psi><psi_swap| + h.c. without repeated operators
+                    for ii_rows, ii_cols in self._intbasis[0][1]:
+                        _r = np.concatenate([ii_rows, ii_cols]);
+                        _c = np.concatenate([ii_cols, ii_rows]);
+                        _intbasis4C3.setdefault(np.sort(_r*self.Nrlevels + _c).tobytes(), (_r, _c));
+                    _intbasis4C3 = list(_intbasis4C3.values());
 
                     for idx_basis in range(len(self._C3pairInteraction_idx)):
 
                         self._getC3Strength(c3_val=c3, idx=idx_basis); #%self.NrQReg
 
-                        if isinstance(_Vtot, qt.Qobj):
-                            _Vtot += self.nC3Interaction*_intbasis4C3[idx_basis];
-                        else:
-                            _Vtot = self.nC3Interaction*_intbasis4C3[idx_basis];
+                        _r, _c = _intbasis4C3[idx_basis];
+                        _rows.append(_r);
+                        _cols.append(_c);
+                        _vals.append(np.full(len(_r), self.nC3Interaction));
                 except:
                     print('Passed C3 interaction. Not found.')
 
+                _Vtot=None;
+                if len(_vals)!=0: #repeated entries are summed
+                    _Vtot = qt.Qobj(sp.csr_matrix((np.concatenate(_vals), (np.concatenate(_rows), np.concatenate(_cols))), shape=(self.Nrlevels, self.Nrlevels)),
+                                    dims=[[self.Nrlevels],[self.Nrlevels]]);
+
                 try:
                     self.tnHamiltonian.append(_Vtot); #add the interaction term as always ON Hamiltonian
                     self.tnHamiltonian = self.tnHamiltonian[-1:] + self.tnHamiltonian[:-1]; #setting the new _Vtot term as first, for qutip solver requirement
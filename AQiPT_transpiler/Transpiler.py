@@ -1,15 +1,67 @@
+import os
 import time
-from typing import Any, Dict, Union
+from contextlib import nullcontext
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 from .config.core import BackendConfig, default_backend
 from .rydberg_blocks.rydberg_qubits import (
     RydbergQuantumRegister,
     RydbergQubit,
     RydbergRegisterSchedule,
 )
-from .utils.transpiler_utils import qc_to_ryd
+from .utils.transpiler_utils import qc_to_ryd, RydbergScheduleTemplate
+from .utils.incremental import IncrementalSchedule
+from .utils.profiling import TranspilationProfile, profiling
 from .transpilation_rules import transpilation_rules as default_transp_rules
 
 
+class TranspilationResult(NamedTuple):
+    """Result of one circuit of Transpiler.transpile_many"""
+
+    index: int
+    schedule: Union[RydbergRegisterSchedule, RydbergScheduleTemplate]
+    transpilation_time: float
+    profile: Optional[TranspilationProfile] = None
+
+
+def _transpile_circuit(
+    qc, transpilation_rules: Dict, backend_config: BackendConfig
+) -> Union[RydbergRegisterSchedule, RydbergScheduleTemplate]:
+    if qc.parameters:
+        # Circuits with free parameters give a template, see RydbergScheduleTemplate.bind
+        return RydbergScheduleTemplate(qc, transpilation_rules, backend=backend_config)
+
+    return qc_to_ryd(qc, transpilation_rules, backend=backend_config)
+
+
+# Rules and backend of the pool workers, set once per process by _init_worker
+_worker_config = {}
+
+
+def _init_worker(transpilation_rules: Dict, backend_config: BackendConfig) -> None:
+    _worker_config["transpilation_rules"] = transpilation_rules
+    _worker_config["backend_config"] = backend_config
+
+
+def _profiling(backend_config: BackendConfig):
+    if backend_config.transpiler_config.profile:
+        return profiling()
+    return nullcontext()
+
+
+def _transpile_job(job) -> TranspilationResult:
+    index, qc = job
+    backend_config = _worker_config["backend_config"]
+    time_start = time.perf_counter()
+    with _profiling(backend_config) as profile:
+        schedule = _transpile_circuit(
+            qc, _worker_config["transpilation_rules"], backend_config
+        )
+    return TranspilationResult(
+        index, schedule, time.perf_counter() - time_start, profile
+    )
+
+
 class Transpiler:
     def __init__(
         self,
@@ -25,25 +77,141 @@ class Transpiler:
         self.quantum_register = None
         self.transpilation_time = None
         self.rydberg_schedule = None
+        # TranspilationProfile of the last transpile, see TranspilerConfig.profile
+        self.profile = None
+        # IncrementalSchedule of the last transpile_incremental
+        self.incremental_schedule = None
 
-    def transpile(self, qc) -> RydbergRegisterSchedule:
+    def transpile(self, qc) -> Union[RydbergRegisterSchedule, RydbergScheduleTemplate]:
         self.qc = qc
         time_start = time.time()
-        rydberg_schedule = qc_to_ryd(
-            qc, self.transpilation_rules, backend=self.backend_config
-        )
+        with _profiling(self.backend_config) as profile:
+            rydberg_schedule = _transpile_circuit(
+                qc, self.transpilation_rules, self.backend_config
+            )
         self.rydberg_schedule = rydberg_schedule
         time_end = time.time()
 
         self.transpilation_time = time_end - time_start
+        self.profile = profile
         self.rydberg_schedule = rydberg_schedule
         return rydberg_schedule
 
+    def transpile_incremental(self, qc) -> IncrementalSchedule:
+        """Transpiles a circuit keeping, for each gate, the templates it placed
+        and its time slot, so update_gate can patch the schedule when the
+        parameters of one gate change instead of transpiling it again.
+
+        Args:
+            qc (RydbergQuantumCircuit): Circuit without free parameters.
+
+        Returns:
+            IncrementalSchedule: Transpiled circuit, its schedule is also
+                stored in rydberg_schedule.
+        """
+        self.qc = qc
+        time_start = time.time()
+        with _profiling(self.backend_config) as profile:
+            incremental_schedule = IncrementalSchedule(
+                qc, self.transpilation_rules, backend=self.backend_config
+            )
+        self.transpilation_time = time.time() - time_start
+        self.profile = profile
+        self.incremental_schedule = incremental_schedule
+        self.rydberg_schedule = incremental_schedule.schedule
+        return incremental_schedule
+
+    def update_gate(
+        self, index: int, params: Sequence[float]
+    ) -> RydbergRegisterSchedule:
+        """Changes the parameters of one gate of the last transpile_incremental
+        circuit and updates its schedule (see IncrementalSchedule.update_gate).
+
+        Args:
+            index (int): Position of the gate in the circuit data, barriers included.
+            params (Sequence[float]): New parameters of the gate.
+
+        Raises:
+            ValueError: If transpile_incremental was not called before.
+
+        Returns:
+            RydbergRegisterSchedule: Updated schedule, also stored in rydberg_schedule.
+        """
+        if self.incremental_schedule is None:
+            raise ValueError("update_gate needs a circuit from transpile_incremental")
+
+        time_start = time.time()
+        with _profiling(self.backend_config) as profile:
+            rydberg_schedule = self.incremental_schedule.update_gate(index, params)
+        self.transpilation_time = time.time() - time_start
+        self.profile = profile
+        self.rydberg_schedule = rydberg_schedule
+        return rydberg_schedule
+
+    def transpile_many_iter(
+        self,
+        circuits: Sequence,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> Iterator[TranspilationResult]:
+        """Transpiles a batch of circuits over a process pool, yielding each
+        result as soon as it is ready (not necessarily in order).
+
+        It does not modify the state of the Transpiler (qc, rydberg_schedule,
+        transpilation_time).
+
+        Args:
+            circuits (Sequence): Circuits to transpile.
+            workers (Optional[int], optional): Number of processes. Defaults to os.cpu_count().
+                With 1 worker the circuits are transpiled in the current process.
+            chunksize (int, optional): Circuits sent to a worker at once. Defaults to 1.
+
+        Yields:
+            TranspilationResult: Index of the circuit, schedule, transpilation time
+                and TranspilationProfile (if TranspilerConfig.profile).
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        jobs = enumerate(circuits)
+        initargs = (self.transpilation_rules, self.backend_config)
+
+        if workers <= 1:
+            _init_worker(*initargs)
+            for job in jobs:
+                yield _transpile_job(job)
+            return
+
+        with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+            yield from pool.imap_unordered(_transpile_job, jobs, chunksize=chunksize)
+
+    def transpile_many(
+        self,
+        circuits: Sequence,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> List[TranspilationResult]:
+        """Transpiles a batch of circuits over a process pool.
+
+        Args:
+            circuits (Sequence): Circuits to transpile.
+            workers (Optional[int], optional): Number of processes. Defaults to os.cpu_count().
+            chunksize (int, optional): Circuits sent to a worker at once. Defaults to 1.
+
+        Returns:
+            List[TranspilationResult]: One result per circuit, in the same order as circuits.
+        """
+        results = list(self.transpile_many_iter(circuits, workers, chunksize))
+        results.sort(key=lambda result: result.index)
+        return results
+
     def build_transpiled_circuit(
         self, init_state
     ) -> Union[RydbergQuantumRegister, RydbergQubit]:
         schedules = self.rydberg_schedule.schedules
-        atomic_config = self.backend_config.atomic_config
+        # The schedule carries the simulation window it was sized for
+        backend_config = self.rydberg_schedule.backend_config
+        atomic_config = backend_config.atomic_config
         qubits = []
 
         if len(schedules) == 1:
@@ -56,7 +224,7 @@ class Transpiler:
                     "RydbergStates": atomic_config.rydberg_states,
                     "l_values": atomic_config.l_values,
                 },
-                backend=self.backend_config,
+                backend=backend_config,
             )
 
             self.quantum_register = qubit
@@ -73,7 +241,7 @@ class Transpiler:
                     "RydbergStates": atomic_config.rydberg_states,
                     "l_values": atomic_config.l_values,
                 },
-                backend=self.backend_config,
+                backend=backend_config,
             )
 
             qubit.compile()
@@ -86,7 +254,7 @@ class Transpiler:
             connectivity=atomic_config.connectivity,
             c3=atomic_config.c3_constant,
             c6=atomic_config.c6_constant,
-            backend=self.backend_config,
+            backend=backend_config,
         )
 
         qr.build()
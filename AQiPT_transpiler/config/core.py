@@ -1,8 +1,26 @@
-from typing import List, Dict, Tuple, Any
+import warnings
+from functools import lru_cache
+from typing import List, Dict, Tuple, Any, Optional
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 import numpy as np
 
 
+@lru_cache(maxsize=32)
+def _timebase(time_simulation: float, sampling: int) -> np.ndarray:
+    times = np.linspace(0, time_simulation, sampling)
+    # Shared by reference between every schedule of the same configuration
+    times.flags.writeable = False
+    return times
+
+
+# (real, complex) storage dtypes of the sampled pulses for each precision
+PRECISION_DTYPES = {
+    "double": (np.float64, np.complex128),
+    "single": (np.float32, np.complex64),
+}
+
+
 class SimulationConfig(BaseSettings):
     """Simulation config class.
 
@@ -17,6 +35,33 @@ class SimulationConfig(BaseSettings):
         rtol (float): Error tolerance for the mesolve function
         max_steps (float): _description_ #TODO: Doc to do
         store_steps (bool): If the mesolve should save the states during the run
+        auto_size (bool): If the transpiler should size time_simulation and sampling
+        from the transpiled circuit instead of using the values given
+        samples_per_pulse (int): Target number of samples over the shortest pulse
+        when auto_size is enabled
+        min_pulse_width (float): Pulses shorter than this are ignored when auto_size
+        looks for the shortest pulse, so near-zero rotations do not set the sampling
+        min_pulse_amplitude (float): Pulses whose absolute amplitude is not above
+        this are ignored when auto_size looks for the shortest pulse
+        max_sampling (int): Upper limit of the sampling chosen by auto_size, larger
+        values are clamped with a warning
+        precision (str): Storage precision of the sampled pulses, "double"
+        (float64/complex128) or "single" (float32/complex64). Single precision
+        pulses are sampled in blocks, kept in the schedule and upcast term by
+        term by the emulator. It only applies to sampled pulses: with
+        analytic_coefficients the emulator never samples the segments, and
+        "single" gives a warning
+        memmap (bool): If the sampled pulses are written once to np.memmap files
+        and read as views, for schedules that do not fit in memory
+        scratch_dir (Optional[str]): Directory where the memmap files are created,
+        the system temporary directory when None
+        analytic_coefficients (bool): If the emulator evaluates the pulses made of
+        segments in closed form (SegmentCoefficient) instead of interpolating
+        their sampled arrays. Waveform arrays are always passed as arrays. It is
+        faster for long schedules and lets the emulator propagate square pulses
+        exactly between their edges, but the results differ from the sampled
+        pulses by their interpolation error (e.g. ~3e-3 in the populations of
+        qft(2) with sampling=2000), so it is opt-in
     """
 
     time_simulation: float = 5
@@ -26,6 +71,43 @@ class SimulationConfig(BaseSettings):
     rtol: float = 1e6
     max_steps: float = 10e-6
     store_states: bool = True
+    auto_size: bool = False
+    samples_per_pulse: int = 20
+    min_pulse_width: float = 1e-6
+    min_pulse_amplitude: float = 0.0
+    max_sampling: int = int(1e6)
+    precision: str = "double"
+    memmap: bool = False
+    scratch_dir: Optional[str] = None
+    analytic_coefficients: bool = False
+
+    @model_validator(mode="after")
+    def _check_precision(self) -> "SimulationConfig":
+        if self.precision == "single" and self.analytic_coefficients:
+            warnings.warn(
+                'precision="single" only applies to sampled pulses, the emulator '
+                "evaluates the segments in closed form with analytic_coefficients=True"
+            )
+        return self
+
+    def timebase(self) -> np.ndarray:
+        """Sampling times of the simulation, np.linspace(0, time_simulation, sampling).
+
+        The array is cached per (time_simulation, sampling) and shared by every
+        schedule, register and pulse built with this configuration, so it is
+        read-only: copy it before modifying it.
+        """
+        return _timebase(float(self.time_simulation), int(self.sampling))
+
+    def storage_dtype(self, is_complex: bool) -> type:
+        """Dtype used to store a sampled pulse with the configured precision.
+
+        Raises:
+            ValueError: If the precision is not "double" or "single".
+        """
+        if self.precision not in PRECISION_DTYPES:
+            raise ValueError(f"{self.precision} is not a valid precision")
+        return PRECISION_DTYPES[self.precision][int(is_complex)]
 
 
 class PulseConfig(BaseSettings):
@@ -85,12 +167,29 @@ class TranspilerConfig(BaseSettings):
        t_wait (float): How much time the transpiler must waits before adding another pulse
        shpae (str): The shape that most of the pulses will have
        normal_frequency (float): Frequency of coupling of most of the pulses
+       gate_cache (bool): If the rules reuse cached relative-time gate schedules
+       scheduling (str): How the gates are placed in time: "greedy" uses the start
+       time of each rule, "asap"/"alap" reschedule the circuit over its DAG
+       fuse_single_qubit (bool): If runs of one-qubit gates on a qubit are fused
+       into the minimal sequence of uxy gates before transpiling
+       virtual_z (bool): If rz and z are tracked as a phase frame of each qubit
+       and folded into the phase of later pulses instead of being pulsed
+       profile (bool): If the Transpiler records a TranspilationProfile (time,
+       memory, pulses and array bytes per stage) of each transpilation
+       streaming (bool): If the gates are consumed lazily and their pulses added
+       to per-channel accumulators right away (only with "greedy" scheduling)
     """
 
     t_start: float = 0.0
     t_wait: float = 0.01
     shape: str = "square"
     normal_frequency: float = 10.0
+    gate_cache: bool = True
+    scheduling: str = "greedy"
+    fuse_single_qubit: bool = False
+    virtual_z: bool = False
+    profile: bool = False
+    streaming: bool = False
 
 
 class BackendConfig(BaseSettings):
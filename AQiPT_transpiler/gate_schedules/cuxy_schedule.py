@@ -45,7 +45,7 @@ class CUxySchedule(GateSchedule):
     ) -> None:
         if pair is None:
             pair = [[1, 3], [0, 3]]
-        super().__init__(t_start, freq, pair, shape)
+        super().__init__(t_start, freq, pair, shape, **kwargs)
 
         self.theta = theta
         self.phi = phi
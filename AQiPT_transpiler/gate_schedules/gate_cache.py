@@ -0,0 +1,208 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Tuple
+import numpy as np
+
+from ..rydberg_blocks.rydberg_schedules import RydbergQubitSchedule
+from ..config.core import BackendConfig, default_backend
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def backend_fingerprint(backend: BackendConfig) -> str:
+    r"""Huella de la configuración completa de un backend: su JSON. Dentro
+    de un fingerprint_scope del mismo backend se reutiliza la ya calculada.
+
+    Args:
+        backend (BackendConfig): Configuración del backend.
+
+    Returns:
+        str: JSON de la configuración.
+    """
+    if _active_fingerprint is not None and _active_fingerprint[0] is backend:
+        return _active_fingerprint[1]
+    return backend.model_dump_json()
+
+
+# (backend, fingerprint) of the running transpilation, see fingerprint_scope
+_active_fingerprint: Optional[Tuple[BackendConfig, str]] = None
+
+
+@contextmanager
+def fingerprint_scope(backend: BackendConfig) -> Iterator[str]:
+    r"""Calcula la huella del backend una sola vez para todas las compuertas
+    de una transpilación (el backend no cambia durante ella).
+
+    Args:
+        backend (BackendConfig): Configuración del backend de la transpilación.
+
+    Yields:
+        str: Huella del backend.
+    """
+    global _active_fingerprint
+    previous = _active_fingerprint
+    _active_fingerprint = (backend, backend_fingerprint(backend))
+    try:
+        yield _active_fingerprint[1]
+    finally:
+        _active_fingerprint = previous
+
+
+def _freeze(value: Any, decimals: int) -> Any:
+    # Floats first, they are most of the parameters
+    if isinstance(value, float):
+        # Avoid -0.0 and 0.0 giving different keys
+        return round(value, decimals) + 0.0
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze(v, decimals) for v in value])
+    if isinstance(value, np.floating):
+        return round(float(value), decimals) + 0.0
+    return value
+
+
+class PlacedQubitSchedule(NamedTuple):
+    r"""Schedule de un qubit en tiempo relativo y el tiempo donde se ubica
+    dentro del registro. Los pulsos se desplazan al construir el
+    RydbergRegisterSchedule (construct_register_schedule)."""
+
+    q_schedule: RydbergQubitSchedule
+    offset: float
+
+
+class PlacedGateSchedule:
+    r"""Plantilla de una compuerta (construida con t_start=0) ubicada en 't_start'.
+
+    Args:
+        template (Any): Schedule de la compuerta construido con t_start=0.
+        t_start (float): Tiempo de inicio de la compuerta.
+    """
+
+    def __init__(self, template: Any, t_start: float) -> None:
+        self.template = template
+        self.t_start = t_start
+        self.t_end = t_start + template.t_end
+
+        q_schedule = template.q_schedule
+        if isinstance(q_schedule, tuple):
+            self.q_schedule = tuple(
+                PlacedQubitSchedule(q_s.q_schedule, t_start) for q_s in q_schedule
+            )
+        else:
+            self.q_schedule = PlacedQubitSchedule(q_schedule, t_start)
+
+    def __call__(self):
+        return self.q_schedule
+
+
+class GateScheduleCache:
+    r"""Cache LRU acotada de plantillas de compuertas en tiempo relativo.
+
+    La llave es (clase del schedule, parámetros redondeados, par, forma,
+    frecuencia, JSON del backend), así dos backends distintos nunca
+    comparten una plantilla. En un acierto la plantilla solo se
+    ubica en el nuevo 't_start'.
+
+    Args:
+        maxsize (int, optional): Número máximo de plantillas. Defaults to 256.
+        decimals (int, optional): Decimales con los que se redondean los parámetros. Defaults to 12.
+    """
+
+    def __init__(self, maxsize: int = 256, decimals: int = 12) -> None:
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self._templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, schedule_cls: Callable, **kwargs) -> Tuple:
+        backend = kwargs.pop("backend", default_backend)
+        decimals = self.decimals
+        params = tuple(
+            [(name, _freeze(kwargs[name], decimals)) for name in sorted(kwargs)]
+        )
+        return (schedule_cls.__name__, params, backend_fingerprint(backend))
+
+    def template(self, schedule_cls: Callable, **kwargs) -> Any:
+        r"""Retorna la plantilla (t_start=0) de la compuerta, construyéndola
+        si no está en la cache.
+
+        Args:
+            schedule_cls (Callable): Clase del schedule de la compuerta.
+
+        Returns:
+            Any: Schedule de la compuerta en tiempo relativo.
+        """
+        key = self.key(schedule_cls, **kwargs)
+
+        template = self._templates.get(key)
+        if template is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template
+
+        self.misses += 1
+        template = schedule_cls(t_start=0, **kwargs)
+        if self.maxsize > 0:
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+        return template
+
+    def schedule(
+        self, schedule_cls: Callable, t_start: float, **kwargs
+    ) -> PlacedGateSchedule:
+        r"""Retorna el schedule de la compuerta ubicado en 't_start'.
+
+        Args:
+            schedule_cls (Callable): Clase del schedule de la compuerta.
+            t_start (float): Tiempo de inicio de la compuerta.
+
+        Returns:
+            PlacedGateSchedule: Schedule de la compuerta.
+        """
+        return PlacedGateSchedule(self.template(schedule_cls, **kwargs), t_start)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._templates)
+        )
+
+    def cache_clear(self) -> None:
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Cache shared by the transpilation rules
+gate_schedule_cache = GateScheduleCache()
+
+
+def build_gate_schedule(
+    schedule_cls: Callable, t_start: float, **kwargs
+) -> PlacedGateSchedule:
+    r"""Construye la plantilla de una compuerta en tiempo relativo y la ubica
+    en 't_start'. Usa la cache de plantillas si el backend lo permite
+    (TranspilerConfig.gate_cache).
+
+    Args:
+        schedule_cls (Callable): Clase del schedule de la compuerta.
+        t_start (float): Tiempo de inicio de la compuerta.
+
+    Returns:
+        PlacedGateSchedule: Schedule de la compuerta.
+    """
+    backend = kwargs.get("backend", default_backend)
+    if not backend.transpiler_config.gate_cache:
+        return PlacedGateSchedule(schedule_cls(t_start=0, **kwargs), t_start)
+
+    return gate_schedule_cache.schedule(schedule_cls, t_start, **kwargs)
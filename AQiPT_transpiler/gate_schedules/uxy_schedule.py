@@ -2,7 +2,7 @@ from typing import Optional
 import numpy as np
 from ..rydberg_blocks.shaped_pulses import SquarePulse, GaussianPulse
 from ..rydberg_blocks.rydberg_qubits import RydbergQubitSchedule
-from .gate_schedule import GateSchedule, CERO_FUNCTION
+from .gate_schedule import GateSchedule
 from ..utils.schedules_utils import coupling_detuning_constructors
 
 
@@ -56,19 +56,17 @@ class UxySchedule(GateSchedule):
             raise ValueError(f"{self.shape} is not a valid shape.")
 
         pulse_1 = ShapedPulse(
-            t_start=self.t_start, area=self.theta / omega, backend=self.backend_config
+            t_start=self.t_start,
+            area=self.theta / omega,
+            phase=self.phi,
+            backend=self.backend_config,
         )
 
-        pulse_t1 = SquarePulse(
-            t_start=self.t_start, t_end=pulse_1.t_end, backend=self.backend_config
-        )
-        complx_pulse_1 = pulse_1.function * np.exp(-1j * self.phi * pulse_t1.function)
-
         self.t_end = pulse_1.t_end
 
-        coupling = [(self.pair, complx_pulse_1)]
+        coupling = [(self.pair, [pulse_1.to_segment()])]
 
-        detuning = [([1, 1], CERO_FUNCTION(backend=self.backend_config).function)]
+        detuning = [([1, 1], [])]
 
         coup, detun = coupling_detuning_constructors(
             coupling, detuning, omega_coup=omega
@@ -2,7 +2,7 @@ from typing import Optional
 import numpy as np
 from ..rydberg_blocks.shaped_pulses import GaussianPulse, SquarePulse
 from ..rydberg_blocks.rydberg_qubits import RydbergQubitSchedule
-from .gate_schedule import GateSchedule, CERO_FUNCTION
+from .gate_schedule import GateSchedule
 from ..utils.schedules_utils import coupling_detuning_constructors
 
 
@@ -81,28 +81,31 @@ class XYSchedule(GateSchedule):
 
         # 3: Same as before but phase -Pi
         p3 = GaussianPulse(
-            t_start=p2.t_end, area=2 * np.pi / omega2, backend=self.backend_config
+            t_start=p2.t_end,
+            area=2 * np.pi / omega2,
+            phase=np.pi,
+            backend=self.backend_config,
         )
-        p3_t = SquarePulse(
-            t_start=p3.t_start, t_end=p3.t_end, backend=self.backend_config
-        )
-        p3_com = p3.function * np.exp(-1j * np.pi * p3_t.function)
 
         # 4: Same as first but phase -Pi
         p4 = ShapedPulse(
-            t_start=p3.t_end, area=np.pi / omega1, backend=self.backend_config
-        )
-        p4_t = SquarePulse(
-            t_start=p4.t_start, t_end=p4.t_end, backend=self.backend_config
+            t_start=p3.t_end,
+            area=np.pi / omega1,
+            phase=np.pi,
+            backend=self.backend_config,
         )
-        p4_com = p4.function * np.exp(-1j * np.pi * p4_t.function)
 
         self.t_end = p4.t_end
 
         p, q = self.pair[0], self.pair[1]
-        couplings = [(p, p1.function), (q, p2.function), (q, p3_com), (p, p4_com)]
-
-        detuning = [([1, 1], CERO_FUNCTION(backend=self.backend_config).function)]
+        couplings = [
+            (p, [p1.to_segment()]),
+            (q, [p2.to_segment()]),
+            (q, [p3.to_segment()]),
+            (p, [p4.to_segment()]),
+        ]
+
+        detuning = [([1, 1], [])]
 
         coup, detun = coupling_detuning_constructors(
             couplings, detuning, omega_coup=[omega1, omega2, omega2, omega1]
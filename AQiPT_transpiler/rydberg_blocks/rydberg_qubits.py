@@ -1,17 +1,31 @@
 from typing import Any, List, Dict, Optional, Union
-import matplotlib.pyplot as plt
+import numpy as np
 from itertools import product
 import qutip as qt
-from AQiPT import AQiPTcore as aqipt
 from AQiPT.modules.emulator import AQiPTemulator as emulator
 
 
 from ..config.core import BackendConfig, default_backend
+from ..utils.plotting import figure_pixels, minmax_decimate
 from ..rydberg_blocks.rydberg_schedules import (
     RydbergQubitSchedule,
     RydbergRegisterSchedule,
+    pyplot,
 )
 
+plt = pyplot()
+
+
+def _solver_pulses(schedule: RydbergQubitSchedule, funct_type: str) -> dict:
+    if schedule.backend_config.simulation_config.analytic_coefficients:
+        pulses = schedule.coefficient_pulses(funct_type)
+    else:
+        pulses = schedule.sampled_pulses(funct_type)
+
+    # Single precision pulses are passed as stored, the emulator upcasts each
+    # Hamiltonian term before handing it to QuTiP
+    return pulses
+
 
 class RydbergQubit:
     def __init__(
@@ -45,8 +59,8 @@ class RydbergQubit:
         nr_levels = self.nr_levels
         psi0 = self.initial_state
 
-        couplings_q = self.schedule.coupling_pulses
-        detunings_q = self.schedule.detuning_pulses
+        couplings_q = _solver_pulses(self.schedule, "coupling")
+        detunings_q = _solver_pulses(self.schedule, "detuning")
         dissipators_q = self.dissipators
         rydbergstates_q = self.rydberg_states
 
@@ -58,8 +72,9 @@ class RydbergQubit:
         }
 
         simulation_config = self.backend_config.simulation_config
+        # The shared timebase is read-only and QuTiP needs a writable tlist
         pulsed_qubit = emulator.atomicModel(
-            self.schedule.times,
+            self.schedule.times.copy(),
             nr_levels,
             psi0,
             sim_params_q,
@@ -85,6 +100,8 @@ class RydbergQubit:
         self.atom = pulsed_qubit
 
     def sim(self):
+        # With analytic coefficients the emulator propagates square schedules
+        # exactly segment by segment, sampled pulses are integrated by QuTiP
         self.atom.playSim(mode="control")
 
     def build(self):
@@ -94,7 +111,7 @@ class RydbergQubit:
     def __str__(self):
         return f"{self.name}"
 
-    def plot_results(self):
+    def plot_results(self, decimate: bool = True):
         pulse_config = self.backend_config.pulse_config
         other_color = pulse_config.DEFAULT_COLORS["other"]
 
@@ -106,11 +123,13 @@ class RydbergQubit:
         fig, axis = plt.subplots(sl, figsize=(16, 2 * sl))
 
         plt.setp(axis, yticks=[0, 0.5, 1])
+        # Only the min/max envelope of each curve at the figure width
+        pixels = figure_pixels(fig) if decimate else None
         times = self.schedule.times
         for i in range(sl):
-            state = states[i]
+            t_state, state = minmax_decimate(times, states[i], pixels)
 
-            axis[i].plot(times, state, color=other_color[i % 4])
+            axis[i].plot(t_state, state, color=other_color[i % 4])
             axis[i].set_ylabel(f"State {i}", fontsize=14)
             axis[i].set_ylim(0, 1)
             axis[i].vlines(
@@ -160,14 +179,7 @@ class RydbergQuantumRegister:
         else:
             self.backend_config = default_backend
 
-        simulation_config = self.backend_config.simulation_config
-        sampling = simulation_config.sampling
-        bitdepth = simulation_config.bitdepth
-        t_max = simulation_config.time_simulation
-
-        self.times = aqipt.general_params(
-            {"sampling": sampling, "bitdepth": bitdepth, "time_dyn": t_max}
-        ).timebase()
+        self.times = self.backend_config.simulation_config.timebase()
 
         self.atomic_register = None
         self.schedule = {}
@@ -228,16 +240,10 @@ class RydbergQuantumRegister:
         ryd_sche = RydbergRegisterSchedule(qubits_sch, backend=self.backend_config)
         self.schedule = ryd_sche
 
-    def plot_schedule(self, couplings=True, detunings=False):
-        pulse_config = self.backend_config.pulse_config
-        coupling_color = pulse_config.DEFAULT_COLORS["coupling"]
-        detuning_color = pulse_config.DEFAULT_COLORS["detuning"]
-
-        self.schedule.plot_schedule(
-            couplings, detunings, coupling_color, detuning_color
-        )
+    def plot_schedule(self, couplings=True, detunings=False, combined=False):
+        self.schedule.plot_schedule(couplings, detunings, combined=combined)
 
-    def plot_results(self):
+    def plot_results(self, decimate: bool = True):
         pulse_config = self.backend_config.pulse_config
         other_color = pulse_config.DEFAULT_COLORS["other"]
 
@@ -252,11 +258,13 @@ class RydbergQuantumRegister:
         fig, axis = plt.subplots(sl, figsize=(16, 1.7 * sl))
 
         plt.setp(axis, yticks=[0, 0.5, 1])
+        # Only the min/max envelope of each curve at the figure width
+        pixels = figure_pixels(fig) if decimate else None
         times = self.times
         for i in range(sl):
-            state = states[i]
+            t_state, state = minmax_decimate(times, states[i], pixels)
 
-            axis[i].plot(times, state, color=other_color[i % 4])
+            axis[i].plot(t_state, state, color=other_color[i % 4])
             axis[i].set_ylabel(f"State {perm_lev[i]}", fontsize=14)
             axis[i].set_ylim(0, 1)
             axis[i].vlines(
@@ -1,11 +1,44 @@
-from typing import Any, List
+from typing import Any, List, NamedTuple, Optional
 import numpy as np
-import matplotlib.pyplot as plt
-from AQiPT import AQiPTcore as aqipt
-from ..utils.schedules_utils import merge_pulses
+from ..utils.schedules_utils import add_pulses, merge_pulses
+from ..utils.profiling import count_pulses, profile_stage, pulses_nbytes
+from ..utils.waveform_store import WaveformStore
+from ..utils.plotting import figure_pixels, minmax_decimate
+from .shaped_pulses import SegmentCoefficient, sample_segments
 from ..config.core import BackendConfig, default_backend
 
-plt.style.use("dark_background")
+# Samples computed at once when a pulse is stored in single precision or in a
+# memmap file, so the double precision samples never take a full window
+SAMPLE_CHUNK = 2**16
+
+
+def pyplot():
+    r"""Importa matplotlib.pyplot con el estilo de los gráficos del
+    transpilador. Se importa solo al graficar, así cargar un schedule
+    (RydbergRegisterSchedule.load) no requiere matplotlib."""
+    import matplotlib.pyplot as plt
+
+    plt.style.use("dark_background")
+    return plt
+
+
+class PrecisionReport(NamedTuple):
+    r"""Error de los pulsos muestreados con la precisión configurada
+    respecto a doble precisión.
+
+    Args:
+        precision (str): Precisión configurada ("double" o "single").
+        max_abs_error (float): Mayor error absoluto de una muestra.
+        max_rel_error (float): max_abs_error sobre la mayor amplitud.
+        nbytes (int): Bytes de los pulsos muestreados.
+        double_nbytes (int): Bytes de los mismos pulsos en doble precisión.
+    """
+
+    precision: str
+    max_abs_error: float
+    max_rel_error: float
+    nbytes: int
+    double_nbytes: int
 
 
 class RydbergQubitSchedule:
@@ -14,8 +47,6 @@ class RydbergQubitSchedule:
     def __init__(self, coupling_pulses: Any, detuning_pulses: Any, **kwargs):
         self.coupling_pulses = coupling_pulses
         self.detuning_pulses = detuning_pulses
-
-        self._merge_pulses()
         self.q_schedule = self
 
         if "backend" in kwargs:
@@ -27,29 +58,114 @@ class RydbergQubitSchedule:
         else:
             self.backend_config = None
 
-        simulation_config = self.backend_config.simulation_config
-        sampling = simulation_config.sampling
-        bitdepth = simulation_config.bitdepth
-        t_max = simulation_config.time_simulation
-
-        self.times = aqipt.general_params(
-            {"sampling": sampling, "bitdepth": bitdepth, "time_dyn": t_max}
-        ).timebase()
+        self.times = self.backend_config.simulation_config.timebase()
+        # Segments merged with sampled pulses are sampled on this timebase
+        self._merge_pulses()
+        # Sampled pulses kept in their stored form: single precision arrays or
+        # np.memmap files (SimulationConfig.precision and memmap)
+        self._waveforms = None
+        self._stored = {}
 
     def _merge_pulses(self):
-        self.coupling_pulses = merge_pulses(self.coupling_pulses, "Coupling")
-        self.detuning_pulses = merge_pulses(self.detuning_pulses, "Detuning")
+        with profile_stage("merge_pulses") as stats:
+            self.coupling_pulses = merge_pulses(
+                self.coupling_pulses, "Coupling", self.times
+            )
+            self.detuning_pulses = merge_pulses(
+                self.detuning_pulses, "Detuning", self.times
+            )
+            if stats is not None:
+                stats.pulses += count_pulses(self.coupling_pulses)
+                stats.pulses += count_pulses(self.detuning_pulses)
+
+    def sampled_pulses(self, funct_type="coupling") -> dict:
+        r"""Retorna los pulsos del schedule muestreados sobre la base de tiempo.
+
+        Los segmentos solo se convierten en arreglos aquí, que es lo que
+        necesita el emulador. Los arreglos se guardan con la precisión de
+        SimulationConfig.precision: en precisión simple se muestrean por
+        bloques directamente en float32/complex64, se guardan en el schedule
+        y las siguientes llamadas retornan los mismos arreglos (el emulador
+        los convierte a doble precisión término a término). Con
+        SimulationConfig.memmap cada pulso se escribe una vez en un archivo
+        (WaveformStore) y las siguientes llamadas retornan vistas de solo
+        lectura sin copiarlo.
 
-    def add_function(self, funct: np.ndarray, where: str, funct_type="coupling"):
-        r"""Añase una función a un schedule.
+        Args:
+            funct_type (str, optional): Tipo de función. Defaults to "coupling".
+
+        Raises:
+            ValueError: No se especifico el tipo de función.
+
+        Returns:
+            dict: Pulsos con la forma [pair, omega, np.ndarray].
+        """
+        if funct_type == "coupling":
+            schedule1 = self.coupling_pulses
+        elif funct_type == "detuning":
+            schedule1 = self.detuning_pulses
+        else:
+            raise ValueError
+
+        simulation_config = self.backend_config.simulation_config
+        if funct_type in self._stored:
+            return {key: list(value) for key, value in self._stored[funct_type].items()}
+
+        with profile_stage("sampled_pulses") as stats:
+            sampled = {}
+            if simulation_config.memmap and self._waveforms is None:
+                self._waveforms = WaveformStore(simulation_config.scratch_dir)
+            for key, value in schedule1.items():
+                pulse = self._sample(value[2], f"{funct_type}_{key}")
+                sampled[key] = [value[0], value[1], pulse]
+            if stats is not None:
+                stats.pulses += len(sampled)
+                stats.array_bytes += pulses_nbytes(sampled)
+
+        if simulation_config.memmap or simulation_config.precision != "double":
+            self._stored[funct_type] = sampled
+            return {key: list(value) for key, value in sampled.items()}
+
+        return sampled
+
+    def _sample(self, pulse, name: str) -> np.ndarray:
+        simulation_config = self.backend_config.simulation_config
+        if isinstance(pulse, np.ndarray):
+            dtype = simulation_config.storage_dtype(np.iscomplexobj(pulse))
+            pulse = pulse.astype(dtype, copy=False)
+            if simulation_config.memmap:
+                return self._waveforms.write(name, pulse)
+            return pulse
+
+        dtype = simulation_config.storage_dtype(any(seg.phase != 0 for seg in pulse))
+        if simulation_config.precision == "double" and not simulation_config.memmap:
+            return sample_segments(pulse, self.times).astype(dtype, copy=False)
+
+        # Sampled by blocks straight into the stored form (single precision
+        # array or memmap file), the peak memory does not depend on sampling
+        if simulation_config.memmap:
+            out = self._waveforms.allocate(name, dtype, len(self.times))
+        else:
+            out = np.empty(len(self.times), dtype=dtype)
+        for start in range(0, len(self.times), SAMPLE_CHUNK):
+            stop = start + SAMPLE_CHUNK
+            out[start:stop] = sample_segments(pulse, self.times[start:stop])
+        return WaveformStore.seal(out)
+
+    def coefficient_pulses(self, funct_type="coupling") -> dict:
+        r"""Retorna los pulsos del schedule como coeficientes en forma cerrada
+        (SegmentCoefficient) para el emulador, sin muestrearlos. Solo los
+        pulsos que ya son arreglos (formas de onda arbitrarias) se retornan
+        como arreglos.
 
         Args:
-            funct (np.ndarray): Función a añadir.
-            where (str): Ubicación dentro del schedule
             funct_type (str, optional): Tipo de función. Defaults to "coupling".
 
         Raises:
             ValueError: No se especifico el tipo de función.
+
+        Returns:
+            dict: Pulsos con la forma [pair, omega, SegmentCoefficient o np.ndarray].
         """
         if funct_type == "coupling":
             schedule1 = self.coupling_pulses
@@ -57,11 +173,102 @@ class RydbergQubitSchedule:
             schedule1 = self.detuning_pulses
         else:
             raise ValueError
-        funct_1 = schedule1[where][2]
 
-        funct_1 += funct
+        return {
+            key: [
+                value[0],
+                value[1],
+                (
+                    value[2]
+                    if isinstance(value[2], np.ndarray)
+                    else SegmentCoefficient(value[2])
+                ),
+            ]
+            for key, value in schedule1.items()
+        }
+
+    def _release_sampled(self, funct_type: str) -> None:
+        # The memmap files are removed by WaveformStore with their last view
+        self._stored.pop(funct_type, None)
+
+    def precision_report(self) -> PrecisionReport:
+        r"""Compara los pulsos muestreados con la precisión configurada
+        contra los mismos pulsos en doble precisión.
+
+        Returns:
+            PrecisionReport: Error y memoria de los pulsos del qubit.
+        """
+        max_abs_error = 0.0
+        max_amp = 0.0
+        nbytes = 0
+        double_nbytes = 0
+        for schedule1, funct_type in (
+            (self.coupling_pulses, "coupling"),
+            (self.detuning_pulses, "detuning"),
+        ):
+            sampled = self.sampled_pulses(funct_type)
+            for key, value in schedule1.items():
+                exact = sample_segments(value[2], self.times).astype(complex)
+                stored = sampled[key][2]
+                if len(exact):
+                    max_abs_error = max(max_abs_error, np.max(np.abs(stored - exact)))
+                    max_amp = max(max_amp, np.max(np.abs(exact)))
+                nbytes += stored.nbytes
+                double_dtype = complex if np.iscomplexobj(stored) else float
+                double_nbytes += stored.size * np.dtype(double_dtype).itemsize
+
+        max_rel_error = max_abs_error / max_amp if max_amp > 0 else 0.0
+        return PrecisionReport(
+            self.backend_config.simulation_config.precision,
+            float(max_abs_error),
+            float(max_rel_error),
+            nbytes,
+            double_nbytes,
+        )
+
+    def is_piecewise_constant(self) -> bool:
+        r"""Indica si todos los pulsos del qubit son constantes a trozos
+        (segmentos "square"), así el emulador puede propagar cada tramo de
+        forma exacta en lugar de integrar la ecuación diferencial.
+
+        Returns:
+            bool: False si algún pulso tiene segmentos "gaussian" o ya está
+            muestreado.
+        """
+        for schedule1 in (self.coupling_pulses, self.detuning_pulses):
+            for value in schedule1.values():
+                if isinstance(value[2], np.ndarray):
+                    return False
+                if any(seg.shape != "square" for seg in value[2]):
+                    return False
+        return True
+
+    def add_function(self, funct: list, where: str, funct_type="coupling"):
+        r"""Añase una función a un schedule. Si el canal o la función son
+        arreglos muestreados, la suma es un arreglo sobre la base de tiempo
+        del schedule.
 
-        schedule1[where][2] = funct_1
+        Args:
+            funct (list): Segmentos (o arreglo muestreado) a añadir.
+            where (str): Ubicación dentro del schedule
+            funct_type (str, optional): Tipo de función. Defaults to "coupling".
+
+        Raises:
+            ValueError: No se especifico el tipo de función, o los arreglos
+            muestreados no tienen el largo de la base de tiempo.
+        """
+        if funct_type == "coupling":
+            schedule1 = self.coupling_pulses
+        elif funct_type == "detuning":
+            schedule1 = self.detuning_pulses
+        else:
+            raise ValueError
+        pair, _, funct_1 = schedule1[where]
+
+        # Segments are concatenated into a new list (templates may share
+        # them), mixed with sampled arrays they are sampled on self.times
+        schedule1[where][2] = add_pulses([funct_1, funct], self.times, pair)
+        self._release_sampled(funct_type)
 
     def add_coupling(self, schedule2: dict, what: str, funct_type="coupling"):
         r"""Añade un schedule al schedule del qubit.
@@ -82,9 +289,15 @@ class RydbergQubitSchedule:
 
         val = schedule2[what]
         schedule1[what] = val
+        self._release_sampled(funct_type)
 
     def plot_couplings(
-        self, plot: bool = True, name: str = "", phase=True, amp=True
+        self,
+        plot: bool = True,
+        name: str = "",
+        phase=True,
+        amp=True,
+        decimate: bool = True,
     ) -> Any:
         """Función que hace el plot de las funciones de acople con sus pares.
 
@@ -93,29 +306,35 @@ class RydbergQubitSchedule:
             name (str, optional): Nombre del plot. Defaults to "".
             phase (bool, optional): Si se desea indicar las fases de los pulsos. Defaults to True.
             amp (bool, optional): Si se desea indicar las amplitudes de los pulsos. Defaults to True.
+            decimate (bool, optional): Dibujar solo la envolvente mínimo/máximo
+            de cada pulso al ancho en pixeles de la figura. Defaults to True.
 
         Returns:
             Any: Figura del plot.
         """
+        plt = pyplot()
         times = self.times
         p_pulses = {}
 
         pulse_config = self.backend_config.pulse_config
         coupling_color = pulse_config.DEFAULT_COLORS["coupling"]
 
-        for key in self.coupling_pulses.keys():
-            pair = self.coupling_pulses[key][0]
-            omega = self.coupling_pulses[key][1]
+        coupling_pulses = self.sampled_pulses("coupling")
+
+        for key in coupling_pulses.keys():
+            pair = coupling_pulses[key][0]
+            omega = coupling_pulses[key][1]
             p_pulses[str(pair) + str(omega)] = []
 
-        for key in self.coupling_pulses.keys():
-            pair = self.coupling_pulses[key][0]
-            pulse = self.coupling_pulses[key][-1]
-            omega = self.coupling_pulses[key][1]
+        for key in coupling_pulses.keys():
+            pair = coupling_pulses[key][0]
+            pulse = coupling_pulses[key][-1]
+            omega = coupling_pulses[key][1]
             p_pulses[str(pair) + str(omega)].append((pulse, omega))
 
         L = len(p_pulses.keys())
         fig, axis = plt.subplots(L, figsize=(16, 2 * L))
+        pixels = figure_pixels(fig) if decimate else None
 
         for i in range(L):
             key = list(p_pulses.keys())[i]
@@ -125,31 +344,35 @@ class RydbergQubitSchedule:
                     factor = omega / (2 * np.pi)
                     max_amp = np.max(np.abs(pulse))
 
-                    abs_pulse = np.abs(pulse) / max_amp
-                    angl_pulse = -np.angle(pulse)
+                    t_abs, abs_pulse = minmax_decimate(
+                        times, np.abs(pulse) / max_amp, pixels
+                    )
+                    t_angl, angl_pulse = minmax_decimate(
+                        times, -np.angle(pulse), pixels
+                    )
 
                     if phase:
                         axis.plot(
-                            times,
+                            t_angl,
                             angl_pulse,
                             color=coupling_color[i + 1 % 4],
                             label="$\phi (t)$",
                         )
                         axis.fill_between(
-                            times,
+                            t_angl,
                             angl_pulse,
                             color=coupling_color[i + 1 % 4],
                             alpha=0.2,
                         )
                     if amp:
                         axis.plot(
-                            times,
+                            t_abs,
                             abs_pulse,
                             color=coupling_color[i % 4],
                             label="$\Omega (t)$",
                         )
                         axis.fill_between(
-                            times, abs_pulse, color=coupling_color[i % 4], alpha=0.3
+                            t_abs, abs_pulse, color=coupling_color[i % 4], alpha=0.3
                         )
 
                     if factor != 1:
@@ -170,28 +393,30 @@ class RydbergQubitSchedule:
                     factor = omega / (2 * np.pi)
                     max_amp = np.max(np.abs(pulse))
 
-                    abs_pulse = np.abs(pulse)
-                    angl_pulse = -np.angle(pulse)
+                    t_abs, abs_pulse = minmax_decimate(times, np.abs(pulse), pixels)
+                    t_angl, angl_pulse = minmax_decimate(
+                        times, -np.angle(pulse), pixels
+                    )
 
                     if phase:
                         axis[i].plot(
-                            times,
+                            t_angl,
                             angl_pulse,
                             color=coupling_color[1],
                             label="$\phi (t)$",
                         )
                         axis[i].fill_between(
-                            times, angl_pulse, color=coupling_color[1], alpha=0.2
+                            t_angl, angl_pulse, color=coupling_color[1], alpha=0.2
                         )
                     if amp:
                         axis[i].plot(
-                            times,
+                            t_abs,
                             abs_pulse,
                             color=coupling_color[0],
                             label="$\Omega (t)$",
                         )
                         axis[i].fill_between(
-                            times, abs_pulse, color=coupling_color[0], alpha=0.3
+                            t_abs, abs_pulse, color=coupling_color[0], alpha=0.3
                         )
 
                     axis[i].text(
@@ -213,7 +438,9 @@ class RydbergQubitSchedule:
 
         plt.show()
 
-    def plot_detunings(self, plot: bool = True, name: str = "") -> Any:
+    def plot_detunings(
+        self, plot: bool = True, name: str = "", decimate: bool = True
+    ) -> Any:
         """Función que hace el plot de las funciones de las desintonizaciones con sus pares.
 
         Args:
@@ -221,10 +448,13 @@ class RydbergQubitSchedule:
             name (str, optional): Nombre del plot. Defaults to "".
             phase (bool, optional): Si se desea indicar las fases de los pulsos. Defaults to True.
             amp (bool, optional): Si se desea indicar las amplitudes de los pulsos. Defaults to True.
+            decimate (bool, optional): Dibujar solo la envolvente mínimo/máximo
+            de cada pulso al ancho en pixeles de la figura. Defaults to True.
 
         Returns:
             Any: Figura del plot.
         """
+        plt = pyplot()
         times = self.times
         p_pulses = {}
 
@@ -234,32 +464,39 @@ class RydbergQubitSchedule:
         simulation_config = self.backend_config.simulation_config
         T_MAX = simulation_config.time_simulation
 
-        for pulse in self.detuning_pulses.keys():
-            pair = self.detuning_pulses[pulse][0]
+        detuning_pulses = self.sampled_pulses("detuning")
+
+        for pulse in detuning_pulses.keys():
+            pair = detuning_pulses[pulse][0]
             p_pulses[str(pair)] = []
 
-        for key in self.detuning_pulses.keys():
-            pair = self.detuning_pulses[key][0]
-            pulse = self.detuning_pulses[key][-1]
+        for key in detuning_pulses.keys():
+            pair = detuning_pulses[key][0]
+            pulse = detuning_pulses[key][-1]
             p_pulses[str(pair)].append(pulse)
 
         L = len(p_pulses.keys())
         fig, axis = plt.subplots(L, figsize=(16, 2 * L))
+        pixels = figure_pixels(fig) if decimate else None
 
         for i in range(len(p_pulses.keys())):
             key = list(p_pulses.keys())[i]
 
             if len(p_pulses.keys()) == 1:
                 for pulse in p_pulses[key]:
-                    axis.plot(times, pulse, color=detuning_color[0])
-                    axis.fill_between(times, pulse, color=detuning_color[0], alpha=0.3)
+                    t_pulse, pulse = minmax_decimate(times, np.real(pulse), pixels)
+                    axis.plot(t_pulse, pulse, color=detuning_color[0])
+                    axis.fill_between(
+                        t_pulse, pulse, color=detuning_color[0], alpha=0.3
+                    )
                     axis.set_ylabel(f"{key}")
                     axis.set_xlim(0, T_MAX)
             else:
                 for pulse in p_pulses[key]:
-                    axis[i].plot(times, pulse, color=detuning_color[i])
+                    t_pulse, pulse = minmax_decimate(times, np.real(pulse), pixels)
+                    axis[i].plot(t_pulse, pulse, color=detuning_color[i])
                     axis[i].fill_between(
-                        times, pulse, color=detuning_color[i], alpha=0.3
+                        t_pulse, pulse, color=detuning_color[i], alpha=0.3
                     )
                     axis[i].set_ylabel(f"{key}")
                     axis[i].set_xlim(0, T_MAX)
@@ -289,27 +526,145 @@ class RydbergRegisterSchedule:
         else:
             self.backend_config = None
 
-        simulation_config = self.backend_config.simulation_config
-        sampling = simulation_config.sampling
-        bitdepth = simulation_config.bitdepth
-        t_max = simulation_config.time_simulation
-
         self.schedules = schedules
-        self.times = aqipt.general_params(
-            {"sampling": sampling, "bitdepth": bitdepth, "time_dyn": t_max}
-        ).timebase()
+        self.times = self.backend_config.simulation_config.timebase()
         self.n_qubits = len(schedules)
+        # SchedulingReport when the circuit was rescheduled (asap/alap)
+        self.scheduling_report = None
+        # Rz(beta) per qubit still pending when rz/z are virtual (virtual_z)
+        self.virtual_z_frame = None
+
+    def precision_report(self) -> List[PrecisionReport]:
+        r"""Error de los pulsos de cada qubit respecto a doble precisión
+        (ver RydbergQubitSchedule.precision_report).
+
+        Returns:
+            List[PrecisionReport]: Reporte de cada qubit.
+        """
+        return [schedule.precision_report() for schedule in self.schedules]
+
+    def is_piecewise_constant(self) -> bool:
+        r"""Indica si los pulsos de todos los qubits son constantes a trozos
+        (ver RydbergQubitSchedule.is_piecewise_constant)."""
+        return all(schedule.is_piecewise_constant() for schedule in self.schedules)
+
+    def save(self, path: str, compress: bool = False) -> None:
+        r"""Guarda el schedule en un archivo .npz (ver save_register_schedule).
+
+        Args:
+            path (str): Archivo de destino.
+            compress (bool, optional): Comprimir los arreglos. Defaults to False.
+        """
+        from ..utils.schedule_io import save_register_schedule
+
+        save_register_schedule(self, path, compress)
+
+    @classmethod
+    def load(
+        cls, path: str, mmap: bool = False, backend: Optional[BackendConfig] = None
+    ) -> "RydbergRegisterSchedule":
+        r"""Carga un schedule guardado con save (ver load_register_schedule).
+
+        Args:
+            path (str): Archivo .npz.
+            mmap (bool, optional): Leer las formas de onda como np.memmap.
+            Defaults to False.
+            backend (Optional[BackendConfig], optional): Backend del schedule.
+            Defaults to None (el que se guardó).
+
+        Returns:
+            RydbergRegisterSchedule: Schedule guardado.
+        """
+        from ..utils.schedule_io import load_register_schedule
+
+        return load_register_schedule(path, mmap, backend)
 
-    def plot_schedule(self, couplings=True, detunings=False):
+    def plot_schedule(self, couplings=True, detunings=False, combined=False):
         """Función que genera los graficos de todos los schedules del registro.
 
         Args:
             couplings (bool, optional): Si se desean ver los acoples. Defaults to True.
             detunings (bool, optional): Si se desean ver las desintonizaciones. Defaults to False.
+            combined (bool, optional): Una sola figura para todo el registro
+            (plot_register) en lugar de una por qubit. Defaults to False.
         """
+        if combined:
+            self.plot_register(couplings, detunings)
+            return
+
         for i, schedule in enumerate(self.schedules):
             if couplings:
                 schedule.plot_couplings(name=f" {i}")
 
             if detunings:
                 schedule.plot_detunings(name=f" {i}")
+
+    def plot_register(
+        self,
+        couplings: bool = True,
+        detunings: bool = False,
+        plot: bool = True,
+        decimate: bool = True,
+    ) -> Any:
+        """Gráfico de todo el registro en una sola figura: una fila por qubit
+        (y tipo de pulso) con todos sus canales, sobre el mismo eje de tiempo.
+
+        Args:
+            couplings (bool, optional): Si se desean ver los acoples (amplitud). Defaults to True.
+            detunings (bool, optional): Si se desean ver las desintonizaciones. Defaults to False.
+            plot (bool, optional): Si se desea devolver la figura o no. Defaults to True.
+            decimate (bool, optional): Dibujar solo la envolvente mínimo/máximo
+            de cada pulso al ancho en pixeles de la figura. Defaults to True.
+
+        Returns:
+            Any: Figura del plot.
+        """
+        plt = pyplot()
+        times = self.times
+
+        pulse_config = self.backend_config.pulse_config
+        colors = {
+            "coupling": pulse_config.DEFAULT_COLORS["coupling"],
+            "detuning": pulse_config.DEFAULT_COLORS["detuning"],
+        }
+        funct_types = [
+            funct_type
+            for funct_type, show in (("coupling", couplings), ("detuning", detunings))
+            if show
+        ]
+
+        rows = [(i, t) for i in range(self.n_qubits) for t in funct_types]
+        L = len(rows)
+        if L == 0:
+            return None
+        fig, axis = plt.subplots(L, figsize=(16, 1.5 * L), sharex=True, squeeze=False)
+        axis = axis[:, 0]
+        pixels = figure_pixels(fig) if decimate else None
+
+        for ax, (i, funct_type) in zip(axis, rows):
+            pulses = self.schedules[i].sampled_pulses(funct_type)
+            for j, (pair, omega, pulse) in enumerate(pulses.values()):
+                if funct_type == "coupling":
+                    values = np.abs(pulse)
+                else:
+                    values = np.real(pulse)
+                t_pulse, values = minmax_decimate(times, values, pixels)
+
+                color = colors[funct_type][j % 4]
+                label = f"{pair} $\\Omega = 2\\pi{omega / (2 * np.pi):0.2f}$"
+                ax.plot(t_pulse, values, color=color, label=label)
+                ax.fill_between(t_pulse, values, color=color, alpha=0.3)
+
+            ax.set_ylabel(f"Q{i} {funct_type}")
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            if pulses:
+                ax.legend(loc="upper right", fontsize=8)
+
+        axis[-1].set_xlim(times[0], times[-1])
+        fig.suptitle("Register schedule", fontsize=16)
+
+        if not plot:
+            return fig, axis
+
+        plt.show()
@@ -1,11 +1,399 @@
-from typing import Optional
+from abc import ABC, abstractmethod
+import bisect
+import cmath
+import itertools
+import math
+from typing import List, Optional, Tuple, Union
 import numpy as np
-from AQiPT.modules.control import AQiPTcontrol as control
 from ..config.core import BackendConfig, default_backend
 
+# Soporte de los pulsos gaussianos en unidades de g_std alrededor del centro,
+# fuera de él la envolvente exp(-x^2/4) es menor que la precisión de float64.
+GAUSSIAN_SUPPORT = 12
 
-class ShapedPulse:
-    r"""Clase que contiene los parametros de un pulso."""
+# Muestras promedio por pulso desde las que synthesize_pulses escribe cada
+# soporte por separado en lugar de concatenarlos (más rápido para pulsos anchos).
+WINDOWED_SUPPORT = 128
+
+
+class PulseSegment:
+    r"""Descripción compacta de un pulso: (t_start, t_end, shape, amp, phase).
+
+    No guarda muestras, el pulso solo se convierte en un arreglo cuando se
+    pide explícitamente y únicamente sobre su soporte.
+
+    Args:
+        t_start (float): Tiempo inicial del pulso.
+        t_end (float): Tiempo final del pulso.
+        shape (str): Forma del pulso, "square" o "gaussian".
+        amp (float): Amplitud del pulso.
+        phase (float): Fase del pulso, se aplica como exp(-i phase).
+    """
+
+    __slots__ = ("t_start", "t_end", "shape", "amp", "phase")
+
+    def __init__(
+        self,
+        t_start: float,
+        t_end: float,
+        shape: str = "square",
+        amp: float = 1,
+        phase: float = 0,
+    ):
+        if shape not in ("square", "gaussian"):
+            raise ValueError(f"{shape} is not a valid shape.")
+
+        self.t_start = t_start
+        self.t_end = t_end
+        self.shape = shape
+        self.amp = amp
+        self.phase = phase
+
+    @property
+    def t_o(self) -> float:
+        return (self.t_start + self.t_end) / 2
+
+    @property
+    def width(self) -> float:
+        return (self.t_end - self.t_start) / 2
+
+    def support(self) -> Tuple[float, float]:
+        r"""Intervalo de tiempo donde el pulso es distinto de cero.
+
+        Returns:
+            Tuple[float, float]: Tiempos inicial y final del soporte.
+        """
+        if self.shape == "gaussian":
+            g_std = np.abs(self.width) / 4
+            return (
+                self.t_o - GAUSSIAN_SUPPORT * g_std,
+                self.t_o + GAUSSIAN_SUPPORT * g_std,
+            )
+
+        return self.t_start, self.t_end
+
+    def envelope(self, times: np.ndarray) -> np.ndarray:
+        r"""Evalúa la envolvente real del pulso sobre los tiempos dados.
+
+        Args:
+            times (np.ndarray): Tiempos donde se evalúa la envolvente.
+
+        Returns:
+            np.ndarray: Envolvente del pulso.
+        """
+        if self.shape == "gaussian":
+            g_std = np.abs(self.width) / 4
+            return self.amp * np.exp(-((times - self.t_o) ** 2) / (4 * g_std**2))
+
+        return self.amp * (np.abs(times - self.t_o) < self.width)
+
+    def add_to(self, times: np.ndarray, out: np.ndarray) -> np.ndarray:
+        r"""Suma las muestras del pulso en 'out' escribiendo solo sobre su soporte.
+
+        Args:
+            times (np.ndarray): Base de tiempo (ordenada) de 'out'.
+            out (np.ndarray): Arreglo donde se acumula el pulso.
+
+        Returns:
+            np.ndarray: El mismo arreglo 'out'.
+        """
+        if self.width == 0 or self.amp == 0:
+            return out
+
+        t_lo, t_hi = self.support()
+        i_lo = np.searchsorted(times, t_lo, side="left")
+        i_hi = np.searchsorted(times, t_hi, side="right")
+        if i_lo >= i_hi:
+            return out
+
+        samples = self.envelope(times[i_lo:i_hi])
+        if self.phase != 0:
+            samples = samples * np.exp(-1j * self.phase)
+        out[i_lo:i_hi] += samples
+
+        return out
+
+    def shifted(self, delta_t: float) -> "PulseSegment":
+        r"""Retorna una copia del pulso desplazada 'delta_t' en el tiempo."""
+        return PulseSegment(
+            self.t_start + delta_t,
+            self.t_end + delta_t,
+            self.shape,
+            self.amp,
+            self.phase,
+        )
+
+    def __repr__(self):
+        return (
+            f"PulseSegment({self.shape}, t=[{self.t_start:0.5f}, {self.t_end:0.5f}], "
+            f"amp={self.amp:0.5f}, phase={self.phase:0.5f})"
+        )
+
+
+def segments_to_arrays(segments: List[PulseSegment]) -> Tuple[np.ndarray, ...]:
+    r"""Convierte una lista de segmentos en arreglos por parámetro.
+
+    Args:
+        segments (List[PulseSegment]): Segmentos de un canal.
+
+    Returns:
+        Tuple[np.ndarray, ...]: t_start, t_end, amp, phase y una máscara que
+        indica los segmentos gaussianos.
+    """
+    t_start = np.fromiter((seg.t_start for seg in segments), float, len(segments))
+    t_end = np.fromiter((seg.t_end for seg in segments), float, len(segments))
+    amp = np.fromiter((seg.amp for seg in segments), float, len(segments))
+    phase = np.fromiter((seg.phase for seg in segments), float, len(segments))
+    gaussian = np.fromiter(
+        (seg.shape == "gaussian" for seg in segments), bool, len(segments)
+    )
+    return t_start, t_end, amp, phase, gaussian
+
+
+def synthesize_pulses(
+    t_start: np.ndarray,
+    t_end: np.ndarray,
+    amp: np.ndarray,
+    phase: np.ndarray,
+    gaussian: np.ndarray,
+    times: np.ndarray,
+) -> np.ndarray:
+    r"""Suma todos los pulsos de un canal sobre 'times' en una sola pasada.
+
+    Cada pulso solo se evalúa sobre su soporte (ver PulseSegment.support):
+    los índices de todos los soportes se concatenan, las envolventes se
+    evalúan juntas y se acumulan con np.bincount. Si los soportes son
+    anchos (WINDOWED_SUPPORT) se escribe cada uno sobre su ventana. El
+    orden de la suma es el de los pulsos, así que el resultado es el de
+    sumar PulseSegment.add_to de cada uno (salvo redondeo de np.exp).
+
+    Args:
+        t_start (np.ndarray): Tiempos iniciales de los pulsos.
+        t_end (np.ndarray): Tiempos finales de los pulsos.
+        amp (np.ndarray): Amplitudes de los pulsos.
+        phase (np.ndarray): Fases de los pulsos, se aplican como exp(-i phase).
+        gaussian (np.ndarray): Máscara de los pulsos gaussianos, el resto son cuadrados.
+        times (np.ndarray): Base de tiempo (ordenada).
+
+    Returns:
+        np.ndarray: Suma de los pulsos, compleja si alguna fase es distinta de cero.
+    """
+    is_complex = bool(np.any(phase != 0))
+    t_o = (t_start + t_end) / 2
+    width = (t_end - t_start) / 2
+
+    keep = (width != 0) & (amp != 0)
+    t_start, t_end, amp, phase, gaussian = (
+        t_start[keep],
+        t_end[keep],
+        amp[keep],
+        phase[keep],
+        gaussian[keep],
+    )
+    t_o, width = t_o[keep], width[keep]
+
+    g_std = np.abs(width) / 4
+    t_lo = np.where(gaussian, t_o - GAUSSIAN_SUPPORT * g_std, t_start)
+    t_hi = np.where(gaussian, t_o + GAUSSIAN_SUPPORT * g_std, t_end)
+    i_lo = np.searchsorted(times, t_lo, side="left")
+    i_hi = np.searchsorted(times, t_hi, side="right")
+    lengths = np.maximum(i_hi - i_lo, 0)
+
+    if len(lengths) and lengths.mean() > WINDOWED_SUPPORT:
+        return _synthesize_windowed(
+            t_o, width, g_std, amp, phase, gaussian, i_lo, i_hi, times, is_complex
+        )
+
+    # Flat indices of the samples of every support, pulse after pulse
+    pulse = np.repeat(np.arange(len(lengths)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    index = i_lo[pulse] + np.arange(len(pulse)) - starts[pulse]
+
+    delta_t = times[index] - t_o[pulse]
+    if gaussian.all():
+        samples = amp[pulse] * np.exp(-(delta_t**2) / (4 * g_std[pulse] ** 2))
+    elif not gaussian.any():
+        samples = amp[pulse] * (np.abs(delta_t) < width[pulse])
+    else:
+        samples = np.empty(len(pulse))
+        is_gaussian = gaussian[pulse]
+        samples[is_gaussian] = amp[pulse[is_gaussian]] * np.exp(
+            -(delta_t[is_gaussian] ** 2) / (4 * g_std[pulse[is_gaussian]] ** 2)
+        )
+        is_square = ~is_gaussian
+        samples[is_square] = amp[pulse[is_square]] * (
+            np.abs(delta_t[is_square]) < width[pulse[is_square]]
+        )
+
+    if not is_complex:
+        return np.bincount(index, weights=samples, minlength=len(times))
+
+    # exp(-i 0) is exactly 1, so the pulses without phase are not changed
+    rotation = np.exp(-1j * phase)
+    out = np.empty(len(times), dtype=complex)
+    out.real = np.bincount(
+        index, weights=samples * rotation.real[pulse], minlength=len(times)
+    )
+    out.imag = np.bincount(
+        index, weights=samples * rotation.imag[pulse], minlength=len(times)
+    )
+    return out
+
+
+def _synthesize_windowed(
+    t_o, width, g_std, amp, phase, gaussian, i_lo, i_hi, times, is_complex
+) -> np.ndarray:
+    out = np.zeros(len(times), dtype=complex if is_complex else float)
+    rotation = np.exp(-1j * phase)
+    for k in range(len(t_o)):
+        if i_lo[k] >= i_hi[k]:
+            continue
+        delta_t = times[i_lo[k] : i_hi[k]] - t_o[k]
+        if gaussian[k]:
+            samples = amp[k] * np.exp(-(delta_t**2) / (4 * g_std[k] ** 2))
+        else:
+            samples = amp[k] * (np.abs(delta_t) < width[k])
+        if phase[k] != 0:
+            samples = samples * rotation[k]
+        out[i_lo[k] : i_hi[k]] += samples
+
+    return out
+
+
+def sample_segments(
+    segments: Union[List[PulseSegment], np.ndarray],
+    times: np.ndarray,
+    batched: bool = True,
+) -> np.ndarray:
+    r"""Convierte una lista de segmentos en un arreglo muestreado sobre 'times'.
+
+    Si se recibe un arreglo (forma de onda arbitraria) se retorna sin cambios.
+
+    Args:
+        segments (Union[List[PulseSegment], np.ndarray]): Segmentos a muestrear.
+        times (np.ndarray): Base de tiempo.
+        batched (bool, optional): Sintetizar todos los segmentos juntos
+        (synthesize_pulses). Con False se suma cada segmento por separado,
+        útil para depurar. Defaults to True.
+
+    Returns:
+        np.ndarray: Suma de todos los segmentos muestreados.
+    """
+    if isinstance(segments, np.ndarray):
+        return segments
+
+    if batched and segments:
+        return synthesize_pulses(*segments_to_arrays(segments), times)
+
+    dtype = complex if any(seg.phase != 0 for seg in segments) else float
+    out = np.zeros(len(times), dtype=dtype)
+    for seg in segments:
+        seg.add_to(times, out)
+
+    return out
+
+
+class SegmentCoefficient:
+    r"""Coeficiente de QuTiP (f(t, args)) en forma cerrada de un canal.
+
+    Evalúa la suma de los segmentos en un solo tiempo sin muestrearlos: una
+    búsqueda binaria encuentra los segmentos cuyo soporte contiene a t, y
+    fuera de todos los soportes retorna 0 de inmediato. Así el emulador no
+    necesita un arreglo por término ni interpolarlo en cada paso.
+
+    Si todos los segmentos son "square" el canal es constante a trozos
+    (is_piecewise_constant) y el emulador puede propagarlo de forma exacta
+    entre sus bordes (breakpoints).
+
+    Args:
+        segments (List[PulseSegment]): Segmentos del canal.
+        conjugate (bool, optional): Evaluar el conjugado del canal. Defaults to False.
+    """
+
+    def __init__(self, segments: List[PulseSegment], conjugate: bool = False):
+        self.segments = segments
+        self.is_conjugate = conjugate
+        self.is_real = all(seg.phase == 0 for seg in segments)
+
+        sign = 1 if conjugate else -1
+        rows = []
+        for seg in segments:
+            if seg.width == 0 or seg.amp == 0:
+                continue
+            t_lo, t_hi = seg.support()
+            gaussian = seg.shape == "gaussian"
+            # Square segments keep their half width, gaussians 1 / (4 g_std^2)
+            scale = 4 / seg.width**2 if gaussian else seg.width
+            rows.append(
+                (
+                    t_lo,
+                    t_hi,
+                    seg.t_o,
+                    gaussian,
+                    scale,
+                    seg.amp * cmath.exp(sign * 1j * seg.phase),
+                )
+            )
+        rows.sort(key=lambda row: row[0])
+        self.is_piecewise_constant = not any(row[3] for row in rows)
+
+        self._rows = rows
+        self._t_lo = [row[0] for row in rows]
+        # Latest end of the supports started so far, to skip idle times
+        self._reach = list(itertools.accumulate((row[1] for row in rows), max))
+        self._span = max((row[1] - row[0] for row in rows), default=0.0)
+
+    def __call__(self, t: float, args: Optional[dict] = None) -> complex:
+        i_hi = bisect.bisect_right(self._t_lo, t)
+        if i_hi == 0 or t > self._reach[i_hi - 1]:
+            return 0j
+
+        value = 0j
+        for i in range(bisect.bisect_left(self._t_lo, t - self._span), i_hi):
+            t_lo, t_hi, t_o, gaussian, scale, amp = self._rows[i]
+            if t > t_hi:
+                continue
+            if gaussian:
+                value += amp * math.exp(-((t - t_o) ** 2) * scale)
+            elif abs(t - t_o) < scale:
+                value += amp
+        return value
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        r"""Muestrea el canal sobre 'times' (ver sample_segments).
+
+        Args:
+            times (np.ndarray): Base de tiempo.
+
+        Returns:
+            np.ndarray: Muestras del canal.
+        """
+        samples = sample_segments(self.segments, times)
+        return np.conj(samples) if self.is_conjugate else samples
+
+    def breakpoints(self) -> np.ndarray:
+        r"""Tiempos donde el canal es discontinuo (bordes de los segmentos
+        "square"), el emulador divide ahí la propagación a trozos.
+
+        Returns:
+            np.ndarray: Bordes ordenados de los segmentos cuadrados.
+        """
+        edges = [(row[0], row[1]) for row in self._rows if not row[3]]
+        return np.unique(np.array(edges, dtype=float).ravel())
+
+    def conjugate(self) -> "SegmentCoefficient":
+        r"""Coeficiente del canal conjugado (el del término hermítico)."""
+        return SegmentCoefficient(self.segments, not self.is_conjugate)
+
+
+class ShapedPulse(ABC):
+    r"""Clase base que contiene los parametros de un pulso.
+
+    Cada forma de pulso (GaussianPulse, SquarePulse) define '_function', el
+    muestreo del pulso sobre la ventana de simulación.
+    """
+
+    shape = None
 
     def __init__(
         self,
@@ -17,6 +405,7 @@ class ShapedPulse:
         name: Optional[str] = None,
         color: Optional[str] = None,
         area: Optional[float] = None,
+        phase: float = 0,
         **kwargs,
     ):
         self.t_o = t_o
@@ -29,8 +418,9 @@ class ShapedPulse:
         self.color = color
         self.type = None
         self.area = area
+        self.phase = phase
         self.args = None
-        self.function = None
+        self._sampled = None
 
         if "backend" in kwargs:
             backend_config = kwargs["backend"]
@@ -46,6 +436,30 @@ class ShapedPulse:
 
         self.tp_window = t_max
 
+    @property
+    def function(self) -> np.ndarray:
+        r"""Muestreo del pulso sobre toda la ventana de simulación.
+
+        Solo se calcula cuando se solicita, el transpilador trabaja con
+        'to_segment()'.
+        """
+        if self._sampled is None:
+            func = self._function()
+            if self.phase != 0:
+                func = func * np.exp(-1j * self.phase)
+            simulation_config = self.backend_config.simulation_config
+            dtype = simulation_config.storage_dtype(np.iscomplexobj(func))
+            self._sampled = func.astype(dtype, copy=False)
+        return self._sampled
+
+    @abstractmethod
+    def _function(self) -> np.ndarray:
+        r"""Muestrea el pulso sobre toda la ventana de simulación, sin la fase."""
+
+    def to_segment(self) -> PulseSegment:
+        r"""Retorna la descripción compacta del pulso."""
+        return PulseSegment(self.t_start, self.t_end, self.shape, self.amp, self.phase)
+
     def info(self):
         """Imprime la información completa del pulso."""
         print(
@@ -56,6 +470,8 @@ class ShapedPulse:
 class GaussianPulse(ShapedPulse):
     r"""Pulse de forma Gaussiana."""
 
+    shape = "gaussian"
+
     def __init__(
         self,
         t_o: Optional[float] = None,
@@ -66,16 +482,16 @@ class GaussianPulse(ShapedPulse):
         name: Optional[str] = None,
         color: Optional[str] = None,
         area: Optional[float] = None,
+        phase: float = 0,
         **kwargs,
     ):
         super().__init__(
-            t_o, t_start, t_end, amp, 4 * g_std, name, color, area, **kwargs
+            t_o, t_start, t_end, amp, 4 * g_std, name, color, area, phase, **kwargs
         )
         self.type = "Gaussian Pulse"
         self.g_std = g_std
 
         self._set_parameters()
-        self.function = self._function()
 
     def _set_parameters(self):
         """Genera los parametros del pulso.
@@ -113,14 +529,12 @@ class GaussianPulse(ShapedPulse):
         self.args = args_list
 
         simulation_config = self.backend_config.simulation_config
-        sampling = simulation_config.sampling
-        t_max = simulation_config.time_simulation
+        self.tp_window = simulation_config.time_simulation
 
-        self.tp_window = t_max
+        t_p = simulation_config.timebase()
 
-        t_p = np.linspace(
-            0, self.tp_window, int((self.tp_window - 0) * sampling / t_max)
-        )
+        # AQiPTcontrol imports matplotlib, only needed to sample the full window
+        from AQiPT.modules.control import AQiPTcontrol as control
 
         func = control.function(t_p, args_list).gaussian()
         return func
@@ -129,6 +543,8 @@ class GaussianPulse(ShapedPulse):
 class SquarePulse(ShapedPulse):
     r"""Pulso de forma cuadrada"""
 
+    shape = "square"
+
     def __init__(
         self,
         t_o: Optional[float] = None,
@@ -139,13 +555,15 @@ class SquarePulse(ShapedPulse):
         name: Optional[str] = None,
         color: Optional[str] = None,
         area: Optional[float] = None,
+        phase: float = 0,
         **kwargs,
     ):
-        super().__init__(t_o, t_start, t_end, amp, width, name, color, area, **kwargs)
+        super().__init__(
+            t_o, t_start, t_end, amp, width, name, color, area, phase, **kwargs
+        )
         self.type = "Square Pulse"
 
         self._set_parameters()
-        self.function = self._function()
 
     def _set_parameters(self):
         """Genera los parametros del pulso.
@@ -187,14 +605,12 @@ class SquarePulse(ShapedPulse):
 
         self.args = args_list
         simulation_config = self.backend_config.simulation_config
-        sampling = simulation_config.sampling
-        t_max = simulation_config.time_simulation
+        self.tp_window = simulation_config.time_simulation
 
-        self.tp_window = t_max
+        t_p = simulation_config.timebase()
 
-        t_p = np.linspace(
-            0, self.tp_window, int((self.tp_window - 0) * sampling / t_max)
-        )
+        # AQiPTcontrol imports matplotlib, only needed to sample the full window
+        from AQiPT.modules.control import AQiPTcontrol as control
 
         func = control.function(t_p, args_list).step()
         return func
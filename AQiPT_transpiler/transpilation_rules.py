@@ -1,7 +1,9 @@
+from functools import wraps
 from typing import List, Dict, Callable
 import numpy as np
 
 from .gate_schedules.schedules import *
+from .gate_schedules.gate_cache import build_gate_schedule
 from .config.core import BackendConfig, default_backend
 
 
@@ -27,6 +29,7 @@ def transpilation_rule(func: Callable) -> Callable:
         func (_type_): _description_
     """
 
+    @wraps(func)  # Keeps the rules picklable for Transpiler.transpile_many
     def extract_backend(*args, **kwargs):
         if "backend" in kwargs.keys():
             backend_config = kwargs["backend"]
@@ -91,7 +94,8 @@ def uxy_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Uxy = UxySchedule(
+    Uxy = build_gate_schedule(
+        UxySchedule,
         theta=theta,
         phi=phi,
         t_start=qubit_t_end,
@@ -101,7 +105,7 @@ def uxy_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Uxy)
+    qubit_info[0].append(Uxy.q_schedule)
     qubit_info[1] = Uxy.t_end + t_wait
 
 
@@ -146,7 +150,8 @@ def rx_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Rx = RxSchedule(
+    Rx = build_gate_schedule(
+        RxSchedule,
         theta=theta,
         t_start=qubit_t_end,
         freq=freq,
@@ -155,7 +160,7 @@ def rx_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Rx)
+    qubit_info[0].append(Rx.q_schedule)
     qubit_info[1] = Rx.t_end + t_wait
 
 
@@ -200,7 +205,8 @@ def ry_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Ry = RySchedule(
+    Ry = build_gate_schedule(
+        RySchedule,
         theta=theta,
         t_start=qubit_t_end,
         freq=freq,
@@ -209,7 +215,7 @@ def ry_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Ry)
+    qubit_info[0].append(Ry.q_schedule)
     qubit_info[1] = Ry.t_end + t_wait
 
 
@@ -254,7 +260,8 @@ def rz_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Rz = RzSchedule(
+    Rz = build_gate_schedule(
+        RzSchedule,
         theta=theta,
         t_start=qubit_t_end,
         freq=freq,
@@ -263,7 +270,7 @@ def rz_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Rz)
+    qubit_info[0].append(Rz.q_schedule)
     qubit_info[1] = Rz.t_end + t_wait
 
 
@@ -307,7 +314,8 @@ def x_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Rx = RxSchedule(
+    Rx = build_gate_schedule(
+        RxSchedule,
         theta=np.pi,
         t_start=qubit_t_end,
         freq=freq,
@@ -316,7 +324,7 @@ def x_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Rx)
+    qubit_info[0].append(Rx.q_schedule)
     qubit_info[1] = Rx.t_end + t_wait
 
 
@@ -361,7 +369,8 @@ def y_rule(
     qubit_t_end = max(qubit_info[1], t_wait)
 
     # Construct the gate schedule
-    Ry = RySchedule(
+    Ry = build_gate_schedule(
+        RySchedule,
         theta=np.pi,
         t_start=qubit_t_end,
         freq=freq,
@@ -370,7 +379,7 @@ def y_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Ry)
+    qubit_info[0].append(Ry.q_schedule)
     qubit_info[1] = Ry.t_end + t_wait
 
 
@@ -414,7 +423,8 @@ def z_rule(
     qubit_t_end = max(qubit_info[1])
 
     # Construct the gate schedule
-    Rz = RzSchedule(
+    Rz = build_gate_schedule(
+        RzSchedule,
         theta=np.pi,
         t_start=qubit_t_end,
         freq=freq,
@@ -423,7 +433,7 @@ def z_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Rz)
+    qubit_info[0].append(Rz.q_schedule)
     qubit_info[1] = Rz.t_end + t_wait
 
 
@@ -466,7 +476,8 @@ def h_rule(
     qubit_info = circuit_schedule[str(qubit)]
     qubit_t_end = max([qubit_info[1] for qubit_info in circuit_schedule.values()])
 
-    Uxy1 = UxySchedule(
+    Uxy1 = build_gate_schedule(
+        UxySchedule,
         theta=np.pi / 2,
         phi=-np.pi / 2,
         t_start=qubit_t_end,
@@ -474,7 +485,8 @@ def h_rule(
         shape=shape,
         backend=kwargs["backend"],
     )
-    Uxy2 = UxySchedule(
+    Uxy2 = build_gate_schedule(
+        UxySchedule,
         theta=np.pi,
         t_start=Uxy1.t_end,
         freq=freq,
@@ -483,8 +495,8 @@ def h_rule(
     )
 
     # Update the circuit schedule
-    qubit_info[0].append(Uxy1)
-    qubit_info[0].append(Uxy2)
+    qubit_info[0].append(Uxy1.q_schedule)
+    qubit_info[0].append(Uxy2.q_schedule)
     qubit_info[1] = Uxy2.t_end + t_wait
 
 
@@ -536,7 +548,8 @@ def cuxy_rule(
     t_start = max(
         control_t_end, target_t_end, t_wait
     )  # We must wait for both qubits to be free
-    CUxy = CUxySchedule(
+    CUxy = build_gate_schedule(
+        CUxySchedule,
         t_start=t_start,
         theta=theta,
         phi=phi,
@@ -600,7 +613,8 @@ def cx_rule(
     t_start = max(
         control_t_end, target_t_end, t_wait
     )  # We must wait for both qubits to be free
-    CUxy = CUxySchedule(
+    CUxy = build_gate_schedule(
+        CUxySchedule,
         t_start=t_start,
         theta=theta,
         phi=phi,
@@ -663,8 +677,13 @@ def cp_rule(
     t_start = max(
         [qubit_info[1] for qubit_info in circuit_schedule.values()]
     )  # We must wait for both qubits to be free
-    CP = CphaseSchedule(
-        t_start=t_start, phi11=phi11, freq=freq, shape=shape, backend=kwargs["backend"]
+    CP = build_gate_schedule(
+        CphaseSchedule,
+        t_start=t_start,
+        phi11=phi11,
+        freq=freq,
+        shape=shape,
+        backend=kwargs["backend"],
     )
 
     circuit_schedule[str(ctrl)][0].append(CP.q_schedule[0])
@@ -721,8 +740,13 @@ def cz_rule(
     t_start = max(
         [qubit_info[1] for qubit_info in circuit_schedule.values()]
     )  # We must wait for both qubits to be free
-    CP = CphaseSchedule(
-        t_start=t_start, phi11=phi11, freq=freq, shape=shape, backend=kwargs["backend"]
+    CP = build_gate_schedule(
+        CphaseSchedule,
+        t_start=t_start,
+        phi11=phi11,
+        freq=freq,
+        shape=shape,
+        backend=kwargs["backend"],
     )
 
     print(kwargs["backend"])
@@ -780,7 +804,9 @@ def iswap_rule(
     t_start = max(
         [qubit_info[1] for qubit_info in circuit_schedule.values()]
     )  # We must wait for both qubits to be relaxed
-    XY = XYSchedule(t_start=t_start, freq=freq, shape=shape, backend=kwargs["backend"])
+    XY = build_gate_schedule(
+        XYSchedule, t_start=t_start, freq=freq, shape=shape, backend=kwargs["backend"]
+    )
 
     circuit_schedule[str(ctrl)][0].append(XY.q_schedule[0])
     circuit_schedule[str(targt)][0].append(XY.q_schedule[1])
@@ -837,8 +863,13 @@ def xy_rule(
     t_start = max(
         control_t_end, target_t_end, t_wait
     )  # We must wait for both qubits to be relaxed
-    XY = XYSchedule(
-        theta=theta, t_start=t_start, freq=freq, shape=shape, backend=kwargs["backend"]
+    XY = build_gate_schedule(
+        XYSchedule,
+        theta=theta,
+        t_start=t_start,
+        freq=freq,
+        shape=shape,
+        backend=kwargs["backend"],
     )
 
     circuit_schedule[str(ctrl)][0].append(XY.q_schedule[0])
@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+
+
+def uxy_pulses_rz(theta: float) -> List[Tuple[float, float]]:
+    return [(np.pi / 2, -np.pi / 2), (theta, 0), (np.pi / 2, np.pi / 2)]
+
+
+# (theta, phi) of the Uxy pulses that each transpilation rule emits, in time order
+SINGLE_QUBIT_PULSES = {
+    "uxy": lambda params: [(params[0], params[1])],
+    "rx": lambda params: [(params[0], 0)],
+    "ry": lambda params: [(params[0], -np.pi / 2)],
+    "rz": lambda params: uxy_pulses_rz(params[0]),
+    "x": lambda params: [(np.pi, 0)],
+    "y": lambda params: [(np.pi, -np.pi / 2)],
+    "z": lambda params: uxy_pulses_rz(np.pi),
+    "h": lambda params: [(np.pi / 2, -np.pi / 2), (np.pi, 0)],
+}
+
+
+def uxy_matrix(theta: float, phi: float) -> np.ndarray:
+    r"""Matriz de la compuerta Uxy (ver UxySchedule).
+
+    Args:
+        theta (float): Ángulo de rotación.
+        phi (float): Fase del pulso.
+
+    Returns:
+        np.ndarray: Matriz 2x2 de Uxy(theta, phi).
+    """
+    cos = np.cos(theta / 2)
+    sin = np.sin(theta / 2)
+    return np.array(
+        [
+            [cos, -1j * sin * np.exp(-1j * phi)],
+            [-1j * sin * np.exp(1j * phi), cos],
+        ]
+    )
+
+
+def su2_to_uxy(U: np.ndarray, atol: float = 1e-9) -> List[Tuple[float, float]]:
+    r"""Descompone una matriz de SU(2) en la mínima secuencia de pulsos Uxy.
+
+    La descomposición es exacta, sin fase global: el signo de U importa
+    porque los demás niveles del átomo (p.ej. el de Rydberg tras una
+    compuerta controlada) pueden estar poblados.
+
+    Escribiendo U = a I - i (b_x X + b_y Y + b_z Z):
+
+        -- Si U es la identidad no se necesita ningún pulso.
+        -- Si b_z = 0, U es una rotación sobre un eje del plano XY: un pulso.
+        -- Si no, U = Uxy(theta, phi_1) Uxy(theta, phi_2) con dos pulsos
+        del mismo ángulo y fases simétricas respecto al eje de (b_x, b_y).
+
+    Args:
+        U (np.ndarray): Matriz 2x2 de SU(2).
+        atol (float, optional): Tolerancia para decidir la secuencia. Defaults to 1e-9.
+
+    Returns:
+        List[Tuple[float, float]]: (theta, phi) de cada pulso en orden temporal.
+    """
+    a = np.real(U[0, 0] + U[1, 1]) / 2
+    bx = -np.imag(U[0, 1] + U[1, 0]) / 2
+    by = np.real(U[1, 0] - U[0, 1]) / 2
+    bz = np.imag(U[1, 1] - U[0, 0]) / 2
+
+    r = np.hypot(bx, by)
+    psi = np.arctan2(by, bx)
+
+    # el ángulo de U es lineal en |b| pero cuadrático en 1 - a
+    if a > 0 and np.hypot(r, bz) < atol:
+        return []
+
+    if abs(bz) < atol:
+        return [(2 * np.arctan2(r, a), psi)]
+
+    # 1 - a = |b|^2 / (1 + a) evita la cancelación cerca de la identidad
+    one_minus_a = (r**2 + bz**2) / (1 + a) if a > 0 else 1 - a
+
+    # 1 - a = 2 sin^2(theta/2) cos^2(delta/2), b_z = 2 sin^2(theta/2) sin(delta/2) cos(delta/2)
+    # y cos^2(theta/2) = r^2 / (2 (1 - a)): arctan2 no pierde precisión cerca de theta = pi
+    half_delta = np.arctan2(bz, one_minus_a)
+    theta = 2 * np.arctan2(np.hypot(one_minus_a, bz), r)
+
+    return [(theta, psi + half_delta), (theta, psi - half_delta)]
+
+
+def iter_fuse_single_qubit_gates(gates: Iterable[Tuple]) -> Iterator[Tuple]:
+    r"""Versión perezosa de fuse_single_qubit_gates: genera los datos de las
+    compuertas a medida que se consumen, guardando solo la matriz pendiente
+    de cada qubit.
+
+    Args:
+        gates (Iterable[Tuple]): Datos del circuito (extract_qc_data o iter_qc_data).
+
+    Yields:
+        Tuple: Datos de cada compuerta con las compuertas fusionadas.
+    """
+    pending: Dict[int, np.ndarray] = {}
+
+    def flush(qubit):
+        U = pending.pop(qubit, None)
+        if U is None:
+            return
+        for theta, phi in su2_to_uxy(U):
+            yield ("uxy", [theta, phi], 1, [qubit])
+
+    for gate in gates:
+        name, params, num_qubits, qubits = gate
+        if num_qubits == 1 and name in SINGLE_QUBIT_PULSES:
+            qubit = qubits[0]
+            U = pending.get(qubit, np.eye(2, dtype=complex))
+            for theta, phi in SINGLE_QUBIT_PULSES[name](params):
+                U = uxy_matrix(theta, phi) @ U
+            pending[qubit] = U
+            continue
+
+        for qubit in qubits:
+            yield from flush(qubit)
+        yield gate
+
+    for qubit in list(pending):
+        yield from flush(qubit)
+
+
+def fuse_single_qubit_gates(gates: List[Tuple]) -> List[Tuple]:
+    r"""Fusiona cada secuencia consecutiva de compuertas de un qubit sobre el
+    mismo qubit en un elemento de SU(2), y la reemplaza por la mínima secuencia
+    de compuertas 'uxy'.
+
+    Las compuertas de varios qubits y las barreras cierran las secuencias de
+    sus qubits. Las compuertas sin regla conocida de un qubit no se tocan.
+
+    Args:
+        gates (List[Tuple]): Lista de datos del circuito (extract_qc_data).
+
+    Returns:
+        List[Tuple]: Lista de datos del circuito con las compuertas fusionadas.
+    """
+    return list(iter_fuse_single_qubit_gates(gates))
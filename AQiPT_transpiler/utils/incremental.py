@@ -0,0 +1,297 @@
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.transpilation_rules import (
+    transpilation_rules as default_transp_rules,
+)
+from AQiPT_transpiler.rydberg_blocks.rydberg_schedules import RydbergRegisterSchedule
+from AQiPT_transpiler.config.core import BackendConfig, default_backend
+from AQiPT_transpiler.gate_schedules.gate_cache import fingerprint_scope
+from AQiPT_transpiler.utils.profiling import profile_stage
+from AQiPT_transpiler.utils.scheduling import GateRecord
+from AQiPT_transpiler.utils.transpiler_utils import (
+    ChannelAccumulator,
+    apply_gate,
+    circuit_schedule_init,
+    construct_register_schedule,
+    extract_qc_data,
+    gates_to_ryd,
+    get_transpilation_rule,
+    size_simulation,
+)
+
+
+class IncrementalSchedule:
+    r"""Circuito transpilado que se puede actualizar compuerta por compuerta.
+
+    Guarda, por cada compuerta, su GateRecord (las plantillas que agregó en
+    cada qubit y su intervalo de tiempo) y el tiempo en que cada qubit
+    quedaba libre antes de ella. Al cambiar los parámetros de una compuerta
+    (update_gate) solo se aplica su regla, se reemplazan sus plantillas y,
+    si cambió su duración, se desplazan las compuertas posteriores cuyo
+    inicio cambia; después solo se reconstruye la tabla de canales de los
+    qubits afectados.
+
+    La actualización incremental necesita la política "greedy" sin
+    fuse_single_qubit, virtual_z ni streaming (los pre-pasos cambian la
+    lista de compuertas y la reprogramación mueve todo el circuito); con
+    esas opciones update_gate vuelve a transpilar el circuito completo.
+
+    Args:
+        qc (RydbergQuantumCircuit): Circuito sin parámetros libres.
+        transpilation_rules (dict, optional): Reglas de transpilación a utilizar. Defaults to default_transp_rules.
+        backend (BackendConfig, optional): Configuración del backend a utilizar. Defaults to default_backend.
+
+    Raises:
+        ValueError: Si el circuito tiene parámetros libres.
+    """
+
+    def __init__(
+        self,
+        qc: RydbergQuantumCircuit,
+        transpilation_rules: dict = default_transp_rules,
+        backend: BackendConfig = default_backend,
+    ):
+        if qc.parameters:
+            raise ValueError(
+                "The circuit has free parameters, bind them before transpiling"
+            )
+
+        with profile_stage("extract_qc_data"):
+            gates = extract_qc_data(qc)
+        self._setup(gates, qc.qregs[0].size, transpilation_rules, backend)
+
+    @classmethod
+    def from_gates(
+        cls,
+        gates: List[tuple],
+        num_qubits: int,
+        transpilation_rules: dict = default_transp_rules,
+        backend: BackendConfig = default_backend,
+    ) -> "IncrementalSchedule":
+        r"""Construye el circuito transpilado a partir de sus datos
+        (extract_qc_data) con parámetros numéricos.
+
+        Args:
+            gates (List[tuple]): Datos del circuito, la lista se copia.
+            num_qubits (int): Número de qubits del circuito.
+            transpilation_rules (dict, optional): Reglas de transpilación a utilizar. Defaults to default_transp_rules.
+            backend (BackendConfig, optional): Configuración del backend a utilizar. Defaults to default_backend.
+
+        Returns:
+            IncrementalSchedule: Circuito transpilado.
+        """
+        incremental_schedule = cls.__new__(cls)
+        incremental_schedule._setup(
+            list(gates), num_qubits, transpilation_rules, backend
+        )
+        return incremental_schedule
+
+    def _setup(
+        self,
+        gates: List[tuple],
+        num_qubits: int,
+        transpilation_rules: dict,
+        backend: BackendConfig,
+    ) -> None:
+        self.num_qubits = num_qubits
+        self.transpilation_rules = transpilation_rules
+        self.backend_config = backend
+
+        transpiler_config = backend.transpiler_config
+        self.incremental = (
+            transpiler_config.scheduling == "greedy"
+            and not transpiler_config.fuse_single_qubit
+            and not transpiler_config.virtual_z
+            and not transpiler_config.streaming
+        )
+
+        self.gates = gates
+
+        self.records: List[GateRecord] = []
+        self._ready: List[Tuple[float, ...]] = []
+        self.circuit_schedule = None
+        self.schedule = None
+        self._build()
+
+    def _build(self) -> None:
+        if not self.incremental:
+            self.schedule = gates_to_ryd(
+                self.gates,
+                self.transpilation_rules,
+                self.num_qubits,
+                backend=self.backend_config,
+            )
+            return
+
+        circuit_schedule = circuit_schedule_init(self.num_qubits)
+        self.records = []
+        self._ready = []
+        with fingerprint_scope(self.backend_config):
+            for gate in self.gates:
+                self._ready.append(self._ready_times(circuit_schedule))
+                self.records.append(
+                    apply_gate(
+                        gate,
+                        self.transpilation_rules,
+                        circuit_schedule,
+                        backend=self.backend_config,
+                    )
+                )
+
+        self.circuit_schedule = circuit_schedule
+        backend = size_simulation(circuit_schedule, self.backend_config)
+        self.schedule = construct_register_schedule(
+            circuit_schedule, self.num_qubits, backend=backend
+        )
+
+    @staticmethod
+    def _ready_times(circuit_schedule: dict) -> Tuple[float, ...]:
+        return tuple(qubit_info[1] for qubit_info in circuit_schedule.values())
+
+    def _probe(self, index: int) -> Tuple[dict, GateRecord]:
+        # Apply the rule alone over the state of the register before the gate
+        probe = {str(q): [[], t_end] for q, t_end in enumerate(self._ready[index])}
+        record = apply_gate(
+            self.gates[index],
+            self.transpilation_rules,
+            probe,
+            backend=self.backend_config,
+        )
+        return probe, record
+
+    def update_gate(
+        self, index: int, params: Sequence[float]
+    ) -> RydbergRegisterSchedule:
+        r"""Cambia los parámetros de una compuerta y actualiza el schedule.
+
+        Args:
+            index (int): Posición de la compuerta en los datos del circuito
+            (extract_qc_data, incluye las barreras).
+            params (Sequence[float]): Nuevos parámetros de la compuerta.
+
+        Raises:
+            ValueError: Si la compuerta es una barrera.
+
+        Returns:
+            RydbergRegisterSchedule: Schedule actualizado (también en 'schedule').
+        """
+        return self.update_gates({index: params})
+
+    def update_gates(
+        self, updates: Dict[int, Sequence[float]]
+    ) -> RydbergRegisterSchedule:
+        r"""Cambia los parámetros de varias compuertas y actualiza el schedule.
+
+        Las compuertas se reemplazan en orden y la tabla de canales de los
+        qubits afectados se reconstruye una sola vez al final.
+
+        Args:
+            updates (Dict[int, Sequence[float]]): Nuevos parámetros de cada
+            compuerta, por su posición en los datos del circuito.
+
+        Raises:
+            ValueError: Si alguna de las compuertas es una barrera.
+
+        Returns:
+            RydbergRegisterSchedule: Schedule actualizado (también en 'schedule').
+        """
+        for index in updates:
+            name = self.gates[index][0]
+            if name == "barrier":
+                raise ValueError(f"Gate {index} is a barrier, it has no parameters")
+            get_transpilation_rule(name, self.transpilation_rules)
+
+        for index, params in updates.items():
+            name, _, num_qubits, qubits = self.gates[index]
+            self.gates[index] = (name, [float(p) for p in params], num_qubits, qubits)
+
+        if not self.incremental:
+            self._build()
+            return self.schedule
+
+        with profile_stage("update_gate"), fingerprint_scope(self.backend_config):
+            affected = set()
+            for index in sorted(updates):
+                probe = self._replace_gate(index)
+                if probe is None:
+                    # The rule placed a different number of templates
+                    self._build()
+                    return self.schedule
+
+                affected |= set(self.gates[index][3]) | self._retime(index, probe)
+            self._update_register(affected)
+
+        return self.schedule
+
+    def _replace_gate(self, index: int):
+        circuit_schedule = self.circuit_schedule
+        old = self.records[index]
+        probe, new = self._probe(index)
+
+        old_placements = sorted(old.placements)
+        new_placements = sorted(new.placements)
+        if Counter(q for q, _ in old_placements) != Counter(
+            q for q, _ in new_placements
+        ):
+            return None
+
+        for (q, k), (_, k_new) in zip(old_placements, new_placements):
+            circuit_schedule[str(q)][0][k] = probe[str(q)][0][k_new]
+        self.records[index] = old._replace(t_start=new.t_start, t_end=new.t_end)
+
+        return probe
+
+    @staticmethod
+    def _free_times(ready: list, probe: dict, qubits: List[int]) -> None:
+        for q in qubits:
+            ready[q] = probe[str(q)][1]
+
+    def _retime(self, index: int, probe: dict) -> set:
+        r"""Propaga los nuevos tiempos finales de la compuerta 'index' a las
+        compuertas posteriores, hasta que el registro vuelve a quedar libre
+        en los mismos tiempos que antes."""
+        circuit_schedule = self.circuit_schedule
+        affected = set()
+
+        ready = list(self._ready[index])
+        self._free_times(ready, probe, self.records[index].qubits)
+
+        for j in range(index + 1, len(self.gates)):
+            if tuple(ready) == self._ready[j]:
+                return affected
+            self._ready[j] = tuple(ready)
+
+            old = self.records[j]
+            if old.t_start is None:
+                continue
+
+            probe, new = self._probe(j)
+            delta_t = new.t_start - old.t_start
+            if delta_t != 0:
+                for q, k in old.placements:
+                    placement = circuit_schedule[str(q)][0][k]
+                    circuit_schedule[str(q)][0][k] = placement._replace(
+                        offset=placement.offset + delta_t
+                    )
+                affected |= set(old.qubits)
+            self.records[j] = old._replace(t_start=new.t_start, t_end=new.t_end)
+            self._free_times(ready, probe, old.qubits)
+
+        for q, t_end in enumerate(ready):
+            circuit_schedule[str(q)][1] = t_end
+        return affected
+
+    def _update_register(self, affected: set) -> None:
+        backend = size_simulation(self.circuit_schedule, self.backend_config)
+        if backend != self.schedule.backend_config:
+            # A new simulation window changes the timebase of every qubit
+            affected = set(range(self.num_qubits))
+
+        schedules = list(self.schedule.schedules)
+        for q in affected:
+            channels = ChannelAccumulator()
+            channels.add_placements(self.circuit_schedule[str(q)][0])
+            schedules[q] = channels.qubit_schedule(backend=backend)
+
+        self.schedule = RydbergRegisterSchedule(schedules, backend=backend)
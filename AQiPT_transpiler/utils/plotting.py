@@ -0,0 +1,69 @@
+from typing import Any, Optional, Tuple
+import numpy as np
+
+
+def figure_pixels(fig: Any) -> int:
+    r"""Ancho en pixeles de una figura de matplotlib.
+
+    Args:
+        fig (Any): Figura de matplotlib.
+
+    Returns:
+        int: Ancho de la figura en pixeles.
+    """
+    return int(np.ceil(fig.get_figwidth() * fig.dpi))
+
+
+def minmax_indices(values: np.ndarray, pixels: int) -> np.ndarray:
+    r"""Índices de la envolvente mínimo/máximo de 'values' en 'pixels' columnas.
+
+    Las muestras se dividen en 'pixels' grupos consecutivos y de cada uno se
+    conservan el mínimo y el máximo en su orden temporal, así la curva
+    dibujada cubre los mismos pixeles que la curva completa.
+
+    Args:
+        values (np.ndarray): Muestras reales.
+        pixels (int): Número de columnas (pixeles) del gráfico.
+
+    Returns:
+        np.ndarray: Índices ordenados de las muestras a dibujar.
+    """
+    n = len(values)
+    if n <= 2 * pixels:
+        return np.arange(n)
+
+    size = int(np.ceil(n / pixels))
+    n_full = n // size
+    body = np.asarray(values[: n_full * size]).reshape(n_full, size)
+    offsets = np.arange(n_full) * size
+    i_min = offsets + np.argmin(body, axis=1)
+    i_max = offsets + np.argmax(body, axis=1)
+
+    indices = [np.minimum(i_min, i_max), np.maximum(i_min, i_max)]
+    if n_full * size < n:
+        tail = np.asarray(values[n_full * size :])
+        indices.append(n_full * size + np.array([np.argmin(tail), np.argmax(tail)]))
+
+    indices = np.concatenate([np.stack(indices[:2], axis=1).ravel()] + indices[2:])
+    # Keep the first and last samples so the curve spans the whole window
+    return np.unique(np.concatenate([[0], indices, [n - 1]]))
+
+
+def minmax_decimate(
+    times: np.ndarray, values: np.ndarray, pixels: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Reduce una curva a su envolvente mínimo/máximo (ver minmax_indices).
+
+    Args:
+        times (np.ndarray): Base de tiempo.
+        values (np.ndarray): Muestras reales.
+        pixels (Optional[int]): Número de columnas del gráfico, None no reduce.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Tiempos y muestras a dibujar.
+    """
+    if pixels is None:
+        return times, values
+
+    indices = minmax_indices(values, pixels)
+    return times[indices], np.asarray(values)[indices]
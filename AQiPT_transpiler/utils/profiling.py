@@ -0,0 +1,252 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+import numpy as np
+
+
+class StageStats:
+    r"""Acumulado de una etapa de la transpilación.
+
+    Args:
+        name (str): Nombre de la etapa.
+
+    Attributes:
+        calls (int): Veces que se ejecutó la etapa.
+        time (float): Tiempo total (s), incluye las etapas anidadas.
+        allocated_bytes (int): Memoria neta reservada (tracemalloc) durante la etapa.
+        pulses (int): Pulsos (segmentos o arreglos) producidos por la etapa.
+        array_bytes (int): Bytes de los arreglos producidos por la etapa.
+    """
+
+    __slots__ = ("name", "calls", "time", "allocated_bytes", "pulses", "array_bytes")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.allocated_bytes = 0
+        self.pulses = 0
+        self.array_bytes = 0
+
+    def merge(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.time += other.time
+        self.allocated_bytes += other.allocated_bytes
+        self.pulses += other.pulses
+        self.array_bytes += other.array_bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "time": self.time,
+            "allocated_bytes": self.allocated_bytes,
+            "pulses": self.pulses,
+            "array_bytes": self.array_bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"StageStats({self.name}, calls={self.calls}, time={self.time:.6f}, "
+            f"allocated_bytes={self.allocated_bytes}, pulses={self.pulses}, "
+            f"array_bytes={self.array_bytes})"
+        )
+
+
+class TranspilationProfile:
+    r"""Reporte por etapa de una o varias transpilaciones.
+
+    Las etapas son 'extract_qc_data', 'rule:<compuerta>' (una por nombre de
+    compuerta), los pre-pasos ('virtual_z', 'fuse_single_qubit_gates',
+    'reschedule'), 'merge_pulses', 'construct_register_schedule',
+    'RydbergRegisterSchedule' y 'sampled_pulses'. Los tiempos son inclusivos:
+    'construct_register_schedule' contiene a 'merge_pulses'. En el modo
+    streaming 'extract_qc_data', 'virtual_z' y 'fuse_single_qubit_gates' se
+    miden paso a paso (profile_iter), cada una sin las demás.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageStats] = {}
+        self.total_time = 0.0
+
+    def stage(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        return stats
+
+    def merge(self, other: "TranspilationProfile") -> None:
+        r"""Suma el reporte 'other' a este, p.ej. para los resultados de
+        Transpiler.transpile_many."""
+        self.total_time += other.total_time
+        for name, stats in other.stages.items():
+            self.stage(name).merge(stats)
+
+    def top(self, n: int = 5, key: str = "time") -> List[StageStats]:
+        r"""Etapas con mayor 'key' (time, allocated_bytes, pulses o array_bytes).
+
+        Args:
+            n (int, optional): Número de etapas. Defaults to 5.
+            key (str, optional): Campo por el que se ordena. Defaults to "time".
+
+        Returns:
+            List[StageStats]: Etapas ordenadas de mayor a menor.
+        """
+        stages = sorted(
+            self.stages.values(), key=lambda stats: getattr(stats, key), reverse=True
+        )
+        return stages[:n]
+
+    def to_dict(self) -> dict:
+        return {
+            "total_time": self.total_time,
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+        }
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        r"""Exporta el reporte como JSON.
+
+        Args:
+            path (Optional[str], optional): Archivo donde se escribe. Defaults to None.
+            indent (int, optional): Indentación del JSON. Defaults to 2.
+
+        Returns:
+            str: Reporte en JSON.
+        """
+        data = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(data)
+        return data
+
+    def __repr__(self) -> str:
+        stages = "\n".join(f"    {stats!r}" for stats in self.top(len(self.stages)))
+        return f"TranspilationProfile(total_time={self.total_time:.6f},\n{stages}\n)"
+
+
+# Profile being recorded, set by profiling()
+_active_profile: Optional[TranspilationProfile] = None
+
+
+@contextmanager
+def profiling(trace_memory: bool = True) -> Iterator[TranspilationProfile]:
+    r"""Registra un TranspilationProfile de todo lo que se transpile dentro
+    del bloque.
+
+    Args:
+        trace_memory (bool, optional): Medir la memoria con tracemalloc
+        (más lento). Defaults to True.
+
+    Yields:
+        TranspilationProfile: Reporte que se llena dentro del bloque.
+    """
+    global _active_profile
+
+    previous = _active_profile
+    profile = TranspilationProfile()
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    _active_profile = profile
+    time_start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_time = time.perf_counter() - time_start
+        _active_profile = previous
+        if start_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[Optional[StageStats]]:
+    r"""Mide el tiempo y la memoria de una etapa si hay un profiling() activo.
+
+    Args:
+        name (str): Nombre de la etapa.
+
+    Yields:
+        Optional[StageStats]: Acumulado de la etapa para sumar pulsos y
+        bytes, o None si no hay profiling.
+    """
+    profile = _active_profile
+    if profile is None:
+        yield None
+        return
+
+    stats = profile.stage(name)
+    tracing = tracemalloc.is_tracing()
+    memory_start = tracemalloc.get_traced_memory()[0] if tracing else 0
+    time_start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.time += time.perf_counter() - time_start
+        stats.calls += 1
+        if tracing:
+            stats.allocated_bytes += tracemalloc.get_traced_memory()[0] - memory_start
+
+
+# Time and memory of the running profile_iter steps spent in nested steps
+_iter_steps: List[List[float]] = []
+
+
+def profile_iter(name: str, iterable: Iterable) -> Iterator:
+    r"""Recorre 'iterable' cargando el tiempo y la memoria de cada paso a la
+    etapa 'name' si hay un profiling() activo, para las etapas perezosas del
+    modo streaming. El recorrido completo cuenta como una llamada y el
+    tiempo de otros profile_iter anidados se carga solo a su propia etapa.
+
+    Args:
+        name (str): Nombre de la etapa.
+        iterable (Iterable): Iterador perezoso de la etapa.
+
+    Yields:
+        Any: Los elementos de 'iterable'.
+    """
+    profile = _active_profile
+    if profile is None:
+        yield from iterable
+        return
+
+    stats = profile.stage(name)
+    stats.calls += 1
+    tracing = tracemalloc.is_tracing()
+    iterator = iter(iterable)
+    while True:
+        _iter_steps.append([0.0, 0])
+        memory_start = tracemalloc.get_traced_memory()[0] if tracing else 0
+        time_start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            elapsed = time.perf_counter() - time_start
+            allocated = (
+                tracemalloc.get_traced_memory()[0] - memory_start if tracing else 0
+            )
+            nested_time, nested_bytes = _iter_steps.pop()
+            stats.time += elapsed - nested_time
+            stats.allocated_bytes += allocated - nested_bytes
+            if _iter_steps:
+                _iter_steps[-1][0] += elapsed
+                _iter_steps[-1][1] += allocated
+        yield item
+
+
+def count_pulses(pulses: dict) -> int:
+    r"""Número de pulsos de un diccionario de pulsos [pair, omega, pulso]."""
+    return sum(
+        1 if isinstance(value[2], np.ndarray) else len(value[2])
+        for value in pulses.values()
+    )
+
+
+def pulses_nbytes(pulses: dict) -> int:
+    r"""Bytes de los arreglos de un diccionario de pulsos [pair, omega, pulso]."""
+    return sum(
+        value[2].nbytes for value in pulses.values() if isinstance(value[2], np.ndarray)
+    )
@@ -0,0 +1,203 @@
+import json
+import struct
+import zipfile
+from typing import Optional
+import numpy as np
+
+from ..config.core import BackendConfig
+from ..rydberg_blocks.rydberg_schedules import (
+    RydbergQubitSchedule,
+    RydbergRegisterSchedule,
+)
+from ..rydberg_blocks.shaped_pulses import PulseSegment
+from .scheduling import SchedulingReport
+
+SCHEDULE_FORMAT_VERSION = 1
+
+# Member of the archive with the metadata (JSON) of the schedule
+_META = "__meta__"
+
+
+def _row_arrays(pulse, shapes: list) -> dict:
+    if isinstance(pulse, np.ndarray):
+        return {"waveform": pulse}
+
+    segments = np.array(
+        [[seg.t_start, seg.t_end, seg.amp, seg.phase] for seg in pulse],
+        dtype=float,
+    ).reshape(-1, 4)
+    shape_codes = []
+    for seg in pulse:
+        if seg.shape not in shapes:
+            shapes.append(seg.shape)
+        shape_codes.append(shapes.index(seg.shape))
+
+    return {"segments": segments, "shapes": np.array(shape_codes, dtype=np.uint8)}
+
+
+def save_register_schedule(
+    register_schedule: RydbergRegisterSchedule, path: str, compress: bool = False
+) -> None:
+    r"""Guarda un RydbergRegisterSchedule en un archivo .npz.
+
+    El archivo contiene los metadatos (backend, canales, reporte de
+    reprogramación y marco virtual-Z) en JSON y un arreglo por canal:
+    los segmentos como filas (t_start, t_end, amp, phase) con el código de
+    su forma, o la forma de onda si el canal ya está muestreado.
+
+    Args:
+        register_schedule (RydbergRegisterSchedule): Schedule a guardar.
+        path (str): Archivo de destino.
+        compress (bool, optional): Comprimir los arreglos (el archivo no se
+        puede cargar con mmap). Defaults to False.
+    """
+    arrays = {}
+    shapes = []
+    qubits = []
+    for i, schedule in enumerate(register_schedule.schedules):
+        qubit = {}
+        for funct_type, pulses in (
+            ("coupling", schedule.coupling_pulses),
+            ("detuning", schedule.detuning_pulses),
+        ):
+            rows = []
+            for key, (pair, omega, pulse) in pulses.items():
+                name = f"q{i}/{funct_type}/{key}"
+                row_arrays = _row_arrays(pulse, shapes)
+                for kind, array in row_arrays.items():
+                    arrays[f"{name}/{kind}"] = array
+                rows.append(
+                    {
+                        "key": key,
+                        "pair": [int(level) for level in pair],
+                        "omega": float(omega),
+                        "kind": "waveform" if "waveform" in row_arrays else "segments",
+                    }
+                )
+            qubit[funct_type] = rows
+        qubits.append(qubit)
+
+    report = register_schedule.scheduling_report
+    frame = register_schedule.virtual_z_frame
+    meta = {
+        "version": SCHEDULE_FORMAT_VERSION,
+        "backend": register_schedule.backend_config.model_dump_json(),
+        "shapes": shapes,
+        "qubits": qubits,
+        "scheduling_report": None if report is None else list(report),
+        "virtual_z_frame": None if frame is None else [float(beta) for beta in frame],
+    }
+    arrays[_META] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+    with open(path, "wb") as file:
+        if compress:
+            np.savez_compressed(file, **arrays)
+        else:
+            np.savez(file, **arrays)
+
+
+def _memmap_member(
+    path: str, archive: zipfile.ZipFile, name: str
+) -> Optional[np.ndarray]:
+    info = archive.getinfo(name + ".npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with open(path, "rb") as file:
+        # Local file header: 30 bytes, then the file name and the extra field
+        file.seek(info.header_offset)
+        header = file.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+
+    if dtype.hasobject or not shape or 0 in shape:
+        return None
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def load_register_schedule(
+    path: str, mmap: bool = False, backend: Optional[BackendConfig] = None
+) -> RydbergRegisterSchedule:
+    r"""Carga un RydbergRegisterSchedule guardado con save_register_schedule.
+
+    Solo usa numpy y la configuración: no importa matplotlib, qiskit ni el
+    emulador.
+
+    Args:
+        path (str): Archivo .npz.
+        mmap (bool, optional): Leer las formas de onda como np.memmap de solo
+        lectura en lugar de cargarlas (solo en archivos sin comprimir).
+        Defaults to False.
+        backend (Optional[BackendConfig], optional): Backend del schedule.
+        Defaults to None (el que se guardó).
+
+    Raises:
+        ValueError: Si el archivo es de una versión desconocida.
+
+    Returns:
+        RydbergRegisterSchedule: Schedule guardado.
+    """
+    with np.load(path) as data, zipfile.ZipFile(path) as archive:
+        meta = json.loads(data[_META].tobytes().decode())
+        if meta["version"] != SCHEDULE_FORMAT_VERSION:
+            raise ValueError(f"Unknown schedule format version {meta['version']}")
+
+        if backend is None:
+            backend = BackendConfig.model_validate_json(meta["backend"])
+        shapes = meta["shapes"]
+
+        schedules = []
+        for i, qubit in enumerate(meta["qubits"]):
+            pulses = {}
+            for funct_type in ("coupling", "detuning"):
+                pulses[funct_type] = {}
+                for row in qubit[funct_type]:
+                    name = f"q{i}/{funct_type}/{row['key']}"
+                    if row["kind"] == "waveform":
+                        pulse = None
+                        if mmap:
+                            pulse = _memmap_member(path, archive, f"{name}/waveform")
+                        if pulse is None:
+                            pulse = data[f"{name}/waveform"]
+                    else:
+                        segments = data[f"{name}/segments"]
+                        shape_codes = data[f"{name}/shapes"]
+                        pulse = [
+                            PulseSegment(t_start, t_end, shapes[code], amp, phase)
+                            for (t_start, t_end, amp, phase), code in zip(
+                                segments.tolist(), shape_codes.tolist()
+                            )
+                        ]
+                    pulses[funct_type][row["key"]] = [row["pair"], row["omega"], pulse]
+
+            schedules.append(
+                RydbergQubitSchedule(
+                    coupling_pulses=pulses["coupling"],
+                    detuning_pulses=pulses["detuning"],
+                    backend=backend,
+                )
+            )
+
+    register_schedule = RydbergRegisterSchedule(schedules, backend=backend)
+    if meta["scheduling_report"] is not None:
+        register_schedule.scheduling_report = SchedulingReport(
+            *meta["scheduling_report"]
+        )
+    register_schedule.virtual_z_frame = meta["virtual_z_frame"]
+
+    return register_schedule
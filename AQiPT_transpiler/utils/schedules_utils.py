@@ -1,45 +1,116 @@
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 import numpy as np
+from ..rydberg_blocks.shaped_pulses import sample_segments
 
 
-def merge_pulses(pulses: dict, name: str) -> dict:
+def merge_pulses(pulses: dict, name: str, times: Optional[np.ndarray] = None) -> dict:
     r"""Esta función une todas las descripciones funcionales de los
-    pulsos en una sola.
+    pulsos en una sola. Los pulsos descritos por segmentos se unen
+    concatenando sus listas de segmentos, sin muestrearlos.
+
+    Los pulsos se agrupan en un diccionario por (par, omega), en el orden
+    en que aparece cada grupo, así que el costo es lineal en el número de
+    pulsos. Los pulsos muestreados de un grupo se suman en el lugar sobre
+    un solo arreglo; si el grupo también tiene segmentos, se muestrean
+    sobre 'times' (la base de tiempo de los arreglos) y se suman.
 
     Args:
         pulses (dict): Pulsos que se van a unir.
         name (str): Nombre del pulso donde se van a contener.
+        times (Optional[np.ndarray], optional): Base de tiempo de los pulsos
+        muestreados. Defaults to None.
+
+    Raises:
+        ValueError: Si un grupo tiene arreglos de distinto largo, o mezcla
+        segmentos y arreglos sin una base de tiempo del mismo largo.
 
     Returns:
         dict: Acoples unidos.
     """
+    groups = {}
+    for value in pulses.values():
+        key = (tuple(value[0]), value[1])
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [value]
+        else:
+            group.append(value)
+
     coupling = {}
-    done = []
-    k = 0
+    for k, group in enumerate(groups.values()):
+        first = group[0]
+        if len(group) == 1:
+            coupling[name + str(k)] = first
+        else:
+            coupling[name + str(k)] = [first[0], first[1], _merge_group(group, times)]
 
-    values = list(pulses.values())
-    for i, vi in enumerate(values):
-        if i in done:
-            continue
-        v1 = vi
+    return coupling
 
-        for j, vj in enumerate(values):
-            if i == j:
-                continue
 
-            v2 = vj
+def _merge_group(
+    group: List[list], times: Optional[np.ndarray]
+) -> Union[list, np.ndarray]:
+    return add_pulses([value[2] for value in group], times, group[0][0])
 
-            # Matching the same levels of coupling
-            if v2[0] == v1[0] and v2[1] == v1[1]:
-                v1 = [v1[0], v1[1], np.add(v1[2], v2[2])]
-                vi = v1
-                done.append(j)
 
-        coupling[name + str(k)] = v1
-        done.append(i)
-        k += 1
+def add_pulses(
+    functions: List[Union[list, np.ndarray]],
+    times: Optional[np.ndarray],
+    pair: Optional[list] = None,
+) -> Union[list, np.ndarray]:
+    r"""Suma las descripciones funcionales de los pulsos de un mismo canal.
 
-    return coupling
+    Si todas son segmentos se concatenan en una lista nueva. Si alguna es un
+    arreglo muestreado, los segmentos se muestrean sobre 'times' y se suman
+    en un arreglo nuevo; las descripciones recibidas no se modifican.
+
+    Args:
+        functions (List[Union[list, np.ndarray]]): Segmentos o arreglos muestreados.
+        times (Optional[np.ndarray]): Base de tiempo de los arreglos muestreados.
+        pair (Optional[list], optional): Par del canal, para los mensajes de error. Defaults to None.
+
+    Raises:
+        ValueError: Si hay arreglos de distinto largo, o se mezclan segmentos
+        y arreglos sin una base de tiempo del mismo largo.
+
+    Returns:
+        Union[list, np.ndarray]: Segmentos o arreglo con la suma de los pulsos.
+    """
+    arrays = [function for function in functions if isinstance(function, np.ndarray)]
+    if not arrays:
+        merged = []
+        for function in functions:
+            merged.extend(function)
+        return merged
+
+    length = len(arrays[0])
+    if any(len(array) != length for array in arrays):
+        raise ValueError(
+            f"The sampled pulses of the channel {pair} have different lengths"
+        )
+
+    # Empty segment lists add nothing, the rest are sampled on the arrays timebase
+    functions = [function for function in functions if len(function)]
+    if len(functions) > len(arrays):
+        if times is None or len(times) != length:
+            raise ValueError(
+                f"The channel {pair} mixes segments and sampled arrays of "
+                f"{length} samples, the segments need a timebase of the same length"
+            )
+        functions = [
+            (
+                function
+                if isinstance(function, np.ndarray)
+                else sample_segments(function, times)
+            )
+            for function in functions
+        ]
+
+    dtype = np.result_type(*functions)
+    merged = np.array(functions[0], dtype=dtype)
+    for function in functions[1:]:
+        merged += function
+    return merged
 
 
 def coupling_detuning_constructors(
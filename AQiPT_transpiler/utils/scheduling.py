@@ -0,0 +1,162 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class GateRecord(NamedTuple):
+    r"""Registro de una compuerta aplicada sobre el circuit_schedule.
+
+    Args:
+        name (str): Nombre de la compuerta.
+        qubits (List[int]): Qubits de la compuerta.
+        placements (List[Tuple[int, int]]): (qubit, índice) de cada plantilla
+        que la regla agregó al circuit_schedule.
+        t_start (float): Tiempo de inicio dado por la regla.
+        t_end (float): Tiempo en el que los qubits quedan libres (incluye t_wait).
+    """
+
+    name: str
+    qubits: List[int]
+    placements: List[Tuple[int, int]]
+    t_start: Optional[float]
+    t_end: Optional[float]
+
+
+class SchedulingReport(NamedTuple):
+    r"""Resultado de reprogramar un circuito.
+
+    Args:
+        policy (str): Política usada, "asap" o "alap".
+        greedy_duration (float): Duración del circuito con el tiempo de cada
+        regla, retrasando las compuertas que una barrera obliga a esperar
+        (las reglas no ven las barreras, la reprogramación sí).
+        duration (float): Duración del circuito reprogramado.
+        saved (float): Duración ahorrada respecto a las reglas, redondeada a
+        SAVED_DECIMALS decimales.
+    """
+
+    policy: str
+    greedy_duration: float
+    duration: float
+    saved: float
+
+
+SCHEDULING_POLICIES = ["greedy", "asap", "alap"]
+
+# SchedulingReport.saved is rounded, so circuits that do not move report 0.0
+SAVED_DECIMALS = 12
+
+
+def _greedy_duration(
+    records: List[GateRecord], num_qubits: int, t_start: float
+) -> float:
+    # Rule start times, delayed only where a barrier synchronizes the qubits
+    ready = [t_start] * num_qubits
+    for record in records:
+        t_ready = max(ready[q] for q in record.qubits)
+        if record.t_start is not None:
+            t_ready = max(t_ready, record.t_start) + record.t_end - record.t_start
+        for q in record.qubits:
+            ready[q] = t_ready
+
+    return max(ready, default=t_start)
+
+
+def _asap(records: List[GateRecord], num_qubits: int, t_start: float) -> List[float]:
+    ready = [t_start] * num_qubits
+    starts = []
+    for record in records:
+        t_ready = max(ready[q] for q in record.qubits)
+        if record.t_start is None:
+            # Barrier: synchronize its qubits
+            starts.append(None)
+        else:
+            starts.append(t_ready)
+            t_ready += record.t_end - record.t_start
+        for q in record.qubits:
+            ready[q] = t_ready
+
+    return starts
+
+
+def _alap(
+    records: List[GateRecord], num_qubits: int, t_end: float
+) -> List[Optional[float]]:
+    latest = [t_end] * num_qubits
+    starts = [None] * len(records)
+    for i in reversed(range(len(records))):
+        record = records[i]
+        t_latest = min(latest[q] for q in record.qubits)
+        if record.t_start is not None:
+            t_latest -= record.t_end - record.t_start
+            starts[i] = t_latest
+        for q in record.qubits:
+            latest[q] = t_latest
+
+    return starts
+
+
+def reschedule(
+    circuit_schedule: dict,
+    records: List[GateRecord],
+    policy: str = "asap",
+    t_start: float = 0,
+) -> SchedulingReport:
+    r"""Reprograma los tiempos de inicio de las compuertas del circuit_schedule.
+
+    Las reglas de transpilación fijan el inicio de cada compuerta con su
+    propio criterio (p.ej. 'h' y 'cp' esperan a todo el registro). Esta
+    función recorre el DAG del circuito (las dependencias son los qubits
+    compartidos, en orden topológico) y mueve cada plantilla:
+
+        -- "asap": cada compuerta empieza apenas sus qubits quedan libres.
+        -- "alap": cada compuerta termina lo más tarde posible sin alargar
+        el circuito "asap".
+
+    Las barreras sincronizan a sus qubits. Las plantillas están en tiempo
+    relativo, así que solo cambian sus offsets.
+
+    Args:
+        circuit_schedule (dict): circuit_schedule construido por las reglas.
+        records (List[GateRecord]): Registro de compuertas de transpile_circ_sch.
+        policy (str, optional): "asap" o "alap". Defaults to "asap".
+        t_start (float, optional): Tiempo mínimo de inicio. Defaults to 0.
+
+    Raises:
+        ValueError: Si la política no existe.
+
+    Returns:
+        SchedulingReport: Duraciones antes y después de reprogramar.
+    """
+    if policy not in ("asap", "alap"):
+        raise ValueError(f"{policy} is not a valid scheduling policy")
+
+    num_qubits = len(circuit_schedule)
+    greedy_duration = _greedy_duration(records, num_qubits, t_start)
+
+    starts = _asap(records, num_qubits, t_start)
+    if policy == "alap":
+        ends = [
+            start + record.t_end - record.t_start
+            for start, record in zip(starts, records)
+            if start is not None
+        ]
+        starts = _alap(records, num_qubits, max(ends, default=t_start))
+
+    qubit_ends = [0] * num_qubits
+    for start, record in zip(starts, records):
+        if start is None:
+            continue
+        delta_t = start - record.t_start
+        for q, k in record.placements:
+            placement = circuit_schedule[str(q)][0][k]
+            circuit_schedule[str(q)][0][k] = placement._replace(
+                offset=placement.offset + delta_t
+            )
+        for q in record.qubits:
+            qubit_ends[q] = max(qubit_ends[q], start + record.t_end - record.t_start)
+
+    for q, t_end in enumerate(qubit_ends):
+        circuit_schedule[str(q)][1] = t_end
+
+    duration = max(qubit_ends, default=0)
+    saved = round(greedy_duration - duration, SAVED_DECIMALS) + 0.0
+    return SchedulingReport(policy, greedy_duration, duration, saved)
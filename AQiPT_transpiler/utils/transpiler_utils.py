@@ -1,4 +1,17 @@
-from typing import List, Tuple, Callable
+import warnings
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Callable,
+    Union,
+)
+import numpy as np
+from qiskit.circuit import Parameter, ParameterExpression
 from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
 from AQiPT_transpiler.transpilation_rules import (
     transpilation_rules as default_transp_rules,
@@ -7,8 +20,24 @@ from AQiPT_transpiler.rydberg_blocks.rydberg_schedules import (
     RydbergQubitSchedule,
     RydbergRegisterSchedule,
 )
-from AQiPT_transpiler.gate_schedules.uxy_schedule import CERO_FUNCTION
 from AQiPT_transpiler.config.core import BackendConfig, default_backend
+from AQiPT_transpiler.gate_schedules.gate_cache import fingerprint_scope
+from AQiPT_transpiler.utils.gate_fusion import (
+    fuse_single_qubit_gates,
+    iter_fuse_single_qubit_gates,
+)
+from AQiPT_transpiler.utils.virtual_z import iter_virtual_z, virtual_z
+from AQiPT_transpiler.utils.profiling import (
+    count_pulses,
+    profile_iter,
+    profile_stage,
+    pulses_nbytes,
+)
+from AQiPT_transpiler.utils.scheduling import (
+    GateRecord,
+    SCHEDULING_POLICIES,
+    reschedule,
+)
 
 
 def get_transpilation_rule(name: str, transpilation_rules: dict) -> Callable:
@@ -31,12 +60,37 @@ def get_transpilation_rule(name: str, transpilation_rules: dict) -> Callable:
         raise ValueError(f"No transpilation rule for {name}") from exc
 
 
+def iter_qc_data(
+    qc: RydbergQuantumCircuit,
+) -> Iterator[Tuple[str, List[float], int, List[int]]]:
+    r"""Versión perezosa de extract_qc_data: genera los datos de cada
+    compuerta del circuito a medida que se consumen.
+
+    Args:
+        qc (RydbergQuantumCircuit): Circuito donde se sacarán los datos
+
+    Yields:
+        Tuple[str, List[float], int, List[int]]: Nombre, parámetros, número de
+        qubits e índices de los qubits de la compuerta.
+    """
+    for d in qc.data:
+        name = d.operation.name
+        params = [
+            float(p) if isinstance(p, ParameterExpression) and not p.parameters else p
+            for p in d.operation.params
+        ]
+        num_qubits = d.operation.num_qubits
+        qubits = [d.qubits[i].index for i in range(0, num_qubits)]
+        yield (name, params, num_qubits, qubits)
+
+
 def extract_qc_data(
     qc: RydbergQuantumCircuit,
 ) -> List[Tuple[str, List[float], int, List[int]]]:
     r"""Extrae los datos de un RydbergQuantumCircuit y los retorna
     en una lista que contiene el nombre, lista de parametros, numero de qubits
-    y lista de los indices de qubits.
+    y lista de los indices de qubits. Los parámetros ya asignados se
+    convierten a float, los libres se dejan como ParameterExpression.
 
     Args:
         qc (RydbergQuantumCircuit): Circuito donde se sacarán los datos
@@ -44,25 +98,19 @@ def extract_qc_data(
     Returns:
         List[Tuple[str, List[float], int, List[int]]]: Lista de datos
     """
-    gates = []
-
-    for d in qc.data:
-        name = d.operation.name
-        params = d.operation.params
-        num_qubits = d.operation.num_qubits
-        qubits = [d.qubits[i].index for i in range(0, num_qubits)]
-        gates.append((name, params, num_qubits, qubits))
-
-    return gates
+    return list(iter_qc_data(qc))
 
 
 def circuit_schedule_init(num_qubits: int) -> dict:
     r"""Inicializa la estructura auxiliar del circuit schedule
 
     circuit_schedule = {
-        "Qubit_#" : [ List[Schedules] , t_end ]
+        "Qubit_#" : [ List[PlacedQubitSchedule] , t_end ]
     }
 
+    Cada PlacedQubitSchedule es la plantilla en tiempo relativo de una
+    compuerta junto con el tiempo donde empieza.
+
     Args:
         num_qubits (int): Número de qubits del circuito.
 
@@ -77,8 +125,62 @@ def circuit_schedule_init(num_qubits: int) -> dict:
     return circuit_schedule
 
 
+def apply_gate(
+    gate: Tuple, transpilation_rules: dict, circuit_schedule: dict, **kwargs
+) -> GateRecord:
+    r"""Aplica la regla de transpilación de una compuerta sobre el circuit_schedule.
+
+    Args:
+        gate (Tuple): Datos de la compuerta (name, params, num_qubits, qubits).
+        transpilation_rules (dict): Reglas de transpilación a utilizar.
+        circuit_schedule (dict): circuit_schedule donde se agrega la compuerta.
+
+    Returns:
+        GateRecord: Plantillas que agregó la regla y tiempos de la compuerta
+        (t_start None para las barreras).
+    """
+    name, params, num_qubits, qubits = gate
+    if name == "barrier":
+        return GateRecord(name, qubits, [], None, None)
+
+    apply_rule = get_transpilation_rule(name, transpilation_rules)
+    args = {
+        "name": name,
+        "params": params,
+        "num_qubits": num_qubits,
+        "qubits": qubits,
+        "circuit_schedule": circuit_schedule,
+    }
+    sizes = [len(circuit_schedule[str(q)][0]) for q in qubits]
+    with profile_stage(f"rule:{name}") as stats:
+        apply_rule(**args, **kwargs)
+
+    placements = [
+        (q, k)
+        for q, size in zip(qubits, sizes)
+        for k in range(size, len(circuit_schedule[str(q)][0]))
+    ]
+    if stats is not None:
+        for q, k in placements:
+            q_schedule = circuit_schedule[str(q)][0][k].q_schedule
+            stats.pulses += count_pulses(q_schedule.coupling_pulses)
+            stats.pulses += count_pulses(q_schedule.detuning_pulses)
+
+    t_start = min(
+        (circuit_schedule[str(q)][0][k].offset for q, k in placements), default=None
+    )
+    t_end = max(circuit_schedule[str(q)][1] for q in qubits)
+    return GateRecord(name, qubits, placements, t_start, t_end)
+
+
 def transpile_circ_sch(
-    gates: list, transpilation_rules: dict, num_qubits: int, **kwargs
+    gates: list,
+    transpilation_rules: dict,
+    num_qubits: int,
+    gate_log: Optional[List[GateRecord]] = None,
+    frame: Optional[List[float]] = None,
+    channels: Optional[List["ChannelAccumulator"]] = None,
+    **kwargs,
 ) -> dict:
     r"""Transpila el circuito sobre un circuit_schedule.
 
@@ -86,32 +188,178 @@ def transpile_circ_sch(
         gates (list): Lista de los datos del circuito.
         transpilation_rules (dict): Reglas de transpilación disponibles.
         num_qubits (int): Número de qubits.
+        gate_log (Optional[List[GateRecord]], optional): Si se da, se agrega un
+        GateRecord por compuerta (y barrera) para poder reprogramar el circuito.
+        frame (Optional[List[float]], optional): Si se da, se llena con el ángulo
+        del marco de fase final de cada qubit (ver virtual_z).
+        channels (Optional[List[ChannelAccumulator]], optional): Si se da
+        (modo streaming), los pulsos de cada compuerta se suman de inmediato
+        al acumulador de su qubit y las plantillas no se guardan en el
+        circuit_schedule. 'gates' puede ser un iterador.
+
+    Si TranspilerConfig.virtual_z está activo, 'rz' y 'z' se vuelven cambios
+    del marco de fase (virtual_z). Si TranspilerConfig.fuse_single_qubit está
+    activo, las secuencias de compuertas de un qubit se fusionan
+    (fuse_single_qubit_gates).
 
     Returns:
         dict: circuit_schedule con todo el circuito transpilado.
     """
+    backend = kwargs.get("backend", default_backend)
+    streaming = channels is not None
+    if backend.transpiler_config.virtual_z:
+        if streaming:
+            if frame is None:
+                frame = [0.0] * num_qubits
+            gates = profile_iter("virtual_z", iter_virtual_z(gates, frame))
+        else:
+            with profile_stage("virtual_z"):
+                gates, final_frame = virtual_z(gates, num_qubits)
+            if frame is not None:
+                frame[:] = final_frame
+    if backend.transpiler_config.fuse_single_qubit:
+        if streaming:
+            gates = profile_iter(
+                "fuse_single_qubit_gates", iter_fuse_single_qubit_gates(gates)
+            )
+        else:
+            with profile_stage("fuse_single_qubit_gates"):
+                gates = fuse_single_qubit_gates(gates)
+
     circuit_schedule = circuit_schedule_init(num_qubits)
-    for gate in gates:
-        name, params, num_qubits, qubits = gate
-        if name == "barrier":
-            continue
-        apply_rule = get_transpilation_rule(name, transpilation_rules)
-        args = {
-            "name": name,
-            "params": params,
-            "num_qubits": num_qubits,
-            "qubits": qubits,
-            "circuit_schedule": circuit_schedule,
-        }
-        apply_rule(**args, **kwargs)
+    with fingerprint_scope(backend):
+        for gate in gates:
+            record = apply_gate(gate, transpilation_rules, circuit_schedule, **kwargs)
+            if gate_log is not None:
+                gate_log.append(record)
+            if record.t_start is None:
+                continue
+
+            if streaming:
+                # Move the new templates to the accumulators and drop them
+                for q in record.qubits:
+                    qubit_schedules = circuit_schedule[str(q)][0]
+                    channels[q].add_placements(qubit_schedules)
+                    qubit_schedules.clear()
 
     return circuit_schedule
 
 
+class ChannelAccumulator:
+    r"""Tabla de canales de un qubit: una fila por canal (par de niveles,
+    frecuencia) con todos sus segmentos en tiempo absoluto.
+
+    Cada fila termina como un solo pulso del RydbergQubitSchedule, así el
+    número de términos del Hamiltoniano depende de los canales y no de las
+    compuertas. En el modo streaming de transpile_circ_sch cada plantilla
+    ubicada se suma de inmediato a su canal, así la memoria depende del
+    número de canales y pulsos, no de las compuertas.
+    """
+
+    def __init__(self) -> None:
+        self.coupling = {}
+        self.detuning = {}
+
+    def _add(self, pulses: dict, offset: float, channels: dict) -> None:
+        for pair, omega, segments in pulses.values():
+            key = (tuple(pair), omega)
+            channel = channels.get(key)
+            if channel is None:
+                channel = channels[key] = [pair, omega, []]
+            for seg in segments:
+                channel[2].append(seg.shifted(offset))
+
+    def add_placements(self, placements: Iterable) -> None:
+        r"""Suma los pulsos de las plantillas ubicadas (PlacedQubitSchedule).
+
+        Args:
+            placements (Iterable): Plantillas ubicadas de un qubit.
+        """
+        for q_schedule, offset in placements:
+            q_schedule = q_schedule.q_schedule
+            self._add(q_schedule.coupling_pulses, offset, self.coupling)
+            self._add(q_schedule.detuning_pulses, offset, self.detuning)
+
+    def shortest_pulse(
+        self, min_width: float = 0.0, min_amplitude: float = 0.0
+    ) -> Optional[float]:
+        r"""Duración del pulso más corto de los canales (ver _pulse_widths).
+
+        Args:
+            min_width (float, optional): Duración mínima de los pulsos
+            considerados. Defaults to 0.0.
+            min_amplitude (float, optional): Amplitud mínima (en valor absoluto)
+            de los pulsos considerados. Defaults to 0.0.
+
+        Returns:
+            Optional[float]: Duración del pulso más corto, None si no hay pulsos.
+        """
+        widths = [
+            width
+            for channels in (self.coupling, self.detuning)
+            for channel in channels.values()
+            for width in _pulse_widths(channel[2], min_width, min_amplitude)
+        ]
+        return min(widths) if widths else None
+
+    @staticmethod
+    def _pulses(channels: dict, name: str) -> dict:
+        return {f"{name}{i}": channel for i, channel in enumerate(channels.values())}
+
+    def qubit_schedule(self, **kwargs) -> RydbergQubitSchedule:
+        r"""Construye el RydbergQubitSchedule del qubit con un pulso por canal.
+
+        Returns:
+            RydbergQubitSchedule: Schedule del qubit.
+        """
+        if not self.coupling and not self.detuning:
+            qubit_couplings = {"Coupling0": [[0, 1], 0, []]}
+            return RydbergQubitSchedule(
+                coupling_pulses=qubit_couplings,
+                detuning_pulses=qubit_couplings,
+                **kwargs,
+            )
+
+        return RydbergQubitSchedule(
+            coupling_pulses=self._pulses(self.coupling, "Coupling"),
+            detuning_pulses=self._pulses(self.detuning, "Detuning"),
+            **kwargs,
+        )
+
+
+def channels_register_schedule(
+    channels: List[ChannelAccumulator], **kwargs
+) -> RydbergRegisterSchedule:
+    r"""Convierte los acumuladores del modo streaming en un RydbergRegisterSchedule.
+
+    Args:
+        channels (List[ChannelAccumulator]): Acumulador de cada qubit.
+
+    Returns:
+        RydbergRegisterSchedule: Contiene todo el schedule del circuito.
+    """
+    with profile_stage("construct_register_schedule") as stats:
+        register_schedule = [channel.qubit_schedule(**kwargs) for channel in channels]
+
+        if stats is not None:
+            for qubit_schedule in register_schedule:
+                stats.pulses += count_pulses(qubit_schedule.coupling_pulses)
+                stats.pulses += count_pulses(qubit_schedule.detuning_pulses)
+
+    with profile_stage("RydbergRegisterSchedule"):
+        register_sch = RydbergRegisterSchedule(register_schedule, **kwargs)
+
+    return register_sch
+
+
 def construct_register_schedule(
     circuit_schedule: dict, num_qubits: int, **kwargs
 ) -> RydbergRegisterSchedule:
-    r"""Función que convierte un circuit_schedule en un RydbergRegisterSchedule
+    r"""Función que convierte un circuit_schedule en un RydbergRegisterSchedule.
+
+    Las plantillas de las compuertas están en tiempo relativo; aquí se
+    ubican en la línea de tiempo del registro en una sola pasada y se
+    agrupan en la tabla de canales de cada qubit (ChannelAccumulator).
 
     Args:
         circuit_schedule (dict): circuit_schedule que contienen el circuito
@@ -121,56 +369,209 @@ def construct_register_schedule(
     Returns:
         RydbergRegisterSchedule: Contiene todo el schedule del circuito.
     """
-    register_schedule = []
-    for i in range(0, num_qubits):
-        # get the list of schedules of the qubit
+    with profile_stage("construct_register_schedule") as stats:
+        register_schedule = []
+        for i in range(0, num_qubits):
+            # get the list of placed templates of the qubit
+            channels = ChannelAccumulator()
+            channels.add_placements(circuit_schedule[str(i)][0])
 
-        qubit_schedules = circuit_schedule[str(i)][0]
-        qubit_couplings = {}
-        qubit_detunings = {}
-        if qubit_schedules != []:
-            q_couplings = [q_s.q_schedule.coupling_pulses for q_s in qubit_schedules]
+            register_schedule.append(channels.qubit_schedule(**kwargs))
 
-            for j, q_c in enumerate(q_couplings):
-                for i, value in enumerate(q_c.values()):
-                    pair = value[0]
-                    freq = value[1]
-                    func = value[2]
-                    qubit_couplings[f"Coupling{i+j}"] = [pair, freq, func]
+        if stats is not None:
+            for qubit_schedule in register_schedule:
+                stats.pulses += count_pulses(qubit_schedule.coupling_pulses)
+                stats.pulses += count_pulses(qubit_schedule.detuning_pulses)
+                stats.array_bytes += pulses_nbytes(qubit_schedule.coupling_pulses)
+                stats.array_bytes += pulses_nbytes(qubit_schedule.detuning_pulses)
 
-            q_detunings = [q_s.q_schedule.detuning_pulses for q_s in qubit_schedules]
+    with profile_stage("RydbergRegisterSchedule"):
+        register_sch = RydbergRegisterSchedule(register_schedule, **kwargs)
 
-            for j, q_c in enumerate(q_detunings):
-                for i, value in enumerate(q_c.values()):
-                    pair = value[0]
-                    freq = value[1]
-                    func = value[2]
+    return register_sch
 
-                    qubit_detunings[f"Detuning{i+j}"] = [pair, freq, func]
 
-            # Construct qubit schedule
-            qubit_schedule = RydbergQubitSchedule(
-                coupling_pulses=qubit_couplings,
-                detuning_pulses=qubit_detunings,
-                **kwargs,
+def circuit_end_time(circuit_schedule: dict) -> float:
+    r"""Tiempo en el que termina el circuito transpilado.
+
+    Args:
+        circuit_schedule (dict): circuit_schedule con el circuito transpilado.
+
+    Returns:
+        float: Mayor tiempo final de todos los qubits.
+    """
+    return max(qubit_info[1] for qubit_info in circuit_schedule.values())
+
+
+def _pulse_widths(segments: list, min_width: float, min_amplitude: float) -> list:
+    # Pulses shorter than min_width or weaker than min_amplitude (e.g. from
+    # near-zero rotation angles) do not set the sampling of the window
+    return [
+        seg.t_end - seg.t_start
+        for seg in segments
+        if seg.t_end - seg.t_start > 0
+        and seg.t_end - seg.t_start >= min_width
+        and abs(seg.amp) > min_amplitude
+    ]
+
+
+def shortest_pulse(
+    circuit_schedule: dict, min_width: float = 0.0, min_amplitude: float = 0.0
+) -> Optional[float]:
+    r"""Duración del pulso más corto del circuito transpilado.
+
+    Args:
+        circuit_schedule (dict): circuit_schedule con el circuito transpilado.
+        min_width (float, optional): Duración mínima de los pulsos considerados.
+        Defaults to 0.0.
+        min_amplitude (float, optional): Amplitud mínima (en valor absoluto) de
+        los pulsos considerados. Defaults to 0.0.
+
+    Returns:
+        Optional[float]: Duración del pulso más corto, None si no hay pulsos.
+    """
+    widths = [
+        width
+        for qubit_info in circuit_schedule.values()
+        for q_schedule, _ in qubit_info[0]
+        for pulses in (
+            q_schedule.q_schedule.coupling_pulses,
+            q_schedule.q_schedule.detuning_pulses,
+        )
+        for value in pulses.values()
+        for width in _pulse_widths(value[2], min_width, min_amplitude)
+    ]
+    return min(widths) if widths else None
+
+
+def size_simulation(
+    circuit_schedule: dict,
+    backend: BackendConfig,
+    channels: Optional[List[ChannelAccumulator]] = None,
+) -> BackendConfig:
+    r"""Ajusta la ventana de simulación al circuito transpilado.
+
+    Si SimulationConfig.auto_size está activo retorna un nuevo backend con
+    'time_simulation' igual al final del circuito y 'sampling' tal que el
+    pulso más corto tenga 'samples_per_pulse' muestras. Los pulsos más
+    cortos que 'min_pulse_width' o con amplitud menor o igual que
+    'min_pulse_amplitude' no se consideran, y 'sampling' se limita a
+    'max_sampling' (con una advertencia). Si no, advierte cuando el circuito
+    no cabe en la ventana de simulación.
+
+    Args:
+        circuit_schedule (dict): circuit_schedule con el circuito transpilado.
+        backend (BackendConfig): Configuración del backend.
+        channels (Optional[List[ChannelAccumulator]], optional): Acumuladores
+        del modo streaming, de donde se toma el pulso más corto. Defaults to None.
+
+    Returns:
+        BackendConfig: Backend con la ventana de simulación a usar.
+    """
+    simulation_config = backend.simulation_config
+    t_end = circuit_end_time(circuit_schedule)
+
+    if not simulation_config.auto_size:
+        if t_end > simulation_config.time_simulation:
+            warnings.warn(
+                f"The circuit ends at {t_end:0.5f} but time_simulation is "
+                f"{simulation_config.time_simulation}, pulses after it are truncated"
             )
-        else:
-            qubit_couplings = {
-                "Coupling0": [
-                    [0, 1],
-                    0,
-                    CERO_FUNCTION(backend=kwargs["backend"]).function,
-                ]
-            }
-            qubit_schedule = RydbergQubitSchedule(
-                coupling_pulses=qubit_couplings,
-                detuning_pulses=qubit_couplings,
-                **kwargs,
+        return backend
+
+    thresholds = (
+        simulation_config.min_pulse_width,
+        simulation_config.min_pulse_amplitude,
+    )
+    if channels is not None:
+        widths = [ch.shortest_pulse(*thresholds) for ch in channels]
+        widths = [width for width in widths if width is not None]
+        min_width = min(widths) if widths else None
+    else:
+        min_width = shortest_pulse(circuit_schedule, *thresholds)
+    if min_width is None or t_end <= 0:
+        return backend
+
+    sampling = int(np.ceil(t_end / min_width * simulation_config.samples_per_pulse) + 1)
+    if sampling > simulation_config.max_sampling:
+        warnings.warn(
+            f"The shortest pulse ({min_width:0.3e}) needs {sampling} samples, "
+            f"sampling is clamped to max_sampling={simulation_config.max_sampling}"
+        )
+        sampling = simulation_config.max_sampling
+    simulation_config = simulation_config.model_copy(
+        update={"time_simulation": t_end, "sampling": sampling}
+    )
+    return backend.model_copy(update={"simulation_config": simulation_config})
+
+
+def gates_to_ryd(
+    gates: Iterable,
+    transpilation_rules: dict,
+    num_qubits: int,
+    backend: BackendConfig = default_backend,
+) -> RydbergRegisterSchedule:
+    r"""Transpila la lista de datos de un circuito y la devuelve en su forma
+    RydbergRegisterSchedule, reprogramando las compuertas según
+    TranspilerConfig.scheduling. Con TranspilerConfig.streaming los pulsos se
+    acumulan por canal a medida que se transpila cada compuerta.
+
+    Args:
+        gates (Iterable): Datos del circuito, una lista o un iterador (streaming).
+        transpilation_rules (dict): Reglas de transpilación a utilizar.
+        num_qubits (int): Número de qubits del circuito.
+        backend (BackendConfig, optional): Configuración del backend a utilizar. Defaults to default_backend.
+
+    Raises:
+        ValueError: Si la política de TranspilerConfig.scheduling no existe.
+        ValueError: Si se pide reprogramar el circuito en modo streaming.
+
+    Returns:
+        RydbergRegisterSchedule: Schedule del circuito transpilado.
+    """
+    transpiler_config = backend.transpiler_config
+    policy = transpiler_config.scheduling
+    if policy not in SCHEDULING_POLICIES:
+        raise ValueError(f"{policy} is not a valid scheduling policy")
+
+    channels = None
+    if transpiler_config.streaming:
+        if policy != "greedy":
+            raise ValueError(
+                f"{policy} scheduling needs every gate template, "
+                "it is not available with streaming"
             )
+        channels = [ChannelAccumulator() for _ in range(num_qubits)]
 
-        register_schedule.append(qubit_schedule)
+    gate_log = [] if policy != "greedy" else None
+    frame = [0.0] * num_qubits if transpiler_config.virtual_z else None
+    circuit_schedule = transpile_circ_sch(
+        gates,
+        transpilation_rules,
+        num_qubits,
+        gate_log=gate_log,
+        frame=frame,
+        channels=channels,
+        backend=backend,
+    )
 
-    return RydbergRegisterSchedule(register_schedule, **kwargs)
+    report = None
+    if gate_log is not None:
+        with profile_stage("reschedule"):
+            report = reschedule(
+                circuit_schedule, gate_log, policy, t_start=transpiler_config.t_start
+            )
+
+    backend = size_simulation(circuit_schedule, backend, channels)
+    if channels is not None:
+        register_sch = channels_register_schedule(channels, backend=backend)
+    else:
+        register_sch = construct_register_schedule(
+            circuit_schedule, num_qubits, backend=backend
+        )
+    register_sch.scheduling_report = report
+    register_sch.virtual_z_frame = frame
+    return register_sch
 
 
 def qc_to_ryd(
@@ -189,13 +590,153 @@ def qc_to_ryd(
     Returns:
         RydbergRegisterSchedule: Schedule del circuito transpilado.
     """
-    gates = extract_qc_data(qc)
+    if backend.transpiler_config.streaming:
+        gates = profile_iter("extract_qc_data", iter_qc_data(qc))
+    else:
+        with profile_stage("extract_qc_data"):
+            gates = extract_qc_data(qc)
     num_qubits = qc.qregs[0].size
-    circuit_schedule = {}
-    circuit_schedule = transpile_circ_sch(
-        gates, transpilation_rules, num_qubits, backend=backend
-    )
-    register_sch = construct_register_schedule(
-        circuit_schedule, num_qubits, backend=backend
-    )
-    return register_sch
+    return gates_to_ryd(gates, transpilation_rules, num_qubits, backend=backend)
+
+
+def bind_gate_params(params: list, values: Dict[Parameter, float]) -> List[float]:
+    r"""Evalúa los parámetros de una compuerta con los valores dados.
+
+    Args:
+        params (list): Parámetros de la compuerta, numéricos o ParameterExpression.
+        values (Dict[Parameter, float]): Valor de cada Parameter del circuito.
+
+    Returns:
+        List[float]: Parámetros numéricos de la compuerta.
+    """
+    bound = []
+    for param in params:
+        if isinstance(param, Parameter):
+            param = values[param]
+        elif isinstance(param, ParameterExpression):
+            param = float(param.bind({p: values[p] for p in param.parameters}))
+        bound.append(param)
+
+    return bound
+
+
+class RydbergScheduleTemplate:
+    r"""Plantilla de un RydbergQuantumCircuit con parámetros libres (qiskit Parameter).
+
+    La extracción de datos del circuito y la búsqueda de las reglas de
+    transpilación se hacen una sola vez. El primer 'bind' transpila el
+    circuito completo y guarda sus plantillas ubicadas (IncrementalSchedule);
+    los siguientes solo vuelven a aplicar las reglas de las compuertas que
+    dependen de parámetros, reubican las compuertas posteriores solo si
+    cambió la duración de alguna y reconstruyen los canales de los qubits
+    afectados. Con una política de reprogramación distinta de "greedy",
+    fuse_single_qubit, virtual_z o streaming cada 'bind' transpila el
+    circuito completo (ver IncrementalSchedule).
+
+    Args:
+        qc (RydbergQuantumCircuit): Circuito con parámetros libres.
+        transpilation_rules (dict, optional): Reglas de transpilación a utilizar. Defaults to default_transp_rules.
+        backend (BackendConfig, optional): Configuración del backend a utilizar. Defaults to default_backend.
+    """
+
+    def __init__(
+        self,
+        qc: RydbergQuantumCircuit,
+        transpilation_rules: dict = default_transp_rules,
+        backend: BackendConfig = default_backend,
+    ):
+        self.parameters = list(qc.parameters)
+        self.num_qubits = qc.qregs[0].size
+        self.transpilation_rules = transpilation_rules
+        self.backend_config = backend
+
+        self.gates = []
+        self._bound_gates = []  # Indices of the gates that depend on parameters
+        with profile_stage("extract_qc_data"):
+            qc_data = extract_qc_data(qc)
+        for gate in qc_data:
+            name, params, num_qubits, qubits = gate
+            if name == "barrier":
+                # Kept: asap/alap rescheduling synchronises the qubits on them
+                self.gates.append(gate)
+                continue
+            # Fail early if the circuit can not be transpiled
+            get_transpilation_rule(name, transpilation_rules)
+
+            if any(isinstance(p, ParameterExpression) for p in params):
+                self._bound_gates.append(len(self.gates))
+            else:
+                params = [float(p) for p in params]
+            self.gates.append((name, params, num_qubits, qubits))
+
+        self._incremental = None  # IncrementalSchedule of the last bind
+
+    def _values_dict(
+        self, values: Union[Dict[Parameter, float], Sequence[float]]
+    ) -> Dict[Parameter, float]:
+        if isinstance(values, dict):
+            missing = [p for p in self.parameters if p not in values]
+            if missing:
+                raise ValueError(f"Missing values for parameters {missing}")
+            return {p: float(values[p]) for p in self.parameters}
+
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values) != len(self.parameters):
+            raise ValueError(
+                f"Expected {len(self.parameters)} values, got {len(values)}"
+            )
+        return dict(zip(self.parameters, values.tolist()))
+
+    def bind(
+        self, values: Union[Dict[Parameter, float], Sequence[float]]
+    ) -> RydbergRegisterSchedule:
+        r"""Construye el schedule del circuito para un conjunto de parámetros.
+
+        Args:
+            values (Union[Dict[Parameter, float], Sequence[float]]): Diccionario
+            {Parameter: valor} o secuencia de valores en el orden de 'parameters'.
+
+        Returns:
+            RydbergRegisterSchedule: Schedule del circuito transpilado.
+        """
+        # incremental.py builds on this module, import it when it is used
+        from AQiPT_transpiler.utils.incremental import IncrementalSchedule
+
+        values = self._values_dict(values)
+        bound = {
+            i: bind_gate_params(self.gates[i][1], values) for i in self._bound_gates
+        }
+
+        if self._incremental is None:
+            gates = list(self.gates)
+            for i, params in bound.items():
+                name, _, num_qubits, qubits = gates[i]
+                gates[i] = (name, params, num_qubits, qubits)
+            self._incremental = IncrementalSchedule.from_gates(
+                gates,
+                self.num_qubits,
+                self.transpilation_rules,
+                backend=self.backend_config,
+            )
+            return self._incremental.schedule
+
+        return self._incremental.update_gates(bound)
+
+    def bind_batch(self, values: np.ndarray) -> List[RydbergRegisterSchedule]:
+        r"""Construye un schedule por cada fila de 'values'. Cada fila se
+        obtiene actualizando el schedule de la anterior (ver 'bind').
+
+        Args:
+            values (np.ndarray): Arreglo de forma (n_sets, n_parameters).
+
+        Returns:
+            List[RydbergRegisterSchedule]: Schedules en el mismo orden de 'values'.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape(-1, len(self.parameters))
+
+        return [self.bind(row) for row in values]
+
+    def __call__(self, values) -> RydbergRegisterSchedule:
+        return self.bind(values)
@@ -0,0 +1,80 @@
+from typing import Iterable, Iterator, List, Tuple
+import numpy as np
+
+from AQiPT_transpiler.utils.gate_fusion import SINGLE_QUBIT_PULSES
+
+# Rotation angle of the phase frame for each virtual gate (rz = Rz(-theta), see RzSchedule)
+VIRTUAL_Z_ANGLES = {
+    "rz": lambda params: -params[0],
+    "z": lambda params: -np.pi,
+}
+
+# Gates whose pulses and interactions commute with the frame. The frame is a
+# phase on the levels 1 and 3, so only pulses on [0, 1] and [0, 3] change;
+# cp/cz only drive [1, 3] and their interaction is diagonal.
+FRAME_COMMUTING_GATES = ["cp", "cz"]
+
+
+def iter_virtual_z(gates: Iterable[Tuple], frame: List[float]) -> Iterator[Tuple]:
+    r"""Versión perezosa de virtual_z: genera los datos de las compuertas a
+    medida que se consumen y actualiza 'frame' en el lugar.
+
+    Args:
+        gates (Iterable[Tuple]): Datos del circuito (extract_qc_data o iter_qc_data).
+        frame (List[float]): Ángulo beta del marco de cada qubit, inicialmente ceros.
+
+    Yields:
+        Tuple: Datos de cada compuerta sin compuertas virtuales.
+    """
+    for gate in gates:
+        name, params, num_qubits, qubits = gate
+
+        if name in VIRTUAL_Z_ANGLES:
+            qubit = qubits[0]
+            frame[qubit] += VIRTUAL_Z_ANGLES[name](params)
+            continue
+
+        if num_qubits == 1 and name in SINGLE_QUBIT_PULSES:
+            beta = frame[qubits[0]]
+            if beta == 0:
+                yield gate
+                continue
+            for theta, phi in SINGLE_QUBIT_PULSES[name](params):
+                yield ("uxy", [theta, phi - beta], 1, qubits)
+            continue
+
+        if name not in FRAME_COMMUTING_GATES and name != "barrier":
+            for qubit in qubits:
+                if frame[qubit] != 0:
+                    # Restore the frame with a physical rz
+                    yield ("rz", [-frame[qubit]], 1, [qubit])
+                    frame[qubit] = 0.0
+
+        yield gate
+
+
+def virtual_z(gates: List[Tuple], num_qubits: int) -> Tuple[List[Tuple], List[float]]:
+    r"""Implementa las compuertas 'rz' y 'z' como cambios del marco de fase
+    de cada qubit (virtual-Z), sin pulsos.
+
+    Con el marco R_z(beta) pendiente, Uxy(theta, phi) R_z(beta) =
+    R_z(beta) Uxy(theta, phi - beta), así que las compuertas de un qubit
+    posteriores se emiten como 'uxy' con la fase corrida. Las compuertas
+    que conmutan con el marco (FRAME_COMMUTING_GATES) y las barreras lo
+    dejan pasar; ante cualquier otra compuerta se emite un 'rz' físico que
+    devuelve el marco a cero.
+
+    El marco que queda al final no se aplica: el estado final difiere en
+    R_z(beta) por qubit, lo que no cambia las poblaciones.
+
+    Args:
+        gates (List[Tuple]): Lista de datos del circuito (extract_qc_data).
+        num_qubits (int): Número de qubits.
+
+    Returns:
+        Tuple[List[Tuple], List[float]]: Lista de datos del circuito sin
+        compuertas virtuales y ángulo beta del marco final de cada qubit.
+    """
+    frame = [0.0] * num_qubits
+    framed = list(iter_virtual_z(gates, frame))
+    return framed, frame
@@ -0,0 +1,113 @@
+import itertools
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Optional
+import numpy as np
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        # Already removed with the directory (cleanup)
+        pass
+
+
+class WaveformStore:
+    r"""Directorio temporal con archivos np.memmap donde se guardan los
+    pulsos muestreados, para schedules que no caben en memoria.
+
+    Cada pulso se escribe una sola vez y se lee como una vista np.memmap de
+    solo lectura. El archivo de un pulso se borra cuando se libera su última
+    vista, y el directorio con cleanup() o cuando el objeto deja de existir.
+
+    Args:
+        directory (Optional[str], optional): Directorio donde se crea el
+        directorio temporal. Defaults to None (el de tempfile).
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="aqipt_waveforms_", dir=directory)
+        self._count = itertools.count()
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+
+    def allocate(self, name: str, dtype: type, length: int) -> np.ndarray:
+        r"""Crea un archivo nuevo para un pulso de 'length' muestras y retorna
+        su np.memmap de escritura, que se llena por bloques y se cierra con
+        seal().
+
+        Args:
+            name (str): Prefijo del archivo.
+            dtype (type): Tipo de las muestras.
+            length (int): Número de muestras.
+
+        Returns:
+            np.ndarray: np.memmap de escritura (un arreglo vacío si length es
+            0, np.memmap no admite archivos vacíos).
+        """
+        if length == 0:
+            return np.empty(0, dtype=dtype)
+
+        # A new file per pulse: truncating a mapped file would break its views
+        path = os.path.join(self.directory, f"{name}_{next(self._count)}.dat")
+        return np.memmap(path, dtype=dtype, mode="w+", shape=(length,))
+
+    @staticmethod
+    def seal(out: np.ndarray) -> np.ndarray:
+        r"""Escribe en disco un pulso creado con allocate() y retorna su vista
+        de solo lectura. El archivo se borra cuando se libera la última vista
+        (o con cleanup()), nunca mientras está mapeado.
+
+        Args:
+            out (np.ndarray): np.memmap de escritura retornado por allocate().
+
+        Returns:
+            np.ndarray: np.memmap de solo lectura con el contenido de 'out'.
+        """
+        if not isinstance(out, np.memmap):
+            return out
+
+        path, dtype, shape = out.filename, out.dtype, out.shape
+        out.flush()
+        del out
+
+        view = np.memmap(path, dtype=dtype, mode="r", shape=shape)
+        # Every view and slice shares the mmap of 'view'
+        weakref.finalize(view._mmap, _remove_file, path)
+        return view
+
+    def write(self, name: str, array: np.ndarray) -> np.ndarray:
+        r"""Escribe 'array' en un archivo nuevo y retorna su vista de solo lectura.
+
+        Args:
+            name (str): Prefijo del archivo.
+            array (np.ndarray): Pulso muestreado.
+
+        Returns:
+            np.ndarray: np.memmap de solo lectura con el contenido de 'array'
+            ('array' si está vacío).
+        """
+        if array.size == 0:
+            return array
+
+        out = self.allocate(name, array.dtype, array.size)
+        out[:] = array.ravel()
+        return self.seal(out).reshape(array.shape)
+
+    def nbytes(self) -> int:
+        r"""Bytes ocupados en disco por los pulsos del directorio."""
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.is_file()
+        )
+
+    def cleanup(self) -> None:
+        r"""Borra el directorio y todos sus archivos."""
+        self._finalizer()
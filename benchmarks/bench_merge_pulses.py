@@ -0,0 +1,82 @@
+r"""Benchmark de merge_pulses con miles de pulsos por qubit.
+
+Mide merge_pulses sobre un qubit con tres pares de niveles y dos
+frecuencias, con pulsos descritos por segmentos y por arreglos, y la
+transpilación completa de un circuito con miles de compuertas en un qubit.
+
+Uso (desde la raíz del repositorio): PYTHONPATH=. python benchmarks/bench_merge_pulses.py
+"""
+
+import time
+
+import numpy as np
+
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import PulseSegment
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.schedules_utils import merge_pulses
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+
+PAIRS = ([0, 1], [1, 2], [0, 2])
+OMEGAS = (1.0, 2.0)
+
+
+def best_of(function, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - time_start)
+    return min(times)
+
+
+def segment_pulses(n_pulses: int) -> dict:
+    return {
+        f"Coupling{i}": [
+            PAIRS[i % len(PAIRS)],
+            OMEGAS[i % len(OMEGAS)],
+            [PulseSegment(i * 1e-3, (i + 0.5) * 1e-3, "square", 1.0)],
+        ]
+        for i in range(n_pulses)
+    }
+
+
+def array_pulses(n_pulses: int, samples: int) -> dict:
+    waveform = np.linspace(0, 1, samples)
+    return {
+        f"Coupling{i}": [PAIRS[i % len(PAIRS)], OMEGAS[i % len(OMEGAS)], waveform]
+        for i in range(n_pulses)
+    }
+
+
+def transpile_time(n_gates: int) -> float:
+    qc = RydbergQuantumCircuit(1)
+    for i in range(n_gates):
+        if i % 2:
+            qc.rx(0.1 + 1e-4 * i, 0)
+        else:
+            qc.ry(0.2, 0)
+    backend = BackendConfig(simulation_config=SimulationConfig(auto_size=True))
+    return best_of(lambda: qc_to_ryd(qc, backend=backend), repeat=3)
+
+
+def main() -> None:
+    print("merge_pulses, segments")
+    for n_pulses in (1000, 3000, 10000, 30000):
+        pulses = segment_pulses(n_pulses)
+        elapsed = best_of(lambda: merge_pulses(pulses, "Coupling"))
+        print(f"  {n_pulses:6d} pulses: {elapsed * 1e3:8.2f} ms")
+
+    print("merge_pulses, arrays of 20001 samples")
+    for n_pulses in (300, 1000, 3000):
+        pulses = array_pulses(n_pulses, 20001)
+        elapsed = best_of(lambda: merge_pulses(pulses, "Coupling"))
+        print(f"  {n_pulses:6d} pulses: {elapsed * 1e3:8.2f} ms")
+
+    print("qc_to_ryd, one qubit")
+    for n_gates in (1000, 3000, 10000):
+        print(f"  {n_gates:6d} gates:  {transpile_time(n_gates) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
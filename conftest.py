@@ -0,0 +1,31 @@
+# Makes the repository root importable (AQiPT_transpiler, AQiPT) when running pytest
+import numpy as np
+import pytest
+
+
+def _channels(schedule, funct_type):
+    return {
+        (tuple(pair), omega): funct
+        for pair, omega, funct in schedule.sampled_pulses(funct_type).values()
+    }
+
+
+@pytest.fixture
+def assert_same_schedule():
+    r"""Compara dos RydbergRegisterSchedule por su ventana de simulación y los
+    pulsos muestreados de cada canal."""
+
+    def compare(schedule, expected, atol=1e-12):
+        assert schedule.backend_config == expected.backend_config
+        assert len(schedule.schedules) == len(expected.schedules)
+        for q_schedule, q_expected in zip(schedule.schedules, expected.schedules):
+            for funct_type in ("coupling", "detuning"):
+                channels = _channels(q_schedule, funct_type)
+                expected_channels = _channels(q_expected, funct_type)
+                assert channels.keys() == expected_channels.keys()
+                for key, funct in channels.items():
+                    np.testing.assert_allclose(
+                        funct, expected_channels[key], atol=atol, rtol=0
+                    )
+
+    return compare
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+import qutip as qt
+
+from AQiPT_transpiler.Transpiler import Transpiler
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+
+# Populations of |00>, |01>, |10>, |11> after qft(2) from |00>
+SAMPLED_QFT = [0.2679, 0.2696, 0.2711, 0.1780]
+ANALYTIC_QFT = [0.2704, 0.2702, 0.2702, 0.1760]
+
+
+def _qft_populations(**kwargs):
+    qc = RydbergQuantumCircuit(2)
+    qc.qft(2)
+    simulation_config = SimulationConfig(time_simulation=0.4, sampling=2000, **kwargs)
+    transpiler = Transpiler(
+        backend_config=BackendConfig(simulation_config=simulation_config)
+    )
+    transpiler.transpile(qc)
+    register = transpiler.build_transpiled_circuit(init_state=qt.basis(16, 0))
+    state = register.atomic_register.simRes.states[-1]
+    if state.isoper:
+        populations = np.real(np.diag(state.full()))
+    else:
+        populations = np.abs(state.full().ravel()) ** 2
+    return populations[[0, 1, 4, 5]]
+
+
+def test_default_keeps_sampled_results():
+    assert not SimulationConfig().analytic_coefficients
+    np.testing.assert_allclose(_qft_populations(), SAMPLED_QFT, atol=5e-4)
+
+
+@pytest.mark.parametrize(
+    "analytic, expected", [(False, SAMPLED_QFT), (True, ANALYTIC_QFT)]
+)
+def test_qft_populations(analytic, expected):
+    populations = _qft_populations(analytic_coefficients=analytic)
+    np.testing.assert_allclose(populations, expected, atol=5e-4)
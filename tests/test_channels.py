@@ -0,0 +1,61 @@
+from AQiPT_transpiler.config.core import BackendConfig
+from AQiPT_transpiler.transpilation_rules import transpilation_rules
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import (
+    construct_register_schedule,
+    extract_qc_data,
+    transpile_circ_sch,
+)
+
+BACKEND = BackendConfig()
+
+
+def _circuit():
+    # 'xy' and 'cuxy' templates both start their keys at Coupling0, the
+    # [1, 3] pulses of 'cuxy' used to overwrite those of 'xy'
+    qc = RydbergQuantumCircuit(2)
+    qc.xy(0.7, 0, 1)
+    qc.cuxy(0.4, 0.3, 0, 1)
+    qc.rx(0.2, 1)
+    qc.xy(1.1, 0, 1)
+    return qc
+
+
+def _fields(segments):
+    return [(seg.t_start, seg.t_end, seg.shape, seg.amp, seg.phase) for seg in segments]
+
+
+def _expected_channels(placements, funct_type):
+    # Every pulse of the placed templates, in absolute time, by (pair, omega)
+    channels = {}
+    for placement in placements:
+        pulses = getattr(placement.q_schedule.q_schedule, f"{funct_type}_pulses")
+        for pair, omega, segments in pulses.values():
+            channel = channels.setdefault((tuple(pair), omega), [])
+            channel.extend(_fields(seg.shifted(placement.offset) for seg in segments))
+    return channels
+
+
+def _channels(pulses):
+    keys = [(tuple(pair), omega) for pair, omega, _ in pulses.values()]
+    assert len(keys) == len(set(keys))
+    return {(tuple(pair), omega): _fields(seg) for pair, omega, seg in pulses.values()}
+
+
+def test_one_channel_per_pair_and_frequency():
+    circuit_schedule = transpile_circ_sch(
+        extract_qc_data(_circuit()), transpilation_rules, 2, backend=BACKEND
+    )
+
+    register_schedule = construct_register_schedule(
+        circuit_schedule, 2, backend=BACKEND
+    )
+
+    for qubit, q_schedule in enumerate(register_schedule.schedules):
+        placements = circuit_schedule[str(qubit)][0]
+        coupling = _channels(q_schedule.coupling_pulses)
+        assert coupling == _expected_channels(placements, "coupling")
+        # The [1, 3] pair is driven by 'cuxy' and by the 'xy' interaction
+        assert sum(pair == (1, 3) for pair, _ in coupling) > 1
+        detuning = _channels(q_schedule.detuning_pulses)
+        assert detuning == _expected_channels(placements, "detuning")
@@ -0,0 +1,78 @@
+import numpy as np
+
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    default_backend,
+)
+from AQiPT_transpiler.gate_schedules import gate_cache
+from AQiPT_transpiler.gate_schedules.gate_cache import (
+    GateScheduleCache,
+    backend_fingerprint,
+    fingerprint_scope,
+)
+from AQiPT_transpiler.gate_schedules.uxy_schedule import UxySchedule
+
+
+def _template(cache, theta, backend=default_backend):
+    return cache.template(
+        UxySchedule, theta=theta, phi=0.0, freq=1, shape="square", backend=backend
+    )
+
+
+def test_hits_misses_and_evictions():
+    cache = GateScheduleCache(maxsize=2)
+
+    first = _template(cache, 0.1)
+    assert _template(cache, 0.1) is first
+    _template(cache, 0.2)
+    _template(cache, 0.3)  # evicts theta=0.1, the least recently used
+    assert _template(cache, 0.1) is not first
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 4, 2)
+    assert (info.maxsize, info.currsize) == (2, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_rounded_parameters_share_a_template():
+    cache = GateScheduleCache(decimals=6)
+
+    first = _template(cache, 0.1)
+    assert _template(cache, 0.1 + 1e-9) is first
+    assert _template(cache, np.float64(0.1)) is first
+    assert _template(cache, 0.1 + 1e-3) is not first
+
+
+def test_maxsize_zero_stores_nothing():
+    cache = GateScheduleCache(maxsize=0)
+
+    assert _template(cache, 0.1) is not _template(cache, 0.1)
+    assert cache.cache_info() == (0, 2, 0, 0, 0)
+
+
+def test_backends_that_differ_have_distinct_keys():
+    cache = GateScheduleCache()
+    other = BackendConfig(simulation_config=SimulationConfig(sampling=1234))
+
+    first = _template(cache, 0.1)
+    second = _template(cache, 0.1, backend=other)
+
+    assert first is not second
+    assert second.backend_config is other
+    key = cache.key(UxySchedule, theta=0.1, backend=other)
+    assert key[-1] == other.model_dump_json()
+    assert key != cache.key(UxySchedule, theta=0.1, backend=default_backend)
+
+
+def test_fingerprint_is_computed_once_per_scope():
+    other = BackendConfig(simulation_config=SimulationConfig(sampling=1234))
+
+    with fingerprint_scope(default_backend) as fingerprint:
+        assert gate_cache._active_fingerprint == (default_backend, fingerprint)
+        assert backend_fingerprint(default_backend) is fingerprint
+        # Other backends are not taken from the scope
+        assert backend_fingerprint(other) == other.model_dump_json()
+    assert gate_cache._active_fingerprint is None
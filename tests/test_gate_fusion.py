@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.utils.gate_fusion import (
+    SINGLE_QUBIT_PULSES,
+    fuse_single_qubit_gates,
+    su2_to_uxy,
+    uxy_matrix,
+    uxy_pulses_rz,
+)
+
+ATOL = 1e-9
+# su2_to_uxy compara |b| = sin(theta/2) con atol: el límite es theta = 2 atol
+
+
+def _product(pulses):
+    U = np.eye(2, dtype=complex)
+    for theta, phi in pulses:
+        U = uxy_matrix(theta, phi) @ U
+    return U
+
+
+def _gate_unitaries(gates, num_qubits):
+    # Producto de las compuertas de un qubit de cada qubit, en orden temporal
+    unitaries = [np.eye(2, dtype=complex) for _ in range(num_qubits)]
+    for name, params, _, qubits in gates:
+        pulses = SINGLE_QUBIT_PULSES[name](params)
+        unitaries[qubits[0]] = _product(pulses) @ unitaries[qubits[0]]
+    return unitaries
+
+
+def _random_gates(rng, length, qubit=0):
+    gates = []
+    for name in rng.choice(sorted(SINGLE_QUBIT_PULSES), size=length):
+        params = list(rng.uniform(-2 * np.pi, 2 * np.pi, size=2))
+        gates.append((name, params, 1, [qubit]))
+    return gates
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fused_unitary_matches_gate_product(seed):
+    rng = np.random.default_rng(seed)
+    gates = _random_gates(rng, rng.integers(1, 12))
+
+    fused = fuse_single_qubit_gates(gates)
+
+    assert len(fused) <= 2
+    assert all(name == "uxy" for name, *_ in fused)
+    np.testing.assert_allclose(
+        _gate_unitaries(fused, 1)[0], _gate_unitaries(gates, 1)[0], atol=1e-12
+    )
+
+
+def test_runs_are_closed_by_multi_qubit_gates():
+    rng = np.random.default_rng(0)
+    first = _random_gates(rng, 4, qubit=0) + _random_gates(rng, 3, qubit=1)
+    second = _random_gates(rng, 5, qubit=0)
+    gates = first + [("cz", [], 2, [0, 1])] + second
+
+    fused = fuse_single_qubit_gates(gates)
+
+    split = fused.index(("cz", [], 2, [0, 1]))
+    before, after = fused[:split], fused[split + 1 :]
+    for expected, result in zip(_gate_unitaries(first, 2), _gate_unitaries(before, 2)):
+        np.testing.assert_allclose(result, expected, atol=1e-12, rtol=0)
+    np.testing.assert_allclose(
+        _gate_unitaries(after, 1)[0], _gate_unitaries(second, 1)[0], atol=1e-12
+    )
+
+
+def _near_degenerate(eps):
+    rz = _product(uxy_pulses_rz(eps))
+    return {
+        "rz": rz,
+        "rx": uxy_matrix(eps, 0),
+        "xy": uxy_matrix(eps, 0.3) @ rz,
+        "near_z": _product(uxy_pulses_rz(np.pi)) @ uxy_matrix(eps, 0.7),
+        "near_x": uxy_matrix(np.pi, 0.2) @ _product(uxy_pulses_rz(eps)),
+        "near_minus_identity": _product(uxy_pulses_rz(2 * np.pi + eps)),
+    }
+
+
+@pytest.mark.parametrize("eps", [1e-3, 1e-5, 1e-7, 4 * ATOL, 2.02 * ATOL])
+@pytest.mark.parametrize(
+    "case", ["rz", "rx", "xy", "near_z", "near_x", "near_minus_identity"]
+)
+def test_near_degenerate_decomposition_is_exact(eps, case):
+    U = _near_degenerate(eps)[case]
+
+    pulses = su2_to_uxy(U, atol=ATOL)
+
+    assert len(pulses) <= 2
+    np.testing.assert_allclose(_product(pulses), U, atol=1e-12, rtol=0)
+
+
+@pytest.mark.parametrize("eps", [1.98 * ATOL, 1e-12])
+@pytest.mark.parametrize(
+    "case", ["rz", "rx", "xy", "near_z", "near_x", "near_minus_identity"]
+)
+def test_below_atol_error_is_bounded(eps, case):
+    U = _near_degenerate(eps)[case]
+
+    pulses = su2_to_uxy(U, atol=ATOL)
+
+    np.testing.assert_allclose(_product(pulses), U, atol=ATOL, rtol=0)
+
+
+@pytest.mark.parametrize("eps", [1.98 * ATOL, 1e-12])
+def test_identity_within_atol_needs_no_pulse(eps):
+    assert su2_to_uxy(uxy_matrix(eps, 0.4), atol=ATOL) == []
+    assert su2_to_uxy(_product(uxy_pulses_rz(eps)), atol=ATOL) == []
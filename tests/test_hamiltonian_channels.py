@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+import qutip as qt
+
+from AQiPT.modules.emulator import AQiPTemulator as emulator
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import (
+    PulseSegment,
+    SegmentCoefficient,
+)
+
+TIMES = np.linspace(0, 1, 401)
+# Sample times and points between them
+EVAL_TIMES = [0.0, 0.1, 0.2525, 0.33, 0.5, 0.6125, 0.75, 0.9, 1.0]
+
+OP_01 = qt.basis(3, 0) * qt.basis(3, 1).dag()
+OP_12 = qt.basis(3, 1) * qt.basis(3, 2).dag()
+
+
+def _complex_arrays():
+    return [
+        (OP_01, 0.5 * 2 * np.pi, np.exp(1j * 3 * TIMES) * np.sin(np.pi * TIMES)),
+        (OP_01, 0.5 * 4.0, (1 + 0.5j) * TIMES**2),
+    ]
+
+
+def _real_arrays():
+    return [
+        (OP_12, 0.5 * 2 * np.pi, np.cos(2 * np.pi * TIMES)),
+        (OP_12, 0.5, TIMES.copy()),
+    ]
+
+
+def _segments():
+    return [
+        (
+            OP_01,
+            0.5 * 2 * np.pi,
+            SegmentCoefficient(
+                [
+                    PulseSegment(0.1, 0.4, "gaussian", 1.3, 0.4),
+                    PulseSegment(0.55, 0.85, "square", 0.8),
+                ]
+            ),
+        ),
+        (
+            OP_01,
+            0.5 * 3.0,
+            SegmentCoefficient([PulseSegment(0.2, 0.7, "gaussian", 0.6, -1.1)]),
+        ),
+        (OP_12, 0.5, SegmentCoefficient([PulseSegment(0.3, 0.6, "square", 2.0)])),
+    ]
+
+
+def _unfolded(pairs):
+    terms = []
+    for op, scale, coeff in pairs:
+        terms.append([scale * op, coeff])
+        terms.append([scale * op.dag(), emulator.conjugateCoefficient(coeff)])
+    return terms
+
+
+def _folded(pairs):
+    channels = emulator.hamiltonianChannels()
+    for op, scale, coeff in pairs:
+        channels.addHermitianPair(id(op), op, scale, coeff)
+    return channels.terms()
+
+
+def _assert_same_hamiltonian(terms, expected):
+    H = qt.QobjEvo([qt.num(3)] + terms, tlist=TIMES)
+    H_expected = qt.QobjEvo([qt.num(3)] + expected, tlist=TIMES)
+    for t in EVAL_TIMES:
+        np.testing.assert_allclose(H(t).full(), H_expected(t).full(), atol=1e-12)
+        assert H(t).isherm
+
+
+@pytest.mark.parametrize(
+    "pairs, num_terms",
+    [
+        # X and Y of OP_01
+        (_complex_arrays, 2),
+        # Real arrays: X of OP_12 only
+        (_real_arrays, 1),
+        # X and Y of OP_01, X of OP_12 (the square pulse has no phase)
+        (_segments, 3),
+    ],
+)
+def test_folded_terms_match_hermitian_pairs(pairs, num_terms):
+    terms = _folded(pairs())
+
+    assert len(terms) == num_terms < len(_unfolded(pairs()))
+    _assert_same_hamiltonian(terms, _unfolded(pairs()))
+
+
+def test_folded_segment_coefficients_keep_closed_form():
+    terms = _folded(_segments())
+
+    for _, coeff in terms:
+        assert emulator.isPiecewiseCoefficient(coeff) == coeff.is_piecewise_constant
+        np.testing.assert_allclose(
+            coeff.sample(np.array(EVAL_TIMES)),
+            [coeff(t) for t in EVAL_TIMES],
+            atol=1e-12,
+        )
+
+
+def test_single_precision_arrays_are_upcast():
+    pairs = [
+        (op, scale, coeff.astype(np.complex64))
+        for op, scale, coeff in _complex_arrays()
+    ]
+
+    terms = _folded(pairs)
+
+    assert all(coeff.dtype == np.float64 for _, coeff in terms)
+    _assert_same_hamiltonian(terms, _unfolded(pairs))
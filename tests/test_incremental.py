@@ -0,0 +1,91 @@
+import pytest
+
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    TranspilerConfig,
+)
+from AQiPT_transpiler.utils.incremental import IncrementalSchedule
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import extract_qc_data, qc_to_ryd
+
+BACKEND = BackendConfig(simulation_config=SimulationConfig(auto_size=True))
+FIXED_WINDOW = BackendConfig(
+    simulation_config=SimulationConfig(time_simulation=40, sampling=20_000)
+)
+# Indices of the parametrized gates in extract_qc_data(_circuit(...))
+RX_0, CP_01, RY_2, RX_1, CP_12 = 1, 2, 3, 5, 6
+
+
+def _circuit(params):
+    qc = RydbergQuantumCircuit(3)
+    qc.h(0)
+    qc.rx(params[RX_0], 0)
+    qc.cp(params[CP_01], 0, 1)
+    qc.ry(params[RY_2], 2)
+    qc.barrier()
+    qc.rx(params[RX_1], 1)
+    qc.cp(params[CP_12], 1, 2)
+    qc.rz(0.3, 2)
+    return qc
+
+
+PARAMS = {RX_0: 0.4, CP_01: 0.5, RY_2: 1.1, RX_1: 0.3, CP_12: 0.8}
+
+# Same durations, longer and shorter gates, gates after the barrier
+UPDATES = [
+    (RX_0, 0.4),
+    (RX_0, 2.5),
+    (RY_2, 0.1),
+    (CP_01, 3.0),
+    (RX_1, 1.7),
+    (CP_12, 0.05),
+    (RX_0, 0.4),
+]
+
+
+@pytest.mark.parametrize("backend", [BACKEND, FIXED_WINDOW])
+def test_update_gate_matches_full_transpilation(backend, assert_same_schedule):
+    params = dict(PARAMS)
+    incremental = IncrementalSchedule(_circuit(params), backend=backend)
+    assert extract_qc_data(_circuit(params))[4][0] == "barrier"
+
+    for index, value in UPDATES:
+        params[index] = value
+        schedule = incremental.update_gate(index, [value])
+        assert_same_schedule(schedule, qc_to_ryd(_circuit(params), backend=backend))
+
+
+def test_update_gates_matches_full_transpilation(assert_same_schedule):
+    params = dict(PARAMS)
+    incremental = IncrementalSchedule(_circuit(params), backend=BACKEND)
+
+    updates = {CP_12: 2.2, RX_0: 3.0, RY_2: 0.2}
+    params.update(updates)
+    schedule = incremental.update_gates(
+        {index: [value] for index, value in updates.items()}
+    )
+
+    assert_same_schedule(schedule, qc_to_ryd(_circuit(params), backend=BACKEND))
+
+
+@pytest.mark.parametrize("option", ["fuse_single_qubit", "virtual_z", "streaming"])
+def test_update_gate_without_incremental_path(option, assert_same_schedule):
+    backend = BACKEND.model_copy(
+        update={"transpiler_config": TranspilerConfig(**{option: True})}
+    )
+    params = dict(PARAMS)
+    incremental = IncrementalSchedule(_circuit(params), backend=backend)
+    assert not incremental.incremental
+
+    params[RX_0] = 2.5
+    schedule = incremental.update_gate(RX_0, [2.5])
+
+    assert_same_schedule(schedule, qc_to_ryd(_circuit(params), backend=backend))
+
+
+def test_update_barrier_raises():
+    incremental = IncrementalSchedule(_circuit(PARAMS), backend=BACKEND)
+
+    with pytest.raises(ValueError, match="barrier"):
+        incremental.update_gate(4, [])
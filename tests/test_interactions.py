@@ -0,0 +1,133 @@
+import itertools
+
+import numpy as np
+import pytest
+import qutip as qt
+import scipy.sparse as sp
+
+from AQiPT.modules.emulator.AQiPTemulator import (
+    _swapElements,
+    basisIndex,
+    eliminate_duplicates,
+    generate_combinations,
+    spectatorIndices,
+)
+from AQiPT_transpiler.Transpiler import Transpiler
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+
+C6 = -149.22565104551518
+C3_NEAREST = -6243.915399009714
+C3_NEXT = -2207.5574598974376
+
+# Non-zero entries of the interaction operator (_Vint) built with qt.tensor
+# and generate_combinations before the operators were indexed
+OLD_VINT = {
+    2: {
+        (10, 10): C6,
+        (11, 14): C3_NEAREST,
+        (14, 11): C3_NEAREST,
+        (15, 15): C6,
+    },
+    3: {
+        (11, 14): C3_NEXT,
+        (14, 11): C3_NEXT,
+        (27, 30): C3_NEXT,
+        (30, 27): C3_NEXT,
+        (35, 50): C3_NEAREST,
+        (38, 38): C6,
+        (39, 54): C3_NEAREST,
+        (41, 41): C6,
+        (43, 46): C3_NEXT,
+        (43, 58): C3_NEAREST,
+        (44, 56): C3_NEAREST,
+        (45, 57): C3_NEAREST,
+        (46, 43): C3_NEXT,
+        (46, 58): C3_NEAREST,
+        (47, 59): C3_NEAREST,
+        (47, 62): C3_NEAREST,
+        (50, 35): C3_NEAREST,
+        (54, 39): C3_NEAREST,
+        (55, 55): C6,
+        (56, 44): C3_NEAREST,
+        (57, 45): C3_NEAREST,
+        (58, 43): C3_NEAREST,
+        (58, 46): C3_NEAREST,
+        (58, 58): C6,
+        (59, 47): C3_NEAREST,
+        (59, 62): C3_NEXT,
+        (61, 61): C6,
+        (62, 47): C3_NEAREST,
+        (62, 59): C3_NEXT,
+        (63, 63): C6,
+    },
+}
+
+
+def _kets(levels, dims):
+    return [qt.basis(d, level) for d, level in zip(dims, levels)]
+
+
+def _operator(rows, cols, size):
+    return sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(size, size)
+    ).toarray()
+
+
+@pytest.mark.parametrize("dims", [[4, 4], [3, 4, 2], [4, 2, 3, 2]])
+def test_basis_index_matches_tensor(dims):
+    for levels in itertools.product(*(range(d) for d in dims)):
+        ket = qt.tensor(_kets(levels, dims)).full().ravel()
+        assert np.flatnonzero(ket).tolist() == [basisIndex(levels, dims)]
+
+
+@pytest.mark.parametrize(
+    "dims, levels, i, j",
+    [
+        ([4, 4, 4], [2, 3, 0], 0, 1),
+        ([4, 4, 4], [0, 2, 3], 1, 2),
+        ([3, 4, 2], [2, 0, 1], 0, 2),
+        ([4, 2, 3, 2], [3, 1, 0, 1], 1, 3),
+    ],
+)
+def test_dipole_operator_matches_combinations(dims, levels, i, j):
+    size = int(np.prod(dims))
+    levels_swap = _swapElements(list(levels), i, j)
+    dims_swap = _swapElements(list(dims), i, j)
+
+    # Old construction: sum of |psi><psi_swap| over the levels of the spectators
+    kets = [[qt.basis(d, level) for level in range(d)] for d in dims]
+    combinations = eliminate_duplicates(
+        generate_combinations(_kets(levels, dims), i, j, kets)
+    )
+    expected = 0
+    for combination in combinations:
+        swapped = _swapElements(list(combination), j, i)
+        expected += qt.tensor(combination) * qt.tensor(swapped).dag()
+    expected = expected.full().reshape(size, size)
+
+    rows = spectatorIndices(levels, dims, (i, j))
+    cols = spectatorIndices(levels_swap, dims_swap, (i, j))
+
+    np.testing.assert_array_equal(_operator(rows, cols, size), expected)
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3])
+def test_interaction_operator_matches_old_construction(num_qubits):
+    qc = RydbergQuantumCircuit(num_qubits)
+    qc.h(0)
+    for q in range(num_qubits - 1):
+        qc.cp(0.5, q, q + 1)
+    simulation_config = SimulationConfig(auto_size=True, samples_per_pulse=50)
+    transpiler = Transpiler(
+        backend_config=BackendConfig(simulation_config=simulation_config)
+    )
+    transpiler.transpile(qc)
+
+    register = transpiler.build_transpiled_circuit("0" * num_qubits)
+    V = register.atomic_register._Vint.full()
+
+    expected = np.zeros_like(V)
+    for (row, col), value in OLD_VINT[num_qubits].items():
+        expected[row, col] = value
+    np.testing.assert_allclose(V, expected, rtol=1e-12, atol=0)
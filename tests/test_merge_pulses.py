@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import (
+    PulseSegment,
+    sample_segments,
+)
+from AQiPT_transpiler.utils.schedules_utils import merge_pulses
+
+TIMES = np.linspace(0, 1, 101)
+
+
+def test_segments_are_concatenated_per_channel():
+    a = [PulseSegment(0.1, 0.2, "square", 1.0)]
+    b = [PulseSegment(0.3, 0.4, "gaussian", 2.0)]
+    c = [PulseSegment(0.5, 0.6, "square", 3.0)]
+    merged = merge_pulses(
+        {"x": [[0, 1], 1, a], "y": [[1, 2], 1, b], "z": [[0, 1], 1, c]}, "Coupling"
+    )
+
+    assert list(merged) == ["Coupling0", "Coupling1"]
+    assert merged["Coupling0"] == [[0, 1], 1, a + c]
+    assert merged["Coupling1"] == [[1, 2], 1, b]
+
+
+def test_segments_mixed_with_arrays_are_sampled():
+    waveform = np.sin(2 * np.pi * TIMES)
+    segments = [PulseSegment(0.2, 0.5, "square", 2.0, 0.3)]
+    merged = merge_pulses(
+        {
+            "a": [[0, 1], 1, waveform],
+            "b": [[0, 1], 1, segments],
+            "c": [[0, 1], 1, []],
+        },
+        "Coupling",
+        TIMES,
+    )
+
+    expected = waveform + sample_segments(segments, TIMES)
+    np.testing.assert_allclose(merged["Coupling0"][2], expected)
+
+
+def test_segments_mixed_with_arrays_need_the_timebase():
+    pulses = {
+        "a": [[0, 1], 1, np.ones(len(TIMES))],
+        "b": [[0, 1], 1, [PulseSegment(0.2, 0.5, "square", 2.0)]],
+    }
+    with pytest.raises(ValueError, match="mixes segments and sampled arrays"):
+        merge_pulses(pulses, "Coupling")
+    with pytest.raises(ValueError, match="mixes segments and sampled arrays"):
+        merge_pulses(pulses, "Coupling", TIMES[:-1])
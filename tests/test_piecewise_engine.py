@@ -0,0 +1,75 @@
+import numpy as np
+import qutip as qt
+
+from AQiPT.modules.emulator import AQiPTemulator as emulator
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import (
+    PulseSegment,
+    SegmentCoefficient,
+)
+
+TIMES = np.linspace(0, 1, 201)
+
+
+def _hamiltonian(shape="square"):
+    # Square pulses with edges between the samples of TIMES
+    coupling = SegmentCoefficient(
+        [
+            PulseSegment(0.1013, 0.4021, shape, 2 * np.pi * 1.3, 0.4),
+            PulseSegment(0.5507, 0.8539, shape, 2 * np.pi * 0.8),
+        ]
+    )
+    detuning = SegmentCoefficient([PulseSegment(0.3, 0.7177, shape, 2 * np.pi * 0.5)])
+    op = qt.basis(3, 0) * qt.basis(3, 1).dag()
+    return [
+        0.3 * qt.num(3),
+        [op, coupling],
+        [op.dag(), emulator.conjugateCoefficient(coupling)],
+        [qt.basis(3, 1) * qt.basis(3, 1).dag(), detuning],
+    ]
+
+
+def _options():
+    return qt.Options(
+        atol=1e-12, rtol=1e-10, nsteps=10**6, max_step=1e-4, store_states=True
+    )
+
+
+def test_piecewise_matches_sesolve_on_square_schedule():
+    H = _hamiltonian()
+    psi0 = qt.basis(3, 0)
+    mops = [qt.basis(3, k) * qt.basis(3, k).dag() for k in range(3)]
+
+    piecewise, _ = emulator.solveDynamics(
+        H, psi0, TIMES, mops=mops, options=_options(), solver="AQiPT-piecewise"
+    )
+    reference, _ = emulator.solveDynamics(
+        H, psi0, TIMES, mops=mops, options=_options(), solver="QuTiP-SE"
+    )
+
+    np.testing.assert_allclose(piecewise.expect, reference.expect, atol=1e-6)
+    overlap = abs(piecewise.states[-1].overlap(reference.states[-1]))
+    assert abs(overlap - 1) < 1e-6
+
+
+def test_auto_uses_piecewise_only_for_closed_form_square_pulses():
+    psi0 = qt.basis(3, 0)
+
+    engine, _ = emulator.solverStrategy([], psi0, "auto", _hamiltonian(), TIMES)
+    assert engine == "piecewise"
+
+    engine, _ = emulator.solverStrategy(
+        [], psi0, "auto", _hamiltonian("gaussian"), TIMES
+    )
+    assert engine == "sesolve"
+
+    # Sampled arrays are interpolated by QuTiP unless piecewise=True is given
+    sampled = [
+        term if isinstance(term, qt.Qobj) else [term[0], term[1].sample(TIMES)]
+        for term in _hamiltonian()
+    ]
+    engine, _ = emulator.solverStrategy([], psi0, "auto", sampled, TIMES)
+    assert engine == "sesolve"
+    engine, _ = emulator.solverStrategy(
+        [], psi0, "auto", sampled, TIMES, piecewise=True
+    )
+    assert engine == "piecewise"
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.utils.plotting import minmax_decimate, minmax_indices
+
+PIXELS = 100
+
+
+def _signals():
+    rng = np.random.default_rng(0)
+    times = np.linspace(0, 1, 12_345)
+    yield rng.normal(size=12_345)
+    # Narrow spikes that plain striding would drop
+    spikes = np.zeros(12_345)
+    spikes[[17, 5_001, 12_300]] = [3.0, -2.0, 5.0]
+    yield spikes
+    yield np.sin(2 * np.pi * 40 * times) * np.exp(-times)
+    # Multiple of PIXELS (no tail) and extremes at the ends
+    yield np.linspace(-1, 1, 10 * PIXELS)
+
+
+@pytest.mark.parametrize(
+    "values", list(_signals()), ids=["noise", "spikes", "chirp", "ramp"]
+)
+def test_minmax_indices_keep_envelope(values):
+    indices = minmax_indices(values, PIXELS)
+
+    assert np.all(np.diff(indices) > 0)
+    assert indices[0] == 0 and indices[-1] == len(values) - 1
+    assert values[indices].max() == values.max()
+    assert values[indices].min() == values.min()
+    # Min and max of each column, plus the first and last samples
+    assert PIXELS <= len(indices) <= 2 * PIXELS + 2
+
+
+@pytest.mark.parametrize("n", [1, 2 * PIXELS - 1, 2 * PIXELS])
+def test_minmax_indices_short_curves_unchanged(n):
+    np.testing.assert_array_equal(minmax_indices(np.ones(n), PIXELS), np.arange(n))
+
+
+def test_minmax_decimate():
+    times = np.linspace(0, 1, 5_000)
+    values = np.cos(30 * times)
+
+    decimated_times, decimated_values = minmax_decimate(times, values, PIXELS)
+    indices = minmax_indices(values, PIXELS)
+
+    np.testing.assert_array_equal(decimated_times, times[indices])
+    np.testing.assert_array_equal(decimated_values, values[indices])
+    full_times, full_values = minmax_decimate(times, values, None)
+    np.testing.assert_array_equal(full_values, values)
@@ -0,0 +1,46 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+
+
+def _schedule(precision):
+    qc = RydbergQuantumCircuit(1)
+    qc.h(0)
+    qc.rx(0.7, 0)
+    qc.ry(0.3, 0)
+    simulation_config = SimulationConfig(
+        time_simulation=0.2,
+        sampling=200_001,
+        precision=precision,
+        analytic_coefficients=False,
+    )
+    backend = BackendConfig(simulation_config=simulation_config)
+    return qc_to_ryd(qc, backend=backend).schedules[0]
+
+
+def test_single_precision_pulses_are_stored():
+    single = _schedule("single")
+    double = _schedule("double")
+
+    for funct_type in ("coupling", "detuning"):
+        stored = single.sampled_pulses(funct_type)
+        expected = double.sampled_pulses(funct_type)
+        for key, (_, _, pulse) in stored.items():
+            assert pulse.dtype in (np.float32, np.complex64)
+            # The same arrays are returned, they are not sampled again
+            assert single.sampled_pulses(funct_type)[key][2] is pulse
+            np.testing.assert_allclose(pulse, expected[key][2], rtol=0, atol=1e-5)
+
+
+def test_single_precision_with_analytic_coefficients_warns():
+    with pytest.warns(UserWarning, match="single"):
+        SimulationConfig(precision="single", analytic_coefficients=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        SimulationConfig(precision="single")
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from AQiPT_transpiler.Transpiler import Transpiler
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    TranspilerConfig,
+)
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+
+STAT_FIELDS = {"calls", "time", "allocated_bytes", "pulses", "array_bytes"}
+STAGES = {
+    "extract_qc_data",
+    "virtual_z",
+    "fuse_single_qubit_gates",
+    "rule:uxy",
+    "rule:cp",
+    "construct_register_schedule",
+    "RydbergRegisterSchedule",
+}
+
+
+def _profile(streaming):
+    qc = RydbergQuantumCircuit(2)
+    qc.h(0)
+    qc.rz(0.4, 0)
+    qc.rx(0.3, 1)
+    qc.cp(0.5, 0, 1)
+    qc.ry(0.2, 1)
+    transpiler_config = TranspilerConfig(
+        profile=True, streaming=streaming, virtual_z=True, fuse_single_qubit=True
+    )
+    backend = BackendConfig(
+        simulation_config=SimulationConfig(auto_size=True),
+        transpiler_config=transpiler_config,
+    )
+    transpiler = Transpiler(backend_config=backend)
+    transpiler.transpile(qc)
+    return transpiler.profile
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_profile_stages(streaming):
+    profile = _profile(streaming)
+
+    assert STAGES <= set(profile.stages)
+    for name in ("extract_qc_data", "virtual_z", "fuse_single_qubit_gates"):
+        stats = profile.stages[name]
+        assert stats.calls == 1
+        assert 0 <= stats.time <= profile.total_time
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_profile_json_schema(streaming):
+    data = json.loads(_profile(streaming).to_json())
+
+    assert set(data) == {"total_time", "stages"}
+    assert isinstance(data["total_time"], float)
+    for stats in data["stages"].values():
+        assert set(stats) == STAT_FIELDS
+        assert isinstance(stats["calls"], int)
+        assert isinstance(stats["time"], float)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.gate_schedules.uxy_schedule import UxySchedule
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import sample_segments
+
+BACKEND = BackendConfig(
+    simulation_config=SimulationConfig(time_simulation=4, sampling=2000)
+)
+
+
+def _schedules():
+    first = UxySchedule(theta=np.pi / 2, t_start=0.5, backend=BACKEND)
+    second = UxySchedule(theta=np.pi, phi=0.4, t_start=2, backend=BACKEND)
+    return first.q_schedule, second.q_schedule
+
+
+def _coupling(schedule):
+    return schedule.coupling_pulses["Coupling0"][2]
+
+
+def _expected(first, second):
+    return (
+        first.sampled_pulses()["Coupling0"][2] + second.sampled_pulses()["Coupling0"][2]
+    )
+
+
+def test_add_segments_to_segments():
+    first, second = _schedules()
+    segments = _coupling(first)
+    expected = _expected(first, second)
+
+    first.add_function(_coupling(second), "Coupling0")
+
+    assert _coupling(first) == segments + _coupling(second)
+    # The stored list is replaced, not extended in place
+    assert len(segments) == 1
+    np.testing.assert_allclose(first.sampled_pulses()["Coupling0"][2], expected)
+
+
+def test_add_array_to_segments():
+    first, second = _schedules()
+    expected = _expected(first, second)
+
+    first.add_function(second.sampled_pulses()["Coupling0"][2], "Coupling0")
+
+    assert isinstance(_coupling(first), np.ndarray)
+    np.testing.assert_allclose(first.sampled_pulses()["Coupling0"][2], expected)
+
+
+def test_add_segments_to_array():
+    first, second = _schedules()
+    expected = _expected(first, second)
+    first.coupling_pulses["Coupling0"][2] = sample_segments(
+        _coupling(first), first.times
+    )
+
+    first.add_function(_coupling(second), "Coupling0")
+
+    assert isinstance(_coupling(first), np.ndarray)
+    np.testing.assert_allclose(first.sampled_pulses()["Coupling0"][2], expected)
+
+
+def test_add_array_of_another_timebase_raises():
+    first, _ = _schedules()
+
+    with pytest.raises(ValueError, match="mixes segments and sampled arrays"):
+        first.add_function(np.ones(10), "Coupling0")
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    TranspilerConfig,
+)
+from AQiPT_transpiler.rydberg_blocks.rydberg_schedules import RydbergRegisterSchedule
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _register_schedule():
+    qc = RydbergQuantumCircuit(2)
+    qc.h(0)
+    qc.rz(0.7, 0)
+    qc.cp(0.5, 0, 1)
+    qc.rx(0.3, 1)
+    backend = BackendConfig(
+        simulation_config=SimulationConfig(auto_size=True),
+        transpiler_config=TranspilerConfig(scheduling="asap", virtual_z=True),
+    )
+    register_schedule = qc_to_ryd(qc, backend=backend)
+
+    # A waveform channel next to the segment channels
+    schedule = register_schedule.schedules[1]
+    waveform = np.sin(schedule.times) * np.exp(1j * schedule.times)
+    schedule.add_function(waveform, "Coupling0")
+    return register_schedule
+
+
+def _fields(segment):
+    return tuple(getattr(segment, name) for name in segment.__slots__)
+
+
+def _assert_same_pulses(loaded, expected):
+    for q_loaded, q_expected in zip(loaded.schedules, expected.schedules):
+        for funct_type in ("coupling", "detuning"):
+            pulses = q_loaded.sampled_pulses(funct_type)
+            expected_pulses = q_expected.sampled_pulses(funct_type)
+            assert pulses.keys() == expected_pulses.keys()
+            for key, (pair, omega, pulse) in expected_pulses.items():
+                assert list(pulses[key][0]) == list(pair)
+                assert pulses[key][1] == omega
+                np.testing.assert_array_equal(pulses[key][2], pulse)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_round_trip(tmp_path, compress, mmap):
+    register_schedule = _register_schedule()
+    assert register_schedule.scheduling_report is not None
+    assert register_schedule.virtual_z_frame is not None
+    path = str(tmp_path / "schedule.npz")
+
+    register_schedule.save(path, compress=compress)
+    loaded = RydbergRegisterSchedule.load(path, mmap=mmap)
+
+    assert loaded.backend_config == register_schedule.backend_config
+    assert loaded.scheduling_report == register_schedule.scheduling_report
+    assert loaded.virtual_z_frame == pytest.approx(register_schedule.virtual_z_frame)
+    _assert_same_pulses(loaded, register_schedule)
+
+    segments = loaded.schedules[0].coupling_pulses["Coupling0"][2]
+    expected = register_schedule.schedules[0].coupling_pulses["Coupling0"][2]
+    assert [_fields(seg) for seg in segments] == [_fields(seg) for seg in expected]
+    waveform = loaded.schedules[1].coupling_pulses["Coupling0"][2]
+    # Compressed files fall back to loading the waveforms
+    assert isinstance(waveform, np.memmap) == (mmap and not compress)
+
+
+def test_loading_does_not_import_plotting_or_qiskit(tmp_path):
+    path = str(tmp_path / "schedule.npz")
+    _register_schedule().save(path)
+
+    code = (
+        "import sys\n"
+        "from AQiPT_transpiler.rydberg_blocks.rydberg_schedules import "
+        "RydbergRegisterSchedule\n"
+        f"schedule = RydbergRegisterSchedule.load({path!r}, mmap=True)\n"
+        "schedule.schedules[0].sampled_pulses()\n"
+        "print(sorted(m for m in ('matplotlib', 'qiskit') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
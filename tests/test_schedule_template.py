@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from qiskit.circuit import Parameter
+
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    TranspilerConfig,
+)
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import (
+    RydbergScheduleTemplate,
+    qc_to_ryd,
+)
+
+BACKEND = BackendConfig(simulation_config=SimulationConfig(auto_size=True))
+
+
+def _circuit(theta, phi):
+    qc = RydbergQuantumCircuit(3)
+    qc.h(0)
+    qc.rx(theta, 0)
+    qc.cp(0.5, 0, 1)
+    qc.ry(phi, 2)
+    qc.rx(0.3, 1)
+    qc.cp(theta, 1, 2)
+    qc.h(2)
+    return qc
+
+
+def test_bind_matches_full_transpilation(assert_same_schedule):
+    theta, phi = Parameter("theta"), Parameter("phi")
+    template = RydbergScheduleTemplate(_circuit(theta, phi), backend=BACKEND)
+
+    # Same durations, longer and shorter gates: with and without re-timing
+    for values in ([0.4, 1.1], [0.4, 2.0], [2.5, 0.2], [0.1, 0.2], [0.4, 1.1]):
+        schedule = template.bind(dict(zip((theta, phi), values)))
+        expected = qc_to_ryd(_circuit(*values), backend=BACKEND)
+        assert_same_schedule(schedule, expected)
+
+
+def test_bind_batch_matches_bind(assert_same_schedule):
+    theta, phi = Parameter("theta"), Parameter("phi")
+    template = RydbergScheduleTemplate(_circuit(theta, phi), backend=BACKEND)
+    # Rows follow the order of template.parameters
+    values = np.array([[0.4, 1.1], [1.3, 0.7], [0.2, 2.9]])
+
+    for schedule, row in zip(template.bind_batch(values), values):
+        bound = dict(zip(template.parameters, row))
+        expected = qc_to_ryd(_circuit(bound[theta], bound[phi]), backend=BACKEND)
+        assert_same_schedule(schedule, expected)
+
+
+@pytest.mark.parametrize("scheduling", ["greedy", "asap", "alap"])
+def test_bind_keeps_barriers(scheduling, assert_same_schedule):
+    backend = BACKEND.model_copy(
+        update={"transpiler_config": TranspilerConfig(scheduling=scheduling)}
+    )
+    a = Parameter("a")
+    qc = RydbergQuantumCircuit(2)
+    qc.rx(a, 0)
+    qc.rx(2.5, 0)
+    qc.barrier()
+    qc.rx(0.3, 1)
+    template = RydbergScheduleTemplate(qc, backend=backend)
+
+    for value in (0.4, 1.9):
+        schedule = template.bind({a: value})
+        expected = qc_to_ryd(qc.assign_parameters({a: value}), backend=backend)
+        assert_same_schedule(schedule, expected)
+        assert schedule.scheduling_report == expected.scheduling_report
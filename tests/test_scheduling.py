@@ -0,0 +1,93 @@
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, TranspilerConfig
+from AQiPT_transpiler.gate_schedules.gate_cache import PlacedQubitSchedule
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.scheduling import GateRecord, reschedule
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+
+# (name, qubits, rule t_start, rule t_end); the rules ignore the barrier and
+# make 'c' wait for the whole register, like 'h' and 'cp' do
+GATES = [
+    ("a", [0], 0.0, 1.0),
+    ("b", [0], 1.0, 3.0),
+    ("c", [1], 3.0, 3.5),
+    ("barrier", [0, 1], None, None),
+    ("d", [1], 3.5, 4.0),
+    ("e", [0], 3.0, 4.0),
+]
+# The barrier waits for 'b' (t=3), 'c' can move before it
+ASAP = {"a": 0.0, "b": 1.0, "c": 0.0, "d": 3.0, "e": 3.0}
+ALAP = {"a": 0.0, "b": 1.0, "c": 2.5, "d": 3.5, "e": 3.0}
+QUBIT_ENDS = {"asap": [4.0, 3.5], "alap": [4.0, 4.0]}
+
+
+def _rescheduled(policy):
+    circuit_schedule = {"0": [[], 4.0], "1": [[], 4.0]}
+    records = []
+    for name, qubits, t_start, t_end in GATES:
+        placements = []
+        if t_start is not None:
+            for q in qubits:
+                placements.append((q, len(circuit_schedule[str(q)][0])))
+                circuit_schedule[str(q)][0].append(PlacedQubitSchedule(name, t_start))
+        records.append(GateRecord(name, qubits, placements, t_start, t_end))
+
+    report = reschedule(circuit_schedule, records, policy)
+    starts = {
+        placement.q_schedule: placement.offset
+        for qubit_info in circuit_schedule.values()
+        for placement in qubit_info[0]
+    }
+    return report, starts, circuit_schedule
+
+
+@pytest.mark.parametrize("policy, expected", [("asap", ASAP), ("alap", ALAP)])
+def test_start_times(policy, expected):
+    report, starts, circuit_schedule = _rescheduled(policy)
+
+    assert starts == pytest.approx(expected)
+    assert report.duration == pytest.approx(4.0)
+    ends = [qubit_info[1] for qubit_info in circuit_schedule.values()]
+    assert ends == pytest.approx(QUBIT_ENDS[policy])
+    # The rules with the barrier: 'd' and 'e' wait for 'c' (t=3.5)
+    assert report.greedy_duration == pytest.approx(4.5)
+    assert report.saved == pytest.approx(0.5)
+
+
+def test_invalid_policy_raises():
+    with pytest.raises(ValueError, match="scheduling policy"):
+        reschedule({"0": [[], 0]}, [], "fastest")
+
+
+def _report(policy, barrier):
+    qc = RydbergQuantumCircuit(2)
+    qc.rx(0.4, 0)
+    qc.rx(2.5, 0)
+    if barrier:
+        qc.barrier()
+    qc.rx(0.3, 1)
+    backend = BackendConfig(transpiler_config=TranspilerConfig(scheduling=policy))
+    return qc_to_ryd(qc, backend=backend).scheduling_report
+
+
+@pytest.mark.parametrize("policy", ["asap", "alap"])
+@pytest.mark.parametrize("barrier", [False, True])
+def test_saved_is_not_negative(policy, barrier):
+    report = _report(policy, barrier)
+
+    assert report.saved >= 0
+    assert report.saved == round(report.greedy_duration - report.duration, 12)
+
+
+@pytest.mark.parametrize("policy", ["asap", "alap"])
+def test_saved_is_zero_when_nothing_moves(policy):
+    qc = RydbergQuantumCircuit(1)
+    qc.rx(0.4, 0)
+    qc.rx(2.5, 0)
+    transpiler_config = TranspilerConfig(scheduling=policy, t_start=0.01)
+    report = qc_to_ryd(
+        qc, backend=BackendConfig(transpiler_config=transpiler_config)
+    ).scheduling_report
+
+    assert report.saved == 0.0
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.rydberg_blocks.shaped_pulses import (
+    WINDOWED_SUPPORT,
+    GaussianPulse,
+    PulseSegment,
+    ShapedPulse,
+    SquarePulse,
+    sample_segments,
+)
+
+BACKEND = BackendConfig(
+    simulation_config=SimulationConfig(time_simulation=1, sampling=1000)
+)
+
+
+def test_base_pulse_fails_at_construction():
+    with pytest.raises(TypeError, match="abstract"):
+        ShapedPulse(t_start=0, t_end=0.5, backend=BACKEND)
+
+
+@pytest.mark.parametrize("pulse_class", [GaussianPulse, SquarePulse])
+def test_pulse_shapes_are_sampled(pulse_class):
+    pulse = pulse_class(t_start=0.2, t_end=0.6, amp=2, backend=BACKEND)
+
+    assert pulse.function.shape == BACKEND.simulation_config.timebase().shape
+    assert np.max(np.abs(pulse.function)) == pytest.approx(2, rel=1e-2)
+
+
+TIMES = np.linspace(0, 10, 20_001)
+
+
+def _random_segments(rng, shapes, width, with_phase, count=40):
+    segments = []
+    for _ in range(count):
+        t_start = rng.uniform(-0.5, 10)
+        # Some pulses without width or amplitude, which are skipped
+        duration = rng.choice([0.0, rng.uniform(*width)], p=[0.1, 0.9])
+        amp = rng.choice([0.0, rng.uniform(-3, 3)], p=[0.1, 0.9])
+        phase = rng.uniform(-np.pi, np.pi) if with_phase and rng.random() < 0.7 else 0
+        segments.append(
+            PulseSegment(t_start, t_start + duration, rng.choice(shapes), amp, phase)
+        )
+    return segments
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize(
+    "shapes", [["gaussian"], ["square"], ["gaussian", "square"]], ids="-".join
+)
+# Narrow supports are concatenated, wide ones are written window by window
+@pytest.mark.parametrize("width", [(0.002, 0.02), (0.5, 3.0)], ids=["narrow", "wide"])
+@pytest.mark.parametrize("with_phase", [False, True])
+def test_batched_sampling_matches_per_pulse(seed, shapes, width, with_phase):
+    rng = np.random.default_rng(seed)
+    segments = _random_segments(rng, shapes, width, with_phase)
+    dt = TIMES[1] - TIMES[0]
+    assert (width[1] / dt < WINDOWED_SUPPORT) or (width[0] / dt > WINDOWED_SUPPORT)
+
+    batched = sample_segments(segments, TIMES, batched=True)
+    expected = sample_segments(segments, TIMES, batched=False)
+
+    assert batched.dtype == expected.dtype
+    if shapes == ["square"]:
+        # Same sums in the same order, and exp(-i phase) is computed once per pulse
+        np.testing.assert_array_equal(batched, expected)
+    else:
+        np.testing.assert_allclose(batched, expected, rtol=0, atol=1e-12)
@@ -0,0 +1,35 @@
+import warnings
+
+import pytest
+
+from AQiPT_transpiler.Transpiler import Transpiler
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+
+
+def _sized(**simulation_kwargs):
+    qc = RydbergQuantumCircuit(1)
+    qc.h(0)
+    qc.rx(1e-7, 0)
+    qc.rx(1.0, 0)
+    backend = BackendConfig(
+        simulation_config=SimulationConfig(auto_size=True, **simulation_kwargs)
+    )
+    schedule = Transpiler(backend_config=backend).transpile(qc)
+    return schedule.backend_config.simulation_config
+
+
+def test_near_zero_rotation_does_not_set_sampling():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        config = _sized()
+
+    # Sized by the rx(1.0) pulse, the rx(1e-7) one would need ~3e9 samples
+    assert config.sampling < 10000
+
+
+def test_sampling_is_clamped_to_max_sampling():
+    with pytest.warns(UserWarning, match="max_sampling"):
+        config = _sized(min_pulse_width=0.0, max_sampling=5000)
+
+    assert config.sampling == 5000
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+import qutip as qt
+
+from AQiPT.modules.emulator import AQiPTemulator as emulator
+
+TIMES = np.linspace(0, 1, 101)
+
+
+def _hamiltonian():
+    # Sampled Gaussian coupling: 'auto' never propagates it piecewise
+    pulse = 2 * np.pi * np.exp(-((TIMES - 0.5) ** 2) / (2 * 0.15**2))
+    op = qt.basis(2, 0) * qt.basis(2, 1).dag()
+    return [0.5 * qt.sigmaz(), [op, pulse], [op.dag(), pulse]]
+
+
+def _options():
+    return qt.Options(atol=1e-10, rtol=1e-8, store_states=True)
+
+
+def _reference(psi0=qt.basis(2, 0)):
+    return qt.sesolve(_hamiltonian(), psi0, TIMES, options=_options())
+
+
+def test_auto_with_zero_rate_collapse_operator_uses_sesolve():
+    cops = [0.0 * qt.destroy(2)]
+
+    engine, _ = emulator.solverStrategy(
+        cops, qt.basis(2, 0), "auto", _hamiltonian(), TIMES
+    )
+    result, propagators = emulator.solveDynamics(
+        _hamiltonian(), qt.basis(2, 0), TIMES, cops=cops, options=_options()
+    )
+
+    assert engine == "sesolve"
+    assert propagators is None
+    assert result.states[-1].isket
+    assert abs(result.states[-1].overlap(_reference().states[-1])) == pytest.approx(1)
+
+
+def test_auto_with_mixed_state_uses_mesolve():
+    mixed = 0.5 * qt.qeye(2)
+
+    engine, reason = emulator.solverStrategy([], mixed, "auto", _hamiltonian(), TIMES)
+
+    assert engine == "mesolve"
+    assert "mixed" in reason
+
+
+def test_auto_with_dissipation_uses_mesolve():
+    engine, _ = emulator.solverStrategy(
+        [0.1 * qt.destroy(2)], qt.basis(2, 0), "auto", _hamiltonian(), TIMES
+    )
+
+    assert engine == "mesolve"
+
+
+@pytest.mark.parametrize("solver", ["QuTiP-propagator", "QuTiP-SE"])
+def test_unitary_solvers_reject_dissipation(solver):
+    with pytest.raises(ValueError, match="collapse operator"):
+        emulator.solveDynamics(
+            _hamiltonian(),
+            qt.basis(2, 0),
+            TIMES,
+            cops=[0.1 * qt.destroy(2)],
+            solver=solver,
+        )
+
+
+def test_unknown_solver_raises():
+    with pytest.raises(ValueError, match="Unknown solver"):
+        emulator.solverStrategy([], qt.basis(2, 0), "QuTiP-MC")
+
+
+def test_propagator_states_match_sesolve():
+    mops = [qt.sigmaz()]
+    result, propagators = emulator.solveDynamics(
+        _hamiltonian(),
+        qt.basis(2, 0),
+        TIMES,
+        mops=mops,
+        options=_options(),
+        solver="QuTiP-propagator",
+    )
+    reference = qt.sesolve(
+        _hamiltonian(), qt.basis(2, 0), TIMES, e_ops=mops, options=_options()
+    )
+
+    assert len(propagators) == len(TIMES)
+    for U in (propagators[0], propagators[-1]):
+        np.testing.assert_allclose((U.dag() * U).full(), np.eye(2), atol=1e-7)
+    np.testing.assert_allclose(result.expect[0], reference.expect[0], atol=1e-6)
+    for state, expected in zip(result.states, reference.states):
+        assert abs(state.overlap(expected)) == pytest.approx(1, abs=1e-7)
+
+
+@pytest.mark.parametrize("solver", ["auto", "QuTiP-SE", "QuTiP-propagator"])
+def test_density_matrix_state_gives_density_matrices(solver):
+    rho0 = qt.ket2dm(qt.basis(2, 0))
+
+    result, _ = emulator.solveDynamics(
+        _hamiltonian(), rho0, TIMES, options=_options(), solver=solver
+    )
+
+    expected = qt.ket2dm(_reference().states[-1])
+    assert all(state.isoper for state in result.states)
+    np.testing.assert_allclose(result.states[-1].full(), expected.full(), atol=1e-6)
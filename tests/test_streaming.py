@@ -0,0 +1,59 @@
+import pytest
+
+from AQiPT_transpiler.config.core import (
+    BackendConfig,
+    SimulationConfig,
+    TranspilerConfig,
+)
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+
+AUTO_SIZE = SimulationConfig(auto_size=True)
+FIXED_WINDOW = SimulationConfig(time_simulation=40, sampling=20_000)
+
+
+def _circuit():
+    qc = RydbergQuantumCircuit(3)
+    qc.h(0)
+    qc.rx(0.4, 0)
+    qc.cp(0.5, 0, 1)
+    qc.ry(1.1, 2)
+    qc.barrier()
+    qc.cx(1, 2)
+    qc.rz(0.3, 2)
+    qc.cz(0, 2)
+    qc.x(1)
+    return qc
+
+
+@pytest.mark.parametrize("simulation_config", [AUTO_SIZE, FIXED_WINDOW])
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"virtual_z": True}, {"fuse_single_qubit": True}, {"shape": "gaussian"}],
+)
+def test_streaming_matches_full_schedule(
+    simulation_config, options, assert_same_schedule
+):
+    def transpile(streaming):
+        config = TranspilerConfig(streaming=streaming, **options)
+        backend = BackendConfig(
+            simulation_config=simulation_config, transpiler_config=config
+        )
+        return qc_to_ryd(_circuit(), backend=backend)
+
+    schedule = transpile(True)
+    expected = transpile(False)
+    # The streaming flag is the only difference between the two configs
+    expected.backend_config = expected.backend_config.model_copy(
+        update={"transpiler_config": schedule.backend_config.transpiler_config}
+    )
+
+    assert_same_schedule(schedule, expected)
+
+
+@pytest.mark.parametrize("scheduling", ["asap", "alap"])
+def test_streaming_rescheduling_raises(scheduling):
+    config = TranspilerConfig(streaming=True, scheduling=scheduling)
+
+    with pytest.raises(ValueError, match="not available with streaming"):
+        qc_to_ryd(_circuit(), backend=BackendConfig(transpiler_config=config))
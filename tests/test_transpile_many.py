@@ -0,0 +1,99 @@
+import pytest
+from qiskit.circuit import Parameter
+
+from AQiPT_transpiler.config.core import BackendConfig, TranspilerConfig
+from AQiPT_transpiler.Transpiler import Transpiler
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import (
+    RydbergScheduleTemplate,
+    qc_to_ryd,
+)
+
+BACKEND = BackendConfig(transpiler_config=TranspilerConfig(scheduling="asap"))
+THETA = Parameter("theta")
+
+
+def _circuit(depth, num_qubits=2):
+    qc = RydbergQuantumCircuit(num_qubits)
+    for layer in range(depth):
+        qc.rx(0.1 + 0.2 * layer, 0)
+        qc.cp(0.3 + 0.1 * layer, 0, num_qubits - 1)
+        qc.ry(0.5, num_qubits - 1)
+    return qc
+
+
+def _parametrized():
+    qc = RydbergQuantumCircuit(2)
+    qc.rx(THETA, 0)
+    qc.barrier()
+    qc.cp(2 * THETA, 0, 1)
+    return qc
+
+
+def _circuits():
+    # Longer circuits first, so the pool finishes them out of order
+    return [_circuit(8, 3), _circuit(1), _parametrized(), _circuit(4), _circuit(2, 3)]
+
+
+def _assert_same_result(schedule, expected, assert_same_schedule):
+    if isinstance(expected, RydbergScheduleTemplate):
+        assert isinstance(schedule, RydbergScheduleTemplate)
+        assert_same_schedule(schedule.bind({THETA: 0.7}), expected.bind({THETA: 0.7}))
+    else:
+        assert_same_schedule(schedule, expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transpile_many_keeps_circuit_order(workers, assert_same_schedule):
+    circuits = _circuits()
+
+    results = Transpiler(backend_config=BACKEND).transpile_many(circuits, workers)
+
+    assert [result.index for result in results] == list(range(len(circuits)))
+    for result, qc in zip(results, circuits):
+        if qc.parameters:
+            assert isinstance(result.schedule, RydbergScheduleTemplate)
+            assert_same_schedule(
+                result.schedule.bind({THETA: 0.7}),
+                qc_to_ryd(qc.assign_parameters({THETA: 0.7}), backend=BACKEND),
+            )
+        else:
+            assert_same_schedule(result.schedule, qc_to_ryd(qc, backend=BACKEND))
+        assert result.transpilation_time >= 0
+        assert result.profile is None
+
+
+def test_transpile_many_workers_match(assert_same_schedule):
+    transpiler = Transpiler(backend_config=BACKEND)
+
+    serial = transpiler.transpile_many(_circuits(), workers=1)
+    parallel = transpiler.transpile_many(_circuits(), workers=3, chunksize=2)
+
+    for result, expected in zip(parallel, serial):
+        assert result.index == expected.index
+        _assert_same_result(result.schedule, expected.schedule, assert_same_schedule)
+
+
+def test_transpile_many_iter_yields_every_index():
+    transpiler = Transpiler(backend_config=BACKEND)
+
+    serial = [result.index for result in transpiler.transpile_many_iter(_circuits(), 1)]
+    parallel = [
+        result.index for result in transpiler.transpile_many_iter(_circuits(), 2)
+    ]
+
+    # A single worker runs in this process and keeps the order
+    assert serial == list(range(5))
+    assert sorted(parallel) == list(range(5))
+    assert transpiler.rydberg_schedule is None
+    assert transpiler.transpilation_time is None
+
+
+def test_transpile_many_profiles():
+    config = TranspilerConfig(scheduling="asap", profile=True)
+    transpiler = Transpiler(backend_config=BackendConfig(transpiler_config=config))
+
+    results = transpiler.transpile_many([_circuit(2), _circuit(3)], workers=2)
+
+    assert all(result.profile is not None for result in results)
+    assert all(result.profile.stages for result in results)
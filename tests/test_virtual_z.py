@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, TranspilerConfig
+from AQiPT_transpiler.utils.gate_fusion import (
+    SINGLE_QUBIT_PULSES,
+    uxy_matrix,
+    uxy_pulses_rz,
+)
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+from AQiPT_transpiler.utils.virtual_z import virtual_z
+
+CP_ANGLE = 0.5
+GATES = [
+    ("rz", [0.7], 1, [0]),
+    ("rx", [0.3], 1, [0]),
+    ("z", [], 1, [1]),
+    ("h", [], 1, [1]),
+    ("cp", [CP_ANGLE], 2, [0, 1]),
+    ("ry", [1.1], 1, [0]),
+    ("rz", [-0.4], 1, [1]),
+    ("rx", [0.9], 1, [1]),
+    ("z", [], 1, [0]),
+]
+
+
+def _pulses_matrix(pulses):
+    matrix = np.eye(2, dtype=complex)
+    for theta, phi in pulses:
+        matrix = uxy_matrix(theta, phi) @ matrix
+    return matrix
+
+
+def _unitary(gates):
+    """Register unitary, with the single-qubit gates as their Uxy pulses."""
+    unitary = np.eye(4, dtype=complex)
+    for name, params, _, qubits in gates:
+        if name == "cp":
+            gate = np.diag([1, 1, 1, np.exp(1j * params[0])])
+        else:
+            single = _pulses_matrix(SINGLE_QUBIT_PULSES[name](params))
+            gate = (
+                np.kron(single, np.eye(2))
+                if qubits == [0]
+                else np.kron(np.eye(2), single)
+            )
+        unitary = gate @ unitary
+    return unitary
+
+
+def _circuit():
+    qc = RydbergQuantumCircuit(2)
+    for name, params, _, qubits in GATES:
+        getattr(qc, name)(*params, *qubits)
+    return qc
+
+
+def test_folded_phases_match_explicit_rz_product():
+    framed, frame = virtual_z(GATES, 2)
+
+    assert all(name in ("uxy", "cp") for name, *_ in framed)
+    # The pending frame is the physical Rz the folded circuit still owes
+    owed = np.kron(
+        _pulses_matrix(uxy_pulses_rz(-frame[0])),
+        _pulses_matrix(uxy_pulses_rz(-frame[1])),
+    )
+    np.testing.assert_allclose(owed @ _unitary(framed), _unitary(GATES), atol=1e-12)
+
+
+def test_register_schedule_keeps_final_frame():
+    _, frame = virtual_z(GATES, 2)
+    backend = BackendConfig(transpiler_config=TranspilerConfig(virtual_z=True))
+
+    schedule = qc_to_ryd(_circuit(), backend=backend)
+
+    np.testing.assert_allclose(schedule.virtual_z_frame, frame, atol=1e-12)
+
+
+@pytest.mark.parametrize("scheduling", ["asap", "alap"])
+def test_rescheduled_duration_drops_by_removed_rz(scheduling):
+    def duration(qc, vz):
+        config = TranspilerConfig(scheduling=scheduling, virtual_z=vz)
+        schedule = qc_to_ryd(qc, backend=BackendConfig(transpiler_config=config))
+        return schedule.scheduling_report.duration
+
+    # Rx/Ry are single Uxy pulses, so folding only removes the Rz pulses from the
+    # one wire
+    qc = RydbergQuantumCircuit(1)
+    qc.rx(0.3, 0)
+    qc.rz(0.7, 0)
+    qc.ry(1.1, 0)
+    qc.z(0)
+    qc.rx(0.9, 0)
+    rz_only = RydbergQuantumCircuit(1)
+    rz_only.rz(0.7, 0)
+    z_only = RydbergQuantumCircuit(1)
+    z_only.z(0)
+
+    removed = duration(rz_only, False) + duration(z_only, False)
+    assert duration(qc, False) - duration(qc, True) == pytest.approx(removed, abs=1e-12)
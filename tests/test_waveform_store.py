@@ -0,0 +1,99 @@
+import gc
+import os
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from AQiPT_transpiler.config.core import BackendConfig, SimulationConfig
+from AQiPT_transpiler.gate_schedules.uxy_schedule import UxySchedule
+from AQiPT_transpiler.utils.rydberg_circuit import RydbergQuantumCircuit
+from AQiPT_transpiler.utils.transpiler_utils import qc_to_ryd
+from AQiPT_transpiler.utils.waveform_store import WaveformStore
+
+
+def _files(store):
+    return sorted(os.listdir(store.directory))
+
+
+def test_file_is_removed_with_its_last_view(tmp_path):
+    store = WaveformStore(str(tmp_path))
+    array = np.linspace(0, 1, 1000) * (1 + 1j)
+
+    view = store.write("pulse", array)
+    part = view[10:20]
+    dense = np.asarray(view)
+    np.testing.assert_array_equal(view, array)
+    assert not view.flags.writeable
+    assert len(_files(store)) == 1
+
+    del view, part
+    gc.collect()
+    assert len(_files(store)) == 1
+    np.testing.assert_array_equal(dense, array)
+
+    del dense
+    gc.collect()
+    assert _files(store) == []
+
+    store.cleanup()
+    assert not os.path.exists(store.directory)
+
+
+def _qubit_schedule(memmap, scratch_dir, sampling=4000):
+    simulation_config = SimulationConfig(
+        time_simulation=4, sampling=sampling, memmap=memmap, scratch_dir=scratch_dir
+    )
+    backend = BackendConfig(simulation_config=simulation_config)
+    return UxySchedule(theta=np.pi / 2, t_start=0.5, backend=backend).q_schedule
+
+
+def test_memmap_pulses_match_in_memory(tmp_path):
+    qc = RydbergQuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    schedules = {}
+    for memmap in (False, True):
+        simulation_config = SimulationConfig(
+            auto_size=True, memmap=memmap, scratch_dir=str(tmp_path)
+        )
+        backend = BackendConfig(simulation_config=simulation_config)
+        schedules[memmap] = qc_to_ryd(qc, backend=backend)
+
+    for mapped, expected in zip(schedules[True].schedules, schedules[False].schedules):
+        for funct_type in ("coupling", "detuning"):
+            pulses = mapped.sampled_pulses(funct_type)
+            for key, (_, _, pulse) in expected.sampled_pulses(funct_type).items():
+                assert isinstance(pulses[key][2], np.memmap) or not len(pulse)
+                np.testing.assert_array_equal(pulses[key][2], pulse)
+
+
+def test_add_function_keeps_open_views(tmp_path):
+    schedule = _qubit_schedule(True, str(tmp_path))
+    other = _qubit_schedule(False, None)
+    before = schedule.sampled_pulses()["Coupling0"][2]
+    expected_before = np.array(before)
+
+    schedule.add_function(other.coupling_pulses["Coupling0"][2], "Coupling0")
+
+    np.testing.assert_array_equal(before, expected_before)
+    np.testing.assert_allclose(
+        schedule.sampled_pulses()["Coupling0"][2],
+        expected_before + other.sampled_pulses()["Coupling0"][2],
+    )
+
+
+def test_memmap_sampling_peak_memory(tmp_path):
+    sampling = 2_000_001
+    schedule = _qubit_schedule(True, str(tmp_path), sampling=sampling)
+    window_bytes = sampling * np.dtype(complex).itemsize
+
+    tracemalloc.start()
+    try:
+        pulses = schedule.sampled_pulses()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert isinstance(pulses["Coupling0"][2], np.memmap)
+    assert peak < window_bytes / 8